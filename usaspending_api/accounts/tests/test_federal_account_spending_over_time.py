@@ -124,6 +124,24 @@ def financial_spending_data(db):
     )
 
 
+@pytest.fixture
+def fiscal_year_spending_data(db):
+    tas = mommy.make("TreasuryAppropriationAccount", federal_account=mommy.make("FederalAccount", id=1))
+    for fiscal_year in (2014, 2016, 2016):
+        mommy.make(
+            "AppropriationAccountBalances",
+            reporting_period_start=f"{fiscal_year}-01-01",
+            reporting_period_end=f"{fiscal_year}-06-01",
+            submission__reporting_fiscal_year=fiscal_year,
+            submission__reporting_fiscal_quarter=3,
+            treasury_account_identifier=tas,
+            final_of_fy=True,
+            unobligated_balance_cpe=100,
+            gross_outlay_amount_by_tas_cpe=1000,
+            obligations_incurred_total_by_tas_cpe=10,
+        )
+
+
 specific_payload = {
     "category": "program_activity",
     "filters": {
@@ -197,3 +215,29 @@ def test_federal_account_spending_over_time(client, financial_spending_data):
     assert specific_results[0]["time_period"] == {"fiscal_year": "2014", "quarter": "3"}
     assert specific_results[1]["outlay"] == 3000000
     assert specific_results[1]["time_period"] == {"fiscal_year": "2016", "quarter": "3"}
+
+
+@pytest.mark.django_db
+def test_federal_account_spending_over_time_by_fiscal_year(client, fiscal_year_spending_data):
+    resp = client.post(
+        "/api/v2/federal_accounts/1/spending_over_time",
+        content_type="application/json",
+        data=json.dumps({**fy2016_payload, "group": "fiscal_year"}),
+    )
+    assert resp.status_code == status.HTTP_200_OK
+    assert resp.json()["results"] == [
+        {
+            "outlay": 0,
+            "obligations_incurred_filtered": 0,
+            "obligations_incurred_other": 10,
+            "unobliged_balance": 100,
+            "time_period": {"fiscal_year": "2014"},
+        },
+        {
+            "outlay": 2000,
+            "obligations_incurred_filtered": 20,
+            "obligations_incurred_other": 20,
+            "unobliged_balance": 200,
+            "time_period": {"fiscal_year": "2016"},
+        },
+    ]
@@ -1,7 +1,5 @@
-import ast
-
-from collections import OrderedDict
-from django.db.models import F, Q, Sum, OuterRef, Subquery, Func, DecimalField, Exists
+from django.db.models import F, Q, Sum, OuterRef, Subquery, Func, DecimalField, Exists, Value
+from django.db.models.functions import Coalesce
 from django.utils.dateparse import parse_date
 from fiscalyear import FiscalDateTime
 from rest_framework.response import Response
@@ -117,210 +115,87 @@ class SpendingOverTimeFederalAccountsViewSet(APIView):
 
     @cache_response()
     def post(self, request, pk, format=None):
-        # create response
-        response = {"results": {}}
-
-        # get federal account id from url
         json_request = request.data
         group = json_request.get("group", None)
         filters = json_request.get("filters", None)
-        if filters:
-            filters = federal_account_filter(filters, "treasury_account_identifier__program_balances__")
 
-        nested_order = ""
-        group_results = OrderedDict()  # list of time_period objects ie {"fy": "2017", "quarter": "3"} : 1000
+        quarterly = group != "fy" and group != "fiscal_year"  # quarterly, take months and add them up
+        period_fields = ["submission__reporting_fiscal_year"]
+        if quarterly:
+            period_fields.append("submission__reporting_fiscal_quarter")
 
         financial_account_queryset = AppropriationAccountBalances.final_objects.filter(
-            treasury_account_identifier__federal_account_id=int(pk)
+            treasury_account_identifier__federal_account_id=int(pk), submission__reporting_fiscal_year__isnull=False
         )
-        if group == "fy" or group == "fiscal_year":
-
-            filtered_fa = financial_account_queryset
-            if filters:
-                filtered_fa = filtered_fa.filter(filters)
-            filtered_fa = filtered_fa.annotate(
-                outlay=F("gross_outlay_amount_by_tas_cpe"),
-                obligations_incurred_filtered=F("obligations_incurred_total_by_tas_cpe"),
-            ).values(
-                "appropriation_account_balances_id",
-                "submission__reporting_fiscal_year",
-                "outlay",
-                "obligations_incurred_filtered",
+        filtered_fa = financial_account_queryset
+        if filters:
+            filtered_fa = filtered_fa.filter(
+                federal_account_filter(filters, "treasury_account_identifier__program_balances__")
             )
 
-            unfiltered_fa = financial_account_queryset.annotate(
-                obligations_incurred_other=F("obligations_incurred_total_by_tas_cpe"),
-                unobliged_balance=F("unobligated_balance_cpe"),
-            ).values(
-                "appropriation_account_balances_id",
-                "submission__reporting_fiscal_year",
-                "obligations_incurred_other",
-                "unobliged_balance",
+        # Filtered and unfiltered amounts are summed separately, in one query, since the filters join balances to
+        # their program activity rows and the unfiltered amounts mustn't be multiplied by that join
+        zero = Value(0, output_field=DecimalField())
+        filtered_sums = (
+            filtered_fa.values(*period_fields)
+            .annotate(
+                outlay=Coalesce(Sum("gross_outlay_amount_by_tas_cpe"), zero),
+                obligations_incurred_filtered=Coalesce(Sum("obligations_incurred_total_by_tas_cpe"), zero),
+                obligations_incurred_other=zero,
+                unobliged_balance=zero,
             )
+            .order_by()
+        )
+        unfiltered_sums = (
+            financial_account_queryset.values(*period_fields)
+            .annotate(
+                outlay=zero,
+                obligations_incurred_filtered=zero,
+                obligations_incurred_other=Coalesce(Sum("obligations_incurred_total_by_tas_cpe"), zero),
+                unobliged_balance=Coalesce(Sum("unobligated_balance_cpe"), zero),
+            )
+            .order_by()
+        )
 
-            for trans in filtered_fa:
-                if trans["submission__reporting_fiscal_year"] is None:
-                    continue
-                fy = trans["submission__reporting_fiscal_year"]
-
-                key = {"fiscal_year": str(fy)}
-                key = str(key)
-                if key not in group_results:
-                    group_results[key] = {
-                        "outlay": trans["outlay"] if trans["outlay"] else 0,
-                        "obligations_incurred_filtered": trans["obligations_incurred_filtered"]
-                        if trans["obligations_incurred_filtered"]
-                        else 0,
-                        "obligations_incurred_other": 0,
-                        "unobliged_balance": 0,
-                    }
-                else:
-                    group_results[key] = {
-                        "outlay": group_results[key]["outlay"] + trans["outlay"]
-                        if trans["outlay"]
-                        else group_results[key]["outlay"],
-                        "obligations_incurred_filtered": group_results[key]["obligations_incurred_filtered"]
-                        + trans["obligations_incurred_filtered"]
-                        if trans["obligations_incurred_filtered"]
-                        else group_results[key]["obligations_incurred_filtered"],
-                        "obligations_incurred_other": group_results[key]["obligations_incurred_other"],
-                        "unobliged_balance": group_results[key]["unobliged_balance"],
-                    }
-
-            for trans in unfiltered_fa:
-                if trans["submission__reporting_fiscal_year"] is None:
-                    continue
-                fy = trans["submission__reporting_fiscal_year"]
-                key = {"fiscal_year": str(fy)}
-                key = str(key)
-
-                if key not in group_results:
-                    group_results[key] = {
-                        "outlay": 0,
-                        "obligations_incurred_filtered": 0,
-                        "obligations_incurred_other": trans["obligations_incurred_other"]
-                        if trans["obligations_incurred_other"]
-                        else 0,
-                        "unobliged_balance": trans["unobliged_balance"] if trans["unobliged_balance"] else 0,
-                    }
-                else:
-                    group_results[key] = {
-                        "outlay": group_results[key]["outlay"],
-                        "obligations_incurred_filtered": group_results[key]["obligations_incurred_filtered"],
-                        "obligations_incurred_other": group_results[key]["obligations_incurred_other"]
-                        + trans["obligations_incurred_other"]
-                        if trans["obligations_incurred_other"]
-                        else group_results[key]["obligations_incurred_other"],
-                        "unobliged_balance": group_results[key]["unobliged_balance"] + trans["unobliged_balance"]
-                        if trans["unobliged_balance"]
-                        else group_results[key]["unobliged_balance"],
-                    }
-
-        else:  # quarterly, take months and add them up
-            filtered_fa = financial_account_queryset
-            if filters:
-                filtered_fa = filtered_fa.filter(filters)
-            filtered_fa = filtered_fa.annotate(
-                outlay=F("gross_outlay_amount_by_tas_cpe"),
-                obligations_incurred_filtered=F("obligations_incurred_total_by_tas_cpe"),
-            ).values(
-                "appropriation_account_balances_id",
-                "submission__reporting_fiscal_year",
-                "submission__reporting_fiscal_quarter",
+        # Expected results structure, sorted by time period to meet front-end specs
+        # [{
+        #     "outlay": 200000000,
+        #     "obligations_incurred_filtered": 0,
+        #     "obligations_incurred_other": 0,
+        #     "unobliged_balance": 0,
+        #     "time_period": {"fiscal_year": "2017", "quarter": "3"},
+        # }]
+        group_results = {}
+        for row in filtered_sums.union(unfiltered_sums, all=True):
+            time_period = {"fiscal_year": str(row["submission__reporting_fiscal_year"])}
+            if quarterly:
+                time_period["quarter"] = str(row["submission__reporting_fiscal_quarter"])
+            result = group_results.setdefault(
+                tuple(time_period.values()),
+                {
+                    "outlay": 0,
+                    "obligations_incurred_filtered": 0,
+                    "obligations_incurred_other": 0,
+                    "unobliged_balance": 0,
+                    "time_period": time_period,
+                },
+            )
+            for amount in (
                 "outlay",
                 "obligations_incurred_filtered",
-            )
-
-            unfiltered_fa = financial_account_queryset.annotate(
-                obligations_incurred_other=F("obligations_incurred_total_by_tas_cpe"),
-                unobliged_balance=F("unobligated_balance_cpe"),
-            ).values(
-                "appropriation_account_balances_id",
-                "submission__reporting_fiscal_year",
-                "submission__reporting_fiscal_quarter",
                 "obligations_incurred_other",
                 "unobliged_balance",
-            )
-            for trans in filtered_fa:
-                if trans["submission__reporting_fiscal_year"] is None:
-                    continue
-                fy = trans["submission__reporting_fiscal_year"]
-                fq = trans["submission__reporting_fiscal_quarter"]
-                key = {"fiscal_year": str(fy), "quarter": str(fq)}
-                key = str(key)
-                if key not in group_results:
-                    group_results[key] = {
-                        "outlay": trans["outlay"] if trans["outlay"] else 0,
-                        "obligations_incurred_filtered": trans["obligations_incurred_filtered"]
-                        if trans["obligations_incurred_filtered"]
-                        else 0,
-                        "obligations_incurred_other": 0,
-                        "unobliged_balance": 0,
-                    }
-                else:
-                    group_results[key] = {
-                        "outlay": group_results[key]["outlay"] + trans["outlay"]
-                        if trans["outlay"]
-                        else group_results[key]["outlay"],
-                        "obligations_incurred_filtered": group_results[key]["obligations_incurred_filtered"]
-                        + trans["obligations_incurred_filtered"]
-                        if trans["obligations_incurred_filtered"]
-                        else group_results[key]["obligations_incurred_filtered"],
-                        "obligations_incurred_other": group_results[key]["obligations_incurred_other"],
-                        "unobliged_balance": group_results[key]["unobliged_balance"],
-                    }
-            for trans in unfiltered_fa:
-                if trans["submission__reporting_fiscal_year"] is None:
-                    continue
-                fy = trans["submission__reporting_fiscal_year"]
-                fq = trans["submission__reporting_fiscal_quarter"]
-                key = {"fiscal_year": str(fy), "quarter": str(fq)}
-                key = str(key)
-                if key not in group_results:
-                    group_results[key] = {
-                        "outlay": 0,
-                        "obligations_incurred_filtered": 0,
-                        "obligations_incurred_other": trans["obligations_incurred_other"]
-                        if trans["obligations_incurred_other"]
-                        else 0,
-                        "unobliged_balance": trans["unobliged_balance"] if trans["unobliged_balance"] else 0,
-                    }
-                else:
-                    group_results[key] = {
-                        "outlay": group_results[key]["outlay"],
-                        "obligations_incurred_filtered": group_results[key]["obligations_incurred_filtered"],
-                        "obligations_incurred_other": group_results[key]["obligations_incurred_other"]
-                        + trans["obligations_incurred_other"]
-                        if trans["obligations_incurred_other"]
-                        else group_results[key]["obligations_incurred_other"],
-                        "unobliged_balance": group_results[key]["unobliged_balance"] + trans["unobliged_balance"]
-                        if trans["unobliged_balance"]
-                        else group_results[key]["unobliged_balance"],
-                    }
-            nested_order = "quarter"
-
-        # convert result into expected format, sort by key to meet front-end specs
-        results = []
-        # Expected results structure
-        # [{
-        # 'time_period': {'fy': '2017', 'quarter': '3'},
-        # 	'aggregated_amount': '200000000'
-        # }]
-        sorted_group_results = sorted(
-            group_results.items(),
-            key=lambda k: (ast.literal_eval(k[0])["fiscal_year"], int(ast.literal_eval(k[0])[nested_order]))
-            if nested_order
-            else (ast.literal_eval(k[0])["fiscal_year"]),
+            ):
+                result[amount] += row[amount]
+
+        results = sorted(
+            group_results.values(),
+            key=lambda result: (result["time_period"]["fiscal_year"], int(result["time_period"]["quarter"]))
+            if quarterly
+            else result["time_period"]["fiscal_year"],
         )
 
-        for key, value in sorted_group_results:
-            key_dict = ast.literal_eval(key)
-            value["time_period"] = key_dict
-            result = value
-            results.append(result)
-        response["results"] = results
-
-        return Response(response)
+        return Response({"results": results})
 
 
 def filter_on(prefix, key, values):
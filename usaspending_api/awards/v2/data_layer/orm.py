@@ -3,8 +3,8 @@ import logging
 
 from collections import OrderedDict
 from decimal import Decimal
-from django.db.models import Sum, F, Subquery
-from typing import Optional
+from django.db.models import Sum, F
+from typing import Optional, Tuple
 
 from usaspending_api.awards.models import (
     Award,
@@ -26,26 +26,66 @@ from usaspending_api.common.helpers.data_constants import state_code_from_name,
 from usaspending_api.common.helpers.date_helper import get_date_from_datetime
 from usaspending_api.common.helpers.sql_helpers import execute_sql_to_ordered_dictionary
 from usaspending_api.common.recipient_lookups import obtain_recipient_uri
-from usaspending_api.references.models import Agency, Cfda, PSC, NAICS, SubtierAgency, DisasterEmergencyFundCode
-from usaspending_api.submissions.models import SubmissionAttributes
+from usaspending_api.references.helpers import (
+    agencies,
+    cfda_details,
+    disaster_emergency_fund_codes,
+    naics_descriptions,
+    psc_descriptions,
+    subtier_agencies,
+    toptier_agencies_by_subtier_agency_id,
+    toptier_codes_with_submissions,
+)
 from usaspending_api.awards.v2.data_layer.sql import defc_sql
 
 logger = logging.getLogger("console")
 
+IDV_CONTRACT_FIELDS = copy.deepcopy(FPDS_CONTRACT_FIELDS)
+IDV_CONTRACT_FIELDS.update(
+    [
+        ("period_of_performance_star", "_start_date"),
+        ("last_modified", "_last_modified_date"),
+        ("ordering_period_end_date", "_end_date"),
+    ]
+)
 
-def construct_assistance_response(requested_award_dict: dict) -> OrderedDict:
-    """Build an Assistance Award summary object to send as an API response"""
+# The award fields, latest transaction fields and transaction relation of each kind of award response
+AWARD_CATEGORY_FIELDS = OrderedDict(
+    [
+        ("contract", (FPDS_AWARD_FIELDS, FPDS_CONTRACT_FIELDS, "contract_data")),
+        ("idv", (FPDS_AWARD_FIELDS, IDV_CONTRACT_FIELDS, "contract_data")),
+        ("assistance", (FABS_AWARD_FIELDS, FABS_ASSISTANCE_FIELDS, "assistance_data")),
+    ]
+)
 
-    response = OrderedDict()
-    award = fetch_award_details(requested_award_dict, FABS_AWARD_FIELDS)
+
+def award_response_category(category: Optional[str]) -> str:
+    """Contracts and IDVs have their own responses; every other category of award gets the assistance response"""
+    return category if category in ("contract", "idv") else "assistance"
+
+
+def construct_award_response(requested_award_dict: dict) -> Optional[OrderedDict]:
+    """Build the summary object of an award of any category to send as an API response"""
+    award, transaction = fetch_award_and_latest_transaction(requested_award_dict)
     if not award:
         return None
 
+    category = award_response_category(award["category"])
+    if category == "contract":
+        return construct_contract_response(award, transaction)
+    elif category == "idv":
+        return construct_idv_response(award, transaction)
+    return construct_assistance_response(award, transaction)
+
+
+def construct_assistance_response(award: OrderedDict, transaction: Optional[OrderedDict]) -> OrderedDict:
+    """Build an Assistance Award summary object to send as an API response"""
+
+    response = OrderedDict()
     response.update(award)
 
     account_data = fetch_account_details_award(award["id"])
     response.update(account_data)
-    transaction = fetch_fabs_details_by_pk(award["_trx"], FABS_ASSISTANCE_FIELDS)
 
     response["record_type"] = transaction["record_type"]
     response["cfda_info"] = fetch_all_cfda_details(award)
@@ -70,21 +110,15 @@ def construct_assistance_response(requested_award_dict: dict) -> OrderedDict:
     return delete_keys_from_dict(response)
 
 
-def construct_contract_response(requested_award_dict: dict) -> OrderedDict:
+def construct_contract_response(award: OrderedDict, transaction: Optional[OrderedDict]) -> OrderedDict:
     """Build a Procurement Award summary object to send as an API response"""
 
     response = OrderedDict()
-    award = fetch_award_details(requested_award_dict, FPDS_AWARD_FIELDS)
-    if not award:
-        return None
-
     response.update(award)
 
     account_data = fetch_account_details_award(award["id"])
     response.update(account_data)
 
-    transaction = fetch_fpds_details_by_pk(award["_trx"], FPDS_CONTRACT_FIELDS)
-
     response["parent_award"] = fetch_contract_parent_award_details(
         award["_parent_award_piid"], award["_fpds_parent_agency_id"]
     )
@@ -114,31 +148,15 @@ def construct_contract_response(requested_award_dict: dict) -> OrderedDict:
     return delete_keys_from_dict(response)
 
 
-def construct_idv_response(requested_award_dict: dict) -> OrderedDict:
+def construct_idv_response(award: OrderedDict, transaction: Optional[OrderedDict]) -> OrderedDict:
     """Build a Procurement IDV summary object to send as an API response"""
 
-    idv_specific_award_fields = OrderedDict(
-        [
-            ("period_of_performance_star", "_start_date"),
-            ("last_modified", "_last_modified_date"),
-            ("ordering_period_end_date", "_end_date"),
-        ]
-    )
-
-    mapper = copy.deepcopy(FPDS_CONTRACT_FIELDS)
-    mapper.update(idv_specific_award_fields)
-
     response = OrderedDict()
-    award = fetch_award_details(requested_award_dict, FPDS_AWARD_FIELDS)
-    if not award:
-        return None
     response.update(award)
 
     account_data = fetch_account_details_award(award["id"])
     response.update(account_data)
 
-    transaction = fetch_fpds_details_by_pk(award["_trx"], mapper)
-
     response["parent_award"] = fetch_idv_parent_award_details(award["generated_unique_award_id"])
     response["latest_transaction_contract_data"] = transaction
     response["funding_agency"] = fetch_agency_details(response["_funding_agency"])
@@ -193,7 +211,9 @@ def create_recipient_object(db_row_dict: dict) -> OrderedDict:
             (
                 "business_categories",
                 get_business_category_display_names(
-                    fetch_business_categories_by_transaction_id(db_row_dict["_transaction_id"])
+                    db_row_dict["_business_categories"]
+                    if "_business_categories" in db_row_dict
+                    else fetch_business_categories_by_transaction_id(db_row_dict["_transaction_id"])
                 ),
             ),
             (
@@ -272,94 +292,106 @@ def fetch_award_details(filter_q: dict, mapper_fields: OrderedDict) -> dict:
     return Award.objects.filter(**filter_q).values(*vals).annotate(**ann).first()
 
 
+def fetch_award_and_latest_transaction(filter_q: dict) -> Tuple[Optional[OrderedDict], Optional[OrderedDict]]:
+    """
+    The award and its latest transaction (with its business categories) from a single query, with the fields
+    AWARD_CATEGORY_FIELDS lists for the award's category.  The category isn't known until the row is read, so every
+    category's fields are selected under their own aliases.  The transaction is None when the award has no latest
+    transaction of the category's type.
+    """
+    ann = OrderedDict([("_latest_business_categories", F("latest_transaction__business_categories"))])
+    aliases = {}
+    for category, (award_mapper, transaction_mapper, transaction_relation) in AWARD_CATEGORY_FIELDS.items():
+        award_aliases = OrderedDict((v, f"_{category}_award_{v}") for v in award_mapper.values())
+        transaction_aliases = OrderedDict((v, f"_{category}_transaction_{v}") for v in transaction_mapper.values())
+        ann.update((award_aliases[v], F(k)) for k, v in award_mapper.items())
+        ann.update(
+            (transaction_aliases[v], F(f"latest_transaction__{transaction_relation}__{k}"))
+            for k, v in transaction_mapper.items()
+        )
+        aliases[category] = award_aliases, transaction_aliases
+
+    row = Award.objects.filter(**filter_q).values("category").annotate(**ann).first()
+    if not row:
+        return None, None
+
+    award_aliases, transaction_aliases = aliases[award_response_category(row["category"])]
+    award = OrderedDict((v, row[alias]) for v, alias in award_aliases.items())
+    transaction = OrderedDict((v, row[alias]) for v, alias in transaction_aliases.items())
+    if transaction["_transaction_id"] is None:
+        return award, None
+    transaction["_business_categories"] = row["_latest_business_categories"]
+    return award, transaction
+
+
+PARENT_AWARD_CONTRACT_FIELDS = (
+    "agency_id",
+    "idv_type_description",
+    "multiple_or_single_aw_desc",
+    "piid",
+    "type_of_idc_description",
+)
+
+
 def fetch_contract_parent_award_details(parent_piid: str, parent_fpds_agency: str) -> Optional[OrderedDict]:
     parent_guai = "CONT_IDV_{}_{}".format(parent_piid or "NONE", parent_fpds_agency or "NONE")
 
-    parent_award_ids = (
+    parent_award = (
         ParentAward.objects.filter(generated_unique_award_id=parent_guai)
-        .annotate(parent_award_award_id=F("award_id"), parent_award_guai=F("generated_unique_award_id"))
-        .values("parent_award_award_id", "parent_award_guai")
+        .annotate(
+            parent_award_award_id=F("award_id"),
+            parent_award_guai=F("generated_unique_award_id"),
+            **_parent_award_contract_data("award__"),
+        )
+        .values("parent_award_award_id", "parent_award_guai", *PARENT_AWARD_CONTRACT_FIELDS)
         .first()
     )
 
-    return _fetch_parent_award_details(parent_award_ids)
+    return _fetch_parent_award_details(parent_award)
 
 
 def fetch_idv_parent_award_details(guai: str) -> Optional[OrderedDict]:
-    parent_award_ids = (
+    parent_award = (
         ParentAward.objects.filter(generated_unique_award_id=guai, parent_award__isnull=False)
         .annotate(
             parent_award_award_id=F("parent_award__award_id"),
             parent_award_guai=F("parent_award__generated_unique_award_id"),
+            **_parent_award_contract_data("parent_award__award__"),
         )
-        .values("parent_award_award_id", "parent_award_guai")
+        .values("parent_award_award_id", "parent_award_guai", *PARENT_AWARD_CONTRACT_FIELDS)
         .first()
     )
 
-    return _fetch_parent_award_details(parent_award_ids)
-
+    return _fetch_parent_award_details(parent_award)
 
-def _fetch_parent_award_details(parent_award_ids: dict) -> Optional[OrderedDict]:
-    if not parent_award_ids:
-        return None
 
-    # These are not exact query paths but instead expected aliases to allow reuse
-    parent_award_award_id = parent_award_ids["parent_award_award_id"]
-    parent_award_guai = parent_award_ids["parent_award_guai"]
+def _parent_award_contract_data(award_path: str) -> dict:
+    return {
+        field: F(f"{award_path}latest_transaction__contract_data__{field}") for field in PARENT_AWARD_CONTRACT_FIELDS
+    }
 
-    parent_award = (
-        Award.objects.filter(id=parent_award_award_id)
-        .values(
-            "latest_transaction__contract_data__agency_id",
-            "latest_transaction__contract_data__idv_type_description",
-            "latest_transaction__contract_data__multiple_or_single_aw_desc",
-            "latest_transaction__contract_data__piid",
-            "latest_transaction__contract_data__type_of_idc_description",
-        )
-        .first()
-    )
 
+def _fetch_parent_award_details(parent_award: dict) -> Optional[OrderedDict]:
     if not parent_award:
-        logging.debug("Unable to find award for award id %s" % parent_award_award_id)
         return None
 
-    parent_sub_agency = (
-        SubtierAgency.objects.filter(subtier_code=parent_award["latest_transaction__contract_data__agency_id"])
-        .values("name", "subtier_agency_id")
-        .first()
-    )
-    parent_agency = (
-        (
-            Agency.objects.filter(
-                toptier_flag=True,
-                toptier_agency_id=Subquery(
-                    Agency.objects.filter(
-                        subtier_agency_id__isnull=False, subtier_agency_id=parent_sub_agency["subtier_agency_id"]
-                    ).values("toptier_agency_id")
-                ),
-            )
-            .values("id", "toptier_agency__name")
-            .first()
-        )
-        if parent_sub_agency
-        else None
-    )
+    parent_sub_agency = subtier_agencies().get(parent_award["agency_id"])
+    parent_agency = None
+    if parent_sub_agency:
+        parent_agency = toptier_agencies_by_subtier_agency_id().get(parent_sub_agency["subtier_agency_id"])
 
     parent_object = OrderedDict(
         [
             ("agency_id", parent_agency["id"] if parent_agency else None),
             ("agency_name", parent_agency["toptier_agency__name"] if parent_agency else None),
-            ("sub_agency_id", parent_award["latest_transaction__contract_data__agency_id"]),
+            ("sub_agency_id", parent_award["agency_id"]),
             ("sub_agency_name", parent_sub_agency["name"] if parent_sub_agency else None),
-            ("award_id", parent_award_award_id),
-            ("generated_unique_award_id", parent_award_guai),
-            ("idv_type_description", parent_award["latest_transaction__contract_data__idv_type_description"]),
-            (
-                "multiple_or_single_aw_desc",
-                parent_award["latest_transaction__contract_data__multiple_or_single_aw_desc"],
-            ),
-            ("piid", parent_award["latest_transaction__contract_data__piid"]),
-            ("type_of_idc_description", parent_award["latest_transaction__contract_data__type_of_idc_description"]),
+            ("award_id", parent_award["parent_award_award_id"]),
+            ("generated_unique_award_id", parent_award["parent_award_guai"]),
+            ("idv_type_description", parent_award["idv_type_description"]),
+            ("multiple_or_single_aw_desc", parent_award["multiple_or_single_aw_desc"]),
+            ("piid", parent_award["piid"]),
+            ("type_of_idc_description", parent_award["type_of_idc_description"]),
         ]
     )
 
@@ -389,21 +421,12 @@ def fetch_latest_ec_details(award_id: int, mapper: OrderedDict, transaction_type
 
 
 def agency_has_file_c_submission(agency_id):
-    return SubmissionAttributes.objects.filter(
-        toptier_code=Subquery(Agency.objects.filter(id=agency_id).values("toptier_agency__toptier_code")[:1])
-    ).exists()
+    agency = agencies().get(agency_id)
+    return agency is not None and agency["toptier_agency__toptier_code"] in toptier_codes_with_submissions()
 
 
 def fetch_agency_details(agency_id: int) -> Optional[dict]:
-    values = [
-        "toptier_agency__toptier_code",
-        "toptier_agency__name",
-        "toptier_agency__abbreviation",
-        "subtier_agency__subtier_code",
-        "subtier_agency__name",
-        "subtier_agency__abbreviation",
-    ]
-    agency = Agency.objects.filter(pk=agency_id).values(*values).first()
+    agency = agencies().get(agency_id)
 
     agency_details = None
     if agency:
@@ -472,8 +495,9 @@ def fetch_all_cfda_details(award: dict) -> list:
             )
 
     final_cfda_objects = []
+    all_cfda_details = cfda_details(cfda_dicts.keys())
     for cfda_number in cfda_dicts.keys():
-        details = fetch_cfda_details_using_cfda_number(cfda_number)
+        details = dict(all_cfda_details.get(cfda_number, {}))
         if details.get("url") == "None;":
             details.update({"url": None})
         final_cfda_objects.append(
@@ -500,20 +524,7 @@ def fetch_all_cfda_details(award: dict) -> list:
 
 
 def fetch_cfda_details_using_cfda_number(cfda: str) -> dict:
-    values = [
-        "applicant_eligibility",
-        "beneficiary_eligibility",
-        "program_title",
-        "objectives",
-        "federal_agency",
-        "website_address",
-        "url",
-        "obligations",
-        "popular_name",
-    ]
-    cfda_details = Cfda.objects.filter(program_number=cfda).values(*values).first()
-
-    return cfda_details or {}
+    return dict(cfda_details([cfda]).get(cfda, {}))
 
 
 def fetch_transaction_obligated_amount_by_internal_award_id(internal_award_id: int) -> Optional[Decimal]:
@@ -533,27 +544,11 @@ def fetch_psc_hierarchy(psc_code: str) -> dict:
     subtier_code = {}  # only used for R&D codes which start with "A"
     base_code = {}
     if psc_code[0].isalpha():  # we only want to look for the toptier code for services, which start with letters
-        try:
-            psc_top = PSC.objects.get(code=codes[2])
-            toptier_code = {"code": psc_top.code, "description": psc_top.description}
-        except PSC.DoesNotExist:
-            pass
-    try:
-        psc_mid = PSC.objects.get(code=codes[1])
-        midtier_code = {"code": psc_mid.code, "description": psc_mid.description}
-    except PSC.DoesNotExist:
-        pass
-    try:
-        psc = PSC.objects.get(code=codes[0])
-        base_code = {"code": psc.code, "description": psc.description}
-    except PSC.DoesNotExist:
-        pass
+        toptier_code = _code_and_description(codes[2], psc_descriptions())
+    midtier_code = _code_and_description(codes[1], psc_descriptions())
+    base_code = _code_and_description(codes[0], psc_descriptions())
     if codes[3] is not None:  # don't bother looking for 3 digit codes unless they start with "A"
-        try:
-            psc_rd = PSC.objects.get(code=codes[3])
-            subtier_code = {"code": psc_rd.code, "description": psc_rd.description}
-        except PSC.DoesNotExist:
-            pass
+        subtier_code = _code_and_description(codes[3], psc_descriptions())
 
     results = {
         "toptier_code": toptier_code,
@@ -566,28 +561,19 @@ def fetch_psc_hierarchy(psc_code: str) -> dict:
 
 def fetch_naics_hierarchy(naics: str) -> dict:
     codes = [naics, naics[:4], naics[:2]]
-    toptier_code = {}
-    midtier_code = {}
-    base_code = {}
-    try:
-        toptier = NAICS.objects.get(code=codes[2])
-        toptier_code = {"code": toptier.code, "description": toptier.description}
-    except NAICS.DoesNotExist:
-        pass
-    try:
-        midtier = NAICS.objects.get(code=codes[1])
-        midtier_code = {"code": midtier.code, "description": midtier.description}
-    except NAICS.DoesNotExist:
-        pass
-    try:
-        base = NAICS.objects.get(code=codes[0])
-        base_code = {"code": base.code, "description": base.description}
-    except NAICS.DoesNotExist:
-        pass
+    toptier_code = _code_and_description(codes[2], naics_descriptions())
+    midtier_code = _code_and_description(codes[1], naics_descriptions())
+    base_code = _code_and_description(codes[0], naics_descriptions())
     results = {"toptier_code": toptier_code, "midtier_code": midtier_code, "base_code": base_code}
     return results
 
 
+def _code_and_description(code: str, descriptions: dict) -> dict:
+    if code not in descriptions:
+        return {}
+    return {"code": code, "description": descriptions[code]}
+
+
 def fetch_account_details_award(award_id: int) -> dict:
     award_id_sql = "faba.award_id = {award_id}".format(award_id=award_id)
     results = execute_sql_to_ordered_dictionary(defc_sql.format(award_id_sql=award_id_sql))
@@ -595,7 +581,7 @@ def fetch_account_details_award(award_id: int) -> dict:
     obligation_by_code = []
     total_outlay = 0
     total_obligations = 0
-    covid_defcs = DisasterEmergencyFundCode.objects.filter(group_name="covid_19").values_list("code", flat=True)
+    covid_defcs = disaster_emergency_fund_codes("covid_19")
     for row in results:
         if row["disaster_emergency_fund_code"] in covid_defcs:
             total_outlay += row["total_outlay"]
@@ -7,11 +7,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.awards.models import Award, FinancialAccountsByAwards
-from usaspending_api.awards.v2.data_layer.orm import (
-    construct_contract_response,
-    construct_idv_response,
-    construct_assistance_response,
-)
+from usaspending_api.awards.v2.data_layer.orm import construct_award_response
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.validator.tinyshield import TinyShield
 
@@ -62,21 +58,15 @@ class AwardRetrieveViewSet(APIView):
         return validated_request_data
 
     def _business_logic(self, request_dict: dict) -> dict:
-        try:
-            award = Award.objects.get(**request_dict)
-        except Award.DoesNotExist:
+        response_content = construct_award_response(request_dict)
+        if response_content is None:
             logger.info("No Award found with: '{}'".format(request_dict))
             raise NotFound("No Award found with: '{}'".format(request_dict))
 
-        if award.category == "contract":
-            response_content = construct_contract_response(request_dict)
-        elif award.category == "idv":
-            response_content = construct_idv_response(request_dict)
-        else:
-            response_content = construct_assistance_response(request_dict)
-
         response_content["disaster_emergency_fund_codes"] = list(
-            FinancialAccountsByAwards.objects.filter(award=award, disaster_emergency_fund__isnull=False)
+            FinancialAccountsByAwards.objects.filter(
+                award_id=response_content["id"], disaster_emergency_fund__isnull=False
+            )
             .order_by("disaster_emergency_fund__code")
             .distinct()
             .values_list("disaster_emergency_fund__code", flat=True)
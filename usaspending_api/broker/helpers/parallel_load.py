@@ -0,0 +1,160 @@
+"""
+Spreads a transaction load across worker processes.  IDs are partitioned on a hash of their award key so every
+transaction belonging to an award is loaded by the same worker, one chunk at a time.  That keeps two workers from
+racing each other to create or update the same award while still letting independent awards load concurrently.
+
+Loads made of a few groups of very different sizes, where hashing could leave one worker with most of the work, can
+instead hand each group whole to whichever worker is free next (see load_in_groups).
+"""
+import logging
+import queue
+import traceback
+import zlib
+
+from multiprocessing import Process, Queue
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from django.db import connections
+
+
+logger = logging.getLogger("script")
+
+QUEUE_TIMEOUT_SECONDS = 10
+CHUNKS_QUEUED_PER_WORKER = 2
+
+_DONE = "DONE"
+
+
+def award_partition(unique_award_key: Optional[str], partition_count: int) -> int:
+    """Stable across processes and runs, unlike the builtin string hash"""
+    return zlib.crc32((unique_award_key or "").encode("utf-8")) % partition_count
+
+
+def _run_worker(load_function: Callable[[List[Any]], Any], work_queue: Queue, result_queue: Queue) -> None:
+    try:
+        while True:
+            id_list = work_queue.get()
+            if id_list == _DONE:
+                break
+            result_queue.put(load_function(id_list))
+    except Exception:
+        result_queue.put(RuntimeError(traceback.format_exc()))
+        raise
+    result_queue.put(_DONE)
+
+
+def _put(work_queue: Queue, item: Any, workers: List[Process]) -> None:
+    while True:
+        try:
+            work_queue.put(item, timeout=QUEUE_TIMEOUT_SECONDS)
+            return
+        except queue.Full:
+            if not any(worker.is_alive() for worker in workers):
+                raise RuntimeError(f"{', '.join(w.name for w in workers)} exited before all chunks were queued")
+
+
+def _start_workers(
+    load_function: Callable[[List[Any]], Any], work_queues: List[Queue], result_queue: Queue
+) -> List[Process]:
+    # Forked workers must not share the parent's database sockets; they'll each open their own on first use
+    connections.close_all()
+
+    workers = [
+        Process(name=f"Load Worker {i}", target=_run_worker, args=(load_function, work_queue, result_queue))
+        for i, work_queue in enumerate(work_queues)
+    ]
+    for worker in workers:
+        worker.start()
+    return workers
+
+
+def _run_load(workers: List[Process], queue_work: Callable[[], None], result_queue: Queue) -> List[Any]:
+    """Queues the work with queue_work and waits for the workers to report back, stopping them all on failure"""
+    try:
+        queue_work()
+        results = _collect_results(result_queue, workers)
+    except BaseException:
+        for worker in workers:
+            worker.terminate()
+        raise
+
+    for worker in workers:
+        worker.join()
+
+    logger.info(f"{len(results):,} chunks loaded across {len(workers)} workers")
+    return results
+
+
+def _collect_results(result_queue: Queue, workers: List[Process]) -> List[Any]:
+    results = []
+    workers_running = len(workers)
+    while workers_running:
+        try:
+            result = result_queue.get(timeout=QUEUE_TIMEOUT_SECONDS)
+        except queue.Empty:
+            if not any(worker.is_alive() for worker in workers):
+                raise RuntimeError("All load workers exited without reporting completion")
+            continue
+        if isinstance(result, Exception):
+            raise result
+        if result == _DONE:
+            workers_running -= 1
+        else:
+            results.append(result)
+    return results
+
+
+def load_in_partitions(
+    rows: Iterable[Tuple[Any, Optional[str]]],
+    load_function: Callable[[List[Any]], Any],
+    worker_count: int,
+    chunk_size: int,
+) -> List[Any]:
+    """
+    Streams (id, unique_award_key) rows to worker_count processes in chunks of up to chunk_size IDs.  Each worker calls
+    load_function with its chunks in order on its own database connection.
+
+    returns the load_function return value for every chunk, in no particular order
+    """
+    work_queues = [Queue(CHUNKS_QUEUED_PER_WORKER) for _ in range(worker_count)]
+    result_queue = Queue()
+    workers = _start_workers(load_function, work_queues, result_queue)
+
+    def queue_work():
+        buffers = [[] for _ in range(worker_count)]
+        for transaction_id, unique_award_key in rows:
+            partition = award_partition(unique_award_key, worker_count)
+            buffers[partition].append(transaction_id)
+            if len(buffers[partition]) >= chunk_size:
+                _put(work_queues[partition], buffers[partition], [workers[partition]])
+                buffers[partition] = []
+
+        for work_queue, buffer, worker in zip(work_queues, buffers, workers):
+            if buffer:
+                _put(work_queue, buffer, [worker])
+            _put(work_queue, _DONE, [worker])
+
+    return _run_load(workers, queue_work, result_queue)
+
+
+def load_in_groups(
+    groups: Iterable[List[Any]], load_function: Callable[[List[Any]], Any], worker_count: int
+) -> List[Any]:
+    """
+    Hands each group of IDs whole, in the order given, to the next of worker_count processes to be free, which calls
+    load_function with it on its own database connection.  Listing the largest groups first keeps one worker from
+    being left with a big group after the others have finished.
+
+    returns the load_function return value for every group, in no particular order
+    """
+    work_queue = Queue(CHUNKS_QUEUED_PER_WORKER * worker_count)
+    result_queue = Queue()
+    workers = _start_workers(load_function, [work_queue] * worker_count, result_queue)
+
+    def queue_work():
+        for group in groups:
+            _put(work_queue, list(group), workers)
+        for _ in workers:
+            _put(work_queue, _DONE, workers)
+
+    return _run_load(workers, queue_work, result_queue)
@@ -6,6 +6,7 @@ from datetime import datetime, timezone
 from django.db import connection, transaction
 
 from usaspending_api.awards.models import TransactionFABS, TransactionNormalized, Award
+from usaspending_api.broker.helpers.parallel_load import load_in_partitions
 from usaspending_api.broker.helpers.get_business_categories import get_business_categories
 from usaspending_api.common.helpers.date_helper import cast_datetime_to_utc
 from usaspending_api.common.helpers.dict_helpers import upper_case_dict_values
@@ -155,13 +156,24 @@ def insert_new_fabs(to_insert):
     return update_award_ids
 
 
-def upsert_fabs_transactions(ids_to_upsert, externally_updated_award_ids):
+def upsert_fabs_transactions(ids_to_upsert, externally_updated_award_ids, award_keys=None, workers=1):
+    """
+    award_keys, if provided, holds the unique_award_key of each id in ids_to_upsert and is required to spread the
+    upsert across more than one worker process.
+    """
     if ids_to_upsert or externally_updated_award_ids:
         update_award_ids = copy(externally_updated_award_ids)
 
         if ids_to_upsert:
             with timer("inserting new FABS data", logger.info):
-                update_award_ids.extend(insert_all_new_fabs(ids_to_upsert))
+                if workers > 1:
+                    if award_keys is None:
+                        raise ValueError("award_keys are required to upsert FABS transactions with multiple workers")
+                    rows = zip(ids_to_upsert, award_keys)
+                    for award_ids in load_in_partitions(rows, insert_all_new_fabs, workers, BATCH_FETCH_SIZE):
+                        update_award_ids.extend(award_ids)
+                else:
+                    update_award_ids.extend(insert_all_new_fabs(ids_to_upsert))
 
         if update_award_ids:
             update_award_ids = tuple(set(update_award_ids))  # Convert to tuple and remove duplicates.
@@ -75,7 +75,7 @@ def get_incremental_load_start_datetime():
     return min((last_load_date, max_updated_at))
 
 
-def _get_ids(sql, ids, afa_ids, start_datetime, end_datetime):
+def _get_rows(sql, ids, afa_ids, start_datetime, end_datetime):
     params = []
     if ids and afa_ids:
         sql += " and (published_award_financial_assistance_id in %s or afa_generated_unique in %s)"
@@ -95,7 +95,11 @@ def _get_ids(sql, ids, afa_ids, start_datetime, end_datetime):
         params.append(cast_datetime_to_naive(end_datetime))
     with connection.cursor() as cursor:
         cursor.execute(sql, params)
-        return tuple(row[0] for row in cursor.fetchall())
+        return cursor.fetchall()
+
+
+def _get_ids(sql, ids, afa_ids, start_datetime, end_datetime):
+    return tuple(row[0] for row in _get_rows(sql, ids, afa_ids, start_datetime, end_datetime))
 
 
 def get_fabs_transaction_ids(ids, afa_ids, start_datetime, end_datetime):
@@ -109,6 +113,18 @@ def get_fabs_transaction_ids(ids, afa_ids, start_datetime, end_datetime):
     return ids
 
 
+def get_fabs_transaction_ids_and_award_keys(ids, afa_ids, start_datetime, end_datetime):
+    """Same as get_fabs_transaction_ids, but also returns each transaction's award key for partitioning"""
+    sql = """
+        select  published_award_financial_assistance_id, unique_award_key
+        from    source_assistance_transaction
+        where   is_active is true
+    """
+    rows = _get_rows(sql, ids, afa_ids, start_datetime, end_datetime)
+    logger.info("Number of records to insert/update: {:,}".format(len(rows)))
+    return tuple(row[0] for row in rows), tuple(row[1] for row in rows)
+
+
 def read_afa_ids_from_file(afa_id_file_path):
     with RetrieveFileFromUri(afa_id_file_path).get_file_object() as f:
         return {l.decode("utf-8").rstrip() for l in f if l}
@@ -178,9 +194,22 @@ class Command(BaseCommand):
             "quotes if date/time contains spaces.",
         )
 
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes used to insert/update transactions concurrently. Transactions are "
+            "partitioned by award so an award is only ever loaded by one worker. Each chunk is committed "
+            "separately rather than in one transaction for the whole load.",
+        )
+
     def handle(self, *args, **options):
         processing_start_datetime = datetime.now(timezone.utc)
 
+        workers = options["workers"]
+        if workers < 1:
+            raise ValueError("--workers must be at least 1")
+
         logger.info("Starting FABS data load script...")
 
         # "Reload all" supersedes all other processing options.
@@ -212,11 +241,17 @@ class Command(BaseCommand):
                 ids_to_delete = get_delete_pks_for_afa_keys(ids_to_delete)
             logger.info(f"{len(ids_to_delete):,} delete ids found in total")
 
+        award_keys = None
         with timer("retrieving/diff-ing FABS Data", logger.info):
-            ids_to_upsert = get_fabs_transaction_ids(ids, afa_ids, start_datetime, end_datetime)
+            if workers > 1:
+                ids_to_upsert, award_keys = get_fabs_transaction_ids_and_award_keys(
+                    ids, afa_ids, start_datetime, end_datetime
+                )
+            else:
+                ids_to_upsert = get_fabs_transaction_ids(ids, afa_ids, start_datetime, end_datetime)
 
         update_award_ids = delete_fabs_transactions(ids_to_delete) if is_incremental_load else []
-        upsert_fabs_transactions(ids_to_upsert, update_award_ids)
+        upsert_fabs_transactions(ids_to_upsert, update_award_ids, award_keys, workers)
 
         if is_incremental_load:
             update_last_load_date("fabs", processing_start_datetime)
@@ -4,15 +4,22 @@ import re
 
 from datetime import datetime, timezone
 from django.core.management.base import BaseCommand
+from functools import partial
 from typing import IO, List, AnyStr, Optional
 
 from usaspending_api.broker.helpers.last_load_date import get_last_load_date, update_last_load_date
+from usaspending_api.broker.helpers.parallel_load import load_in_partitions
 from usaspending_api.common.helpers.date_helper import datetime_command_line_argument_type
 from usaspending_api.common.helpers.etl_helpers import update_c_to_d_linkages
 from usaspending_api.common.helpers.sql_helpers import get_database_dsn_string
 from usaspending_api.common.retrieve_file_from_uri import RetrieveFileFromUri
 from usaspending_api.etl.award_helpers import update_awards, update_procurement_awards, prune_empty_awards
-from usaspending_api.etl.transaction_loaders.fpds_loader import load_fpds_transactions, failed_ids, delete_stale_fpds
+from usaspending_api.etl.transaction_loaders.fpds_loader import (
+    load_fpds_transactions,
+    load_fpds_transactions_in_worker,
+    failed_ids,
+    delete_stale_fpds,
+)
 from usaspending_api.transactions.transaction_delete_journal_helpers import retrieve_deleted_fpds_transactions
 
 logger = logging.getLogger("script")
@@ -26,15 +33,20 @@ class Command(BaseCommand):
     help = "Sync USAspending DB FPDS data using source transaction for new or modified records and S3 for deleted IDs"
 
     modified_award_ids = []
+    bulk_load = False
+    workers = 1
 
     @staticmethod
-    def get_cursor_for_date_query(connection, date, count=False):
+    def get_cursor_for_date_query(connection, date, count=False, with_award_key=False):
         if count:
             db_cursor = connection.cursor()
             db_query = ALL_FPDS_QUERY.format("COUNT(*)")
         else:
             db_cursor = connection.cursor("fpds_load", cursor_factory=psycopg2.extras.DictCursor)
-            db_query = ALL_FPDS_QUERY.format("detached_award_procurement_id")
+            columns = (
+                "detached_award_procurement_id, unique_award_key" if with_award_key else "detached_award_procurement_id"
+            )
+            db_query = ALL_FPDS_QUERY.format(columns)
 
         if date:
             db_cursor.execute(db_query + " WHERE updated_at >= %s", [date])
@@ -59,16 +71,40 @@ class Command(BaseCommand):
             total_records = self.get_cursor_for_date_query(connection, date, True).fetchall()[0][0]
             records_processed = 0
             logger.info("{} total records to update".format(total_records))
+
+            if self.workers > 1:
+                cursor = self.get_cursor_for_date_query(connection, date, with_award_key=True)
+                self.load_fpds_in_partitions(cursor, chunk_size)
+                return
+
             cursor = self.get_cursor_for_date_query(connection, date)
             while True:
                 id_list = cursor.fetchmany(chunk_size)
                 if len(id_list) == 0:
                     break
                 logger.info("Loading batch (size: {}) from date query...".format(len(id_list)))
-                self.modified_award_ids.extend(load_fpds_transactions([row[0] for row in id_list]))
+                self.modified_award_ids.extend(load_fpds_transactions([row[0] for row in id_list], self.bulk_load))
                 records_processed = records_processed + len(id_list)
                 logger.info("{} out of {} processed".format(records_processed, total_records))
 
+    def load_fpds_in_partitions(self, cursor, chunk_size: int = CHUNK_SIZE) -> None:
+        """Load chunks concurrently, keeping all transactions for an award on the same worker"""
+
+        def gen_rows():
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if len(rows) == 0:
+                    break
+                yield from ((row[0], row[1]) for row in rows)
+
+        logger.info(f"Loading batches (size: {chunk_size}) across {self.workers} workers...")
+        results = load_in_partitions(
+            gen_rows(), partial(load_fpds_transactions_in_worker, bulk_load=self.bulk_load), self.workers, chunk_size
+        )
+        for award_ids, chunk_failed_ids in results:
+            self.modified_award_ids.extend(award_ids)
+            failed_ids.extend(chunk_failed_ids)
+
     @staticmethod
     def gen_read_file_for_ids(file: IO[AnyStr], chunk_size: int = CHUNK_SIZE) -> List[str]:
         """ """
@@ -88,7 +124,7 @@ class Command(BaseCommand):
                 id_list = [int(re.search(r"\d+", x).group()) for x in next_batch]
                 total_count += len(id_list)
                 logger.info(f"Loading next batch (size: {len(id_list)}, ids {id_list[0]}-{id_list[-1]})...")
-                self.modified_award_ids.extend(load_fpds_transactions(id_list))
+                self.modified_award_ids.extend(load_fpds_transactions(id_list, self.bulk_load))
 
         logger.info(f"Total transaction IDs in file: {total_count}")
 
@@ -139,11 +175,28 @@ class Command(BaseCommand):
             action="store_true",
             help="Script will load or reload all FPDS records in source tables, from all time. This does NOT clear the USAspending database first",
         )
+        parser.add_argument(
+            "--bulk-load",
+            action="store_true",
+            help="Stage each chunk of transactions into temporary tables and upsert them with set-based SQL instead of "
+            "issuing several statements per transaction",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes used to load chunks concurrently with --date, --since-last-load, or "
+            "--reload-all. Transactions are partitioned by award so an award is only ever loaded by one worker.",
+        )
 
     def handle(self, *args, **options):
 
         # Record script execution start time to update the FPDS last updated date in DB as appropriate
         update_time = datetime.now(timezone.utc)
+        self.bulk_load = options["bulk_load"]
+        self.workers = options["workers"]
+        if self.workers < 1:
+            raise ValueError("--workers must be at least 1")
 
         if options["reload_all"]:
             self.load_fpds_incrementally(None)
@@ -152,7 +205,7 @@ class Command(BaseCommand):
             self.load_fpds_incrementally(options["date"])
 
         elif options["ids"]:
-            self.modified_award_ids.extend(load_fpds_transactions(options["ids"]))
+            self.modified_award_ids.extend(load_fpds_transactions(options["ids"], self.bulk_load))
 
         elif options["file"]:
             self.load_fpds_from_file(options["file"])
@@ -0,0 +1,64 @@
+import os
+import pytest
+import time
+
+from usaspending_api.broker.helpers.parallel_load import award_partition, load_in_groups, load_in_partitions
+
+
+def _echo_chunk(id_list):
+    return id_list
+
+
+def _echo_group_and_worker(id_list):
+    if len(id_list) > 5:
+        time.sleep(1)
+    return os.getpid(), id_list
+
+
+def _fail_chunk(id_list):
+    raise ValueError("bad chunk")
+
+
+def test_award_partition():
+    assert award_partition("CONT_AWD_1", 4) == award_partition("CONT_AWD_1", 4)
+    assert 0 <= award_partition("CONT_AWD_1", 4) < 4
+    assert award_partition(None, 4) == award_partition("", 4)
+    assert award_partition("CONT_AWD_1", 1) == 0
+
+
+def test_load_in_partitions():
+    award_keys = {transaction_id: f"AWARD_{transaction_id % 7}" for transaction_id in range(100)}
+
+    results = load_in_partitions(list(award_keys.items()), _echo_chunk, worker_count=3, chunk_size=10)
+
+    loaded_ids = [transaction_id for chunk in results for transaction_id in chunk]
+    assert sorted(loaded_ids) == list(range(100))
+    assert all(len(chunk) <= 10 for chunk in results)
+
+    # Every chunk is made up of transactions from a single partition
+    for chunk in results:
+        assert len({award_partition(award_keys[transaction_id], 3) for transaction_id in chunk}) == 1
+
+
+def test_load_in_partitions_worker_failure():
+    with pytest.raises(RuntimeError, match="bad chunk"):
+        load_in_partitions([(1, "AWARD_1"), (2, "AWARD_2")], _fail_chunk, worker_count=2, chunk_size=10)
+
+
+def test_load_in_groups():
+    groups = [list(range(10)), [10, 11], [12], [13], [14]]
+
+    results = load_in_groups(groups, _echo_group_and_worker, worker_count=2)
+
+    # Every group is loaded whole and in order by one of the workers
+    assert sorted(group for _, group in results) == sorted(groups)
+    assert os.getpid() not in {pid for pid, _ in results}
+
+    # While one worker loads the large group, the other is left to load all of the small ones
+    large_group_pid = next(pid for pid, group in results if group == groups[0])
+    assert [group for pid, group in results if pid == large_group_pid] == [groups[0]]
+
+
+def test_load_in_groups_worker_failure():
+    with pytest.raises(RuntimeError, match="bad chunk"):
+        load_in_groups([[1], [2], [3]], _fail_chunk, worker_count=2)
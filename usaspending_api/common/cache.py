@@ -4,7 +4,7 @@ import json
 from rest_framework_extensions.key_constructor import bits
 from rest_framework_extensions.key_constructor.constructors import DefaultKeyConstructor
 
-from usaspending_api.common.helpers.dict_helpers import order_nested_object
+from usaspending_api.common.helpers.dict_helpers import order_nested_object, request_fingerprint
 
 
 class PathKeyBit(bits.QueryParamsKeyBit):
@@ -19,15 +19,16 @@ class PathKeyBit(bits.QueryParamsKeyBit):
 class GetPostQueryParamsKeyBit(bits.QueryParamsKeyBit):
     """
     Override QueryParamsKey method in drf-extensions to ensure that the query params part of our cache key includes
-    directives in a POST request (i.e., request.data) as well as GET parameters
+    directives in a POST request (i.e., request.data) as well as GET parameters.  Views that validate with a
+    CompiledTinyShield can expose it as `request_validator` so its defaults are part of the key, and a request that
+    leaves out a field gets the same cache entry as one that sends the default value.
     """
 
     def get_source_dict(self, params, view_instance, view_method, request, args, kwargs):
         params = dict(request.query_params)
         params.update(dict(request.data))
-        if "auditTrail" in params:
-            del params["auditTrail"]
-        return {"request": json.dumps(order_nested_object(params))}
+        validator = getattr(view_instance, "request_validator", None)
+        return {"request": request_fingerprint(params, validator.defaults if validator else ())}
 
 
 class USAspendingKeyConstructor(DefaultKeyConstructor):
@@ -1,13 +1,124 @@
 # -*- coding: utf-8 -*-
 import logging
+import os
+import threading
+import time
+
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache.backends.dummy import DummyCache
+from django.http.response import HttpResponse
 from rest_framework_extensions.cache.decorators import CacheResponse
 
 from usaspending_api.common.experimental_api_flags import is_experimental_elasticsearch_api
 
 logger = logging.getLogger("console")
 
+# Headers describing how this particular response was served; never stored with the cached content
+PER_RESPONSE_HEADERS = ("cache-trace", "key")
+
+
+class LocalResponseCache:
+    """
+    Thread-safe, in-process LRU of rendered responses stored as (content, status, headers) tuples.  Entries expire
+    after `ttl` seconds and the least recently used are evicted once there are more than `max_entries` of them or
+    their content adds up to more than `max_bytes`.  The stats are logged every `stats_log_seconds` if it's set.
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int, ttl: int, stats_log_seconds: int = 0):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats_log_seconds = stats_log_seconds
+        self._stats_logged_at = time.monotonic()
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        self._log_stats_if_due()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._remove(key)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value, timeout=None):
+        size = len(value[0])
+        if size > self.max_bytes:
+            return
+        ttl = min(self.ttl, timeout) if timeout else self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _log_stats_if_due(self):
+        if self.stats_log_seconds <= 0 or time.monotonic() - self._stats_logged_at < self.stats_log_seconds:
+            return
+        with self._lock:
+            if time.monotonic() - self._stats_logged_at < self.stats_log_seconds:
+                return  # Another thread just logged them
+            self._stats_logged_at = time.monotonic()
+        logger.info(f"Local response cache in process {os.getpid()}: {self.stats()}")
+
+    def _remove(self, key):
+        self._bytes -= len(self._entries.pop(key)[1][0])
+
+
+_local_response_cache = None
+_local_response_cache_lock = threading.Lock()
+
+
+def get_local_response_cache() -> LocalResponseCache:
+    global _local_response_cache
+    if _local_response_cache is None:
+        with _local_response_cache_lock:
+            if _local_response_cache is None:
+                _local_response_cache = LocalResponseCache(
+                    settings.LOCAL_RESPONSE_CACHE_MAX_ENTRIES,
+                    settings.LOCAL_RESPONSE_CACHE_MAX_BYTES,
+                    settings.LOCAL_RESPONSE_CACHE_TTL,
+                    settings.LOCAL_RESPONSE_CACHE_STATS_LOG_SECONDS,
+                )
+    return _local_response_cache
+
 
 class CustomCacheResponse(CacheResponse):
+    """
+    Two cache tiers: a small LRU in this process (see LocalResponseCache) in front of the shared Django cache.  Both
+    hold the rendered content, status and headers of a response rather than the pickled Response object.  The local
+    tier is skipped when the shared cache is disabled, so turning caching off still turns all of it off.
+    """
+
     def process_cache_response(self, view_instance, view_method, request, args, kwargs):
         if is_experimental_elasticsearch_api(request):
             # bypass cache altogether
@@ -18,30 +129,51 @@ class CustomCacheResponse(CacheResponse):
         key = self.calculate_key(
             view_instance=view_instance, view_method=view_method, request=request, args=args, kwargs=kwargs
         )
-        response = None
-        try:
-            response = self.cache.get(key)
-        except Exception:
-            msg = "Problem while retrieving key [{k}] from cache for path:'{p}'"
-            logger.exception(msg.format(k=key, p=str(request.path)))
-
-        if not response:
+        local_cache = None
+        if not isinstance(self.cache, DummyCache) and settings.LOCAL_RESPONSE_CACHE_MAX_ENTRIES > 0:
+            local_cache = get_local_response_cache()
+
+        cache_trace = "hit-local-cache"
+        cached_response = local_cache.get(key) if local_cache else None
+        if cached_response is None:
+            cache_trace = "hit-cache"
+            try:
+                cached_response = self.cache.get(key)
+            except Exception:
+                msg = "Problem while retrieving key [{k}] from cache for path:'{p}'"
+                logger.exception(msg.format(k=key, p=str(request.path)))
+            if not isinstance(cached_response, tuple):
+                cached_response = None  # Includes Response objects cached before responses were stored as tuples
+            elif local_cache:
+                local_cache.set(key, cached_response, self.timeout)
+
+        if cached_response is None:
             response = view_method(view_instance, request, *args, **kwargs)
             response = view_instance.finalize_response(request, response, *args, **kwargs)
             response["Cache-Trace"] = "no-cache"
-            response.render()  # should be rendered, before picklining while storing to cache
+            response.render()  # should be rendered before its content is stored in the cache
 
             if not response.status_code >= 400 or self.cache_errors:
                 if self.cache_errors:
                     logger.error(self.cache_errors)
+                cached_response = (
+                    response.rendered_content,
+                    response.status_code,
+                    {k: v for k, v in response._headers.items() if k not in PER_RESPONSE_HEADERS},
+                )
+                if local_cache:
+                    local_cache.set(key, cached_response, self.timeout)
                 try:
-                    self.cache.set(key, response, self.timeout)
+                    self.cache.set(key, cached_response, self.timeout)
                     response["Cache-Trace"] = "set-cache"
                 except Exception:
                     msg = "Problem while writing to cache: path:'{p}' data:'{d}'"
                     logger.exception(msg.format(p=str(request.path), d=str(request.data)))
         else:
-            response["Cache-Trace"] = "hit-cache"
+            content, status, headers = cached_response
+            response = HttpResponse(content=content, status=status)
+            response._headers = dict(headers)
+            response["Cache-Trace"] = cache_trace
 
         if not hasattr(response, "_closable_objects"):
             response._closable_objects = []
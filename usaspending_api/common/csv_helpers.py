@@ -42,41 +42,71 @@ def partition_large_delimited_file(
         `output_name_template`: A %s-style template for the numbered output files.
         `keep_headers`: Whether or not to copy the original headers into each output file.
     """
-    new_csv_list = []
-    output_path = os.path.dirname(file_path)
     with open(file_path, "r") as source_csv:
-        original_csv_file_reader = csv.reader(source_csv, delimiter=delimiter)
-        partition_number = 1
-        current_out_path = os.path.join(output_path, output_name_template % partition_number)
-        new_csv_list.append(current_out_path)
-        dest_csv = None
-        try:
-            dest_csv = open(current_out_path, "w")
-            current_partition_writer = csv.writer(dest_csv, delimiter=delimiter)
-            current_limit = row_limit
-
-            if keep_headers:
-                headers = next(original_csv_file_reader)
-                current_partition_writer.writerow(headers)
-
-            for line_number, row in enumerate(original_csv_file_reader, start=1):
-                if line_number > current_limit:  # limit reached, create a new CSV file for the next partition
-                    partition_number += 1
-                    current_limit = row_limit * partition_number
-                    current_out_path = os.path.join(output_path, output_name_template % partition_number)
-                    new_csv_list.append(current_out_path)
-                    dest_csv.close()
-                    dest_csv = open(current_out_path, "w")
-                    current_partition_writer = csv.writer(dest_csv, delimiter=delimiter)
-                    if keep_headers:
-                        current_partition_writer.writerow(headers)
-
-                current_partition_writer.writerow(row)
-        finally:
-            if dest_csv and not dest_csv.closed:
+        new_csv_list, _ = partition_delimited_stream(
+            source_csv, os.path.dirname(file_path), delimiter, row_limit, output_name_template, keep_headers
+        )
+    return new_csv_list
+
+
+def partition_delimited_stream(
+    source_stream,
+    output_path: str,
+    delimiter=",",
+    row_limit=10000,
+    output_name_template="output_%s.csv",
+    keep_headers=True,
+    partition_complete_callback=None,
+):
+    """Same as partition_large_delimited_file, but reads from an open text stream such as a pipe.
+
+    Arguments (beyond those of partition_large_delimited_file):
+        `source_stream`: open text stream of delimited rows
+        `output_path`: directory in which to write the partitions
+        `partition_complete_callback`: called with each partition's path as soon as that partition is fully written,
+            so it can be processed while the rest of the stream is still being read
+
+    Returns the list of partition paths and the number of rows partitioned (excluding headers).
+    """
+    new_csv_list = []
+    original_csv_file_reader = csv.reader(source_stream, delimiter=delimiter)
+    partition_number = 1
+    current_out_path = os.path.join(output_path, output_name_template % partition_number)
+    new_csv_list.append(current_out_path)
+    dest_csv = None
+    line_number = 0
+    try:
+        dest_csv = open(current_out_path, "w")
+        current_partition_writer = csv.writer(dest_csv, delimiter=delimiter)
+        current_limit = row_limit
+
+        if keep_headers:
+            headers = next(original_csv_file_reader)
+            current_partition_writer.writerow(headers)
+
+        for line_number, row in enumerate(original_csv_file_reader, start=1):
+            if line_number > current_limit:  # limit reached, create a new CSV file for the next partition
+                partition_number += 1
+                current_limit = row_limit * partition_number
+                current_out_path = os.path.join(output_path, output_name_template % partition_number)
+                new_csv_list.append(current_out_path)
                 dest_csv.close()
+                if partition_complete_callback:
+                    partition_complete_callback(new_csv_list[-2])
+                dest_csv = open(current_out_path, "w")
+                current_partition_writer = csv.writer(dest_csv, delimiter=delimiter)
+                if keep_headers:
+                    current_partition_writer.writerow(headers)
 
-    return new_csv_list
+            current_partition_writer.writerow(row)
+    finally:
+        if dest_csv and not dest_csv.closed:
+            dest_csv.close()
+
+    if partition_complete_callback:
+        partition_complete_callback(new_csv_list[-1])
+
+    return new_csv_list, line_number
 
 
 def read_csv_file_as_list_of_dictionaries(file_path):
@@ -0,0 +1,105 @@
+"""
+Process-local memo for query results that only change when data is loaded (reference data, filter trees and the like).
+Every DataLoadCache empties itself when the latest data load date moves, which is checked at most once every
+DATA_LOAD_CACHE_CHECK_SECONDS per process, and when its contents are older than DATA_LOAD_CACHE_MAX_AGE_SECONDS to
+pick up any load that doesn't record a date.  Caches keyed on user input should set max_entries, past which the least
+recently used values are dropped.
+"""
+import threading
+import time
+
+from collections import OrderedDict
+from django.conf import settings
+from django.db.models import Max
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from usaspending_api.broker.models import ExternalDataLoadDate
+from usaspending_api.submissions.models import SubmissionAttributes
+
+_data_load_date = None
+_data_load_date_checked_at = None
+_data_load_date_lock = threading.Lock()
+
+_caches = []
+
+
+def get_data_load_date():
+    """The most recent of the external data load dates and submission updates, re-read every so often"""
+    global _data_load_date, _data_load_date_checked_at
+    now = time.monotonic()
+    if _data_load_date_checked_at is None or now - _data_load_date_checked_at >= settings.DATA_LOAD_CACHE_CHECK_SECONDS:
+        with _data_load_date_lock:
+            if (
+                _data_load_date_checked_at is None
+                or now - _data_load_date_checked_at >= settings.DATA_LOAD_CACHE_CHECK_SECONDS
+            ):
+                load_dates = [
+                    ExternalDataLoadDate.objects.aggregate(date=Max("last_load_date"))["date"],
+                    SubmissionAttributes.objects.aggregate(date=Max("update_date"))["date"],
+                ]
+                _data_load_date = max((date for date in load_dates if date is not None), default=None)
+                _data_load_date_checked_at = now
+    return _data_load_date
+
+
+class DataLoadCache:
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = max_entries
+        self._values = OrderedDict()
+        self._lock = threading.Lock()
+        self._data_load_date = None
+        self._filled_at = None
+        _caches.append(self)
+
+    def get(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Returns the cached value for key, calling fetch to get it on a miss"""
+        return self.get_many([key], lambda keys: {key: fetch()})[key]
+
+    def get_many(
+        self, keys: Iterable[Hashable], fetch_many: Callable[[list], Dict[Hashable, Any]]
+    ) -> Dict[Hashable, Any]:
+        """
+        Returns the cached values for keys, calling fetch_many once with every key that's missing.  fetch_many must
+        return a dictionary with a value for each of the keys it's given.
+        """
+        self._expire()
+        values = {}
+        missing = []
+        with self._lock:
+            for key in keys:
+                if key in self._values:
+                    self._values.move_to_end(key)
+                    values[key] = self._values[key]
+                else:
+                    missing.append(key)
+        if missing:
+            fetched = fetch_many(missing)
+            with self._lock:
+                self._values.update(fetched)
+                while self.max_entries is not None and len(self._values) > self.max_entries:
+                    self._values.popitem(last=False)
+            values.update(fetched)
+        return values
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values = OrderedDict()
+            self._filled_at = time.monotonic()
+
+    def _expire(self) -> None:
+        data_load_date = get_data_load_date()
+        if (
+            data_load_date != self._data_load_date
+            or self._filled_at is None
+            or time.monotonic() - self._filled_at >= settings.DATA_LOAD_CACHE_MAX_AGE_SECONDS
+        ):
+            self.clear()
+            self._data_load_date = data_load_date
+
+
+def clear_data_load_caches() -> None:
+    """Empties every DataLoadCache and forgets the data load date, for loaders and tests that change data under them"""
+    global _data_load_date_checked_at
+    _data_load_date_checked_at = None
+    for cache in _caches:
+        cache.clear()
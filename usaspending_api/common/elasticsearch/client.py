@@ -2,6 +2,8 @@ from typing import Union, Optional
 
 import certifi
 import logging
+import os
+import threading
 
 from django.conf import settings
 from elasticsearch import Elasticsearch
@@ -11,24 +13,50 @@ from ssl import CERT_NONE
 from elasticsearch_dsl.response import Response
 
 logger = logging.getLogger("console")
-CLIENT = None
 ElasticsearchResponse = Optional[Union[dict, Response]]
 
+ETL_TIMEOUT = 300
+
+_shared_clients = {}
+_shared_clients_lock = threading.Lock()
+
 
 def instantiate_elasticsearch_client() -> Elasticsearch:
-    es_kwargs = {"timeout": 300}
+    """Elasticsearch client for the ETL, which needs a much longer timeout than the API"""
+    return get_shared_es_client(timeout=ETL_TIMEOUT)
 
-    if "https" in settings.ES_HOSTNAME:
-        es_kwargs.update({"use_ssl": True, "verify_certs": True, "ca_certs": certifi.where()})
 
-    return Elasticsearch(settings.ES_HOSTNAME, **es_kwargs)
+def get_shared_es_client(timeout: Optional[int] = None) -> Elasticsearch:
+    """
+    Returns the Elasticsearch client shared by every caller in this process, creating it on first use.  Clients are
+    thread-safe and pool their connections, so there's no reason to pay for a new client (with its own connection
+    pool and SSL context) per query.  A forked child process gets a client of its own instead of its parent's sockets.
+    """
+    key = (os.getpid(), timeout or settings.ES_TIMEOUT)
+    client = _shared_clients.get(key)
+    if client is None:
+        with _shared_clients_lock:
+            client = _shared_clients.get(key)
+            if client is None:
+                client = create_es_client(timeout=key[1])
+                if client is not None:
+                    _shared_clients[key] = client
+    return client
 
 
-def create_es_client() -> Elasticsearch:
+def create_es_client(timeout: Optional[int] = None) -> Elasticsearch:
     if settings.ES_HOSTNAME is None or settings.ES_HOSTNAME == "":
         logger.error("env var 'ES_HOSTNAME' needs to be set for Elasticsearch connection")
-    global CLIENT
-    es_config = {"hosts": [settings.ES_HOSTNAME], "timeout": settings.ES_TIMEOUT}
+    es_config = {
+        "hosts": [settings.ES_HOSTNAME],
+        "timeout": timeout or settings.ES_TIMEOUT,
+        "maxsize": settings.ES_MAX_CONNECTIONS,
+        "sniff_on_start": settings.ES_SNIFF_ON_START,
+        "sniff_on_connection_fail": settings.ES_SNIFF_ON_CONNECTION_FAIL,
+        "sniffer_timeout": settings.ES_SNIFFER_TIMEOUT,
+    }
+    if not settings.ES_KEEP_ALIVE:
+        es_config["headers"] = {"connection": "close"}
     try:
         # If the connection string is using SSL with localhost, disable verifying
         # the certificates to allow testing in a development environment
@@ -42,7 +70,9 @@ def create_es_client() -> Elasticsearch:
             ssl_context.check_hostname = False
             ssl_context.verify_mode = CERT_NONE
             es_config["ssl_context"] = ssl_context
+        elif "https" in settings.ES_HOSTNAME:
+            es_config.update({"use_ssl": True, "verify_certs": True, "ca_certs": certifi.where()})
 
-        CLIENT = Elasticsearch(**es_config)
+        return Elasticsearch(**es_config)
     except Exception as e:
         logger.error("Error creating the elasticsearch client: {}".format(e))
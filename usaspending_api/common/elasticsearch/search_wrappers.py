@@ -1,17 +1,17 @@
 import logging
-from ssl import CERT_NONE
 
 from typing import Optional, Union
 
 from django.conf import settings
-from elasticsearch.connection import create_ssl_context
 from elasticsearch_dsl import Search
 from elasticsearch_dsl.response import Response
-from elasticsearch import ConnectionError, Elasticsearch
+from elasticsearch import ConnectionError
 from elasticsearch import ConnectionTimeout
 from elasticsearch import NotFoundError
 from elasticsearch import TransportError
 
+from usaspending_api.common.elasticsearch.client import get_shared_es_client
+
 logger = logging.getLogger("console")
 
 
@@ -19,33 +19,10 @@ class _Search(Search):
     _index_name = None
 
     def __init__(self, **kwargs) -> None:
-        client = self._create_es_client()
+        client = get_shared_es_client()
         kwargs.update({"index": self._index_name, "using": client})
         super().__init__(**kwargs)
 
-    @staticmethod
-    def _create_es_client() -> Elasticsearch:
-        if settings.ES_HOSTNAME is None or settings.ES_HOSTNAME == "":
-            logger.error("env var 'ES_HOSTNAME' needs to be set for Elasticsearch connection")
-        es_config = {"hosts": [settings.ES_HOSTNAME], "timeout": settings.ES_TIMEOUT}
-        try:
-            # If the connection string is using SSL with localhost, disable verifying
-            # the certificates to allow testing in a development environment
-            # Also allow host.docker.internal, when SSH-tunneling on localhost to a remote nonprod instance over HTTPS
-            if settings.ES_HOSTNAME.startswith(("https://localhost", "https://host.docker.internal")):
-                logger.warning("SSL cert verification is disabled. Safe only for local development")
-                import urllib3
-
-                urllib3.disable_warnings()
-                ssl_context = create_ssl_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = CERT_NONE
-                es_config["ssl_context"] = ssl_context
-
-            return Elasticsearch(**es_config)
-        except Exception as e:
-            logger.error("Error creating the elasticsearch client: {}".format(e))
-
     def _handle_execute_retry(self, retries: int, timeout: str) -> Optional[Union[Response, int]]:
         if retries > 20:
             retries = 20
@@ -1,8 +1,14 @@
+import copy
+import json
+
 from collections import OrderedDict
 from usaspending_api.search.filters.elasticsearch.naics import NaicsCodes
 from usaspending_api.search.filters.elasticsearch.tas import TasCodes
 from usaspending_api.search.filters.mixins.psc import PSCCodesMixin
 
+# Request fields that have no bearing on the response
+IGNORED_REQUEST_KEYS = ("auditTrail",)
+
 
 def upper_case_dict_values(input_dict):
     for key in input_dict:
@@ -76,3 +82,41 @@ def order_nested_object(nested_object):
         )
     else:
         return nested_object
+
+
+def request_fingerprint(request_data, defaults=()):
+    """
+    Canonical JSON for a request so requests that ask for the same thing look the same: fields that don't affect
+    the response are dropped, omitted fields are filled in from `defaults` (an iterable of (key path, value) pairs,
+    see CompiledTinyShield.defaults), repeated filter values are removed and keys and lists are sorted as they are
+    by order_nested_object.
+    """
+    canonical = {key: copy.deepcopy(value) for key, value in request_data.items() if key not in IGNORED_REQUEST_KEYS}
+    for key_path, default in defaults:
+        _set_default(canonical, key_path, default)
+    if isinstance(canonical.get("filters"), dict):
+        canonical["filters"] = _remove_duplicate_values(canonical["filters"])
+    return json.dumps(order_nested_object(canonical))
+
+
+def _set_default(data, key_path, default):
+    *parents, key = key_path
+    for parent in parents:
+        if not isinstance(data.get(parent, {}), dict):
+            return
+        data = data.setdefault(parent, {})
+    # Mirrors TinyShield, which treats an empty object the same as a missing one
+    if data.get(key, {}) == {}:
+        data[key] = copy.deepcopy(default)
+
+
+def _remove_duplicate_values(value):
+    """Filter values like ["A", "B", "A"] mean the same as ["A", "B"].  Positional lists (filter tree paths) are kept"""
+    if isinstance(value, dict):
+        return {key: _remove_duplicate_values(subvalue) for key, subvalue in value.items()}
+    elif isinstance(value, list):
+        if all(isinstance(item, (str, int, float)) for item in value):
+            # Keyed on type as well so 1, 1.0 and True aren't treated as duplicates of each other
+            return list({(type(item), item): item for item in value}.values())
+        return [_remove_duplicate_values(item) if isinstance(item, dict) else item for item in value]
+    return value
@@ -5,6 +5,8 @@ import logging
 import traceback
 from time import perf_counter  # Matches response time browsers return more accurately than now()
 
+from usaspending_api.routers.replicas import get_pinned_database
+
 
 def get_remote_addr(request):
     """ Get IP address of user making request can be used for other logging"""
@@ -36,6 +38,7 @@ class LoggingMiddleware(MiddlewareMixin):
       "remote_addr": "127.0.0.1", (IP address where request came from)
       "host": "localhost:8000", (Host name or IP address)
       "response_ms": "848", (Time it took to return a response or exception)
+      "database": "db_r1", (Database the request read from, null if it didn't read one)
       "message": "[11/01/18 22:52:03] [INFO] [POST] [/api/v2/download/count/ : 200]
                     [127.0.0.1] [localhost:8000] [848]",
       (message is [timestamp] [status] [method] [ path : status_code] [remote_addr] [host] [response_ms]
@@ -84,6 +87,7 @@ class LoggingMiddleware(MiddlewareMixin):
 
         self.log["status_code"] = status_code
         self.log["response_ms"] = self.get_response_ms()
+        self.log["database"] = get_pinned_database()
         self.log["traceback"] = None
         if response._headers:
             if "key" in response._headers and len(response._headers["key"]) >= 2:
@@ -133,6 +137,7 @@ class LoggingMiddleware(MiddlewareMixin):
 
         self.log["status_code"] = 500  # Unable to get status code from exception server return 500 as default
         self.log["response_ms"] = self.get_response_ms()
+        self.log["database"] = get_pinned_database()
         self.log["status"] = "ERROR"
         self.log["timestamp"] = now().strftime("%d/%m/%y %H:%M:%S")
         self.log["traceback"] = traceback.format_exc()
@@ -1,5 +1,6 @@
-from django.db.models import CharField, Expression
+from django.db.models import Case, CharField, Expression, IntegerField, Value, When
 from psycopg2.sql import Identifier, Literal, SQL
+from typing import Dict, Iterable
 from usaspending_api.common.helpers.sql_helpers import convert_composable_query_to_string
 from usaspending_api.recipient.models import RecipientLookup, RecipientProfile
 from usaspending_api.recipient.v2.lookups import SPECIAL_CASES
@@ -97,6 +98,44 @@ def combine_recipient_hash_and_level(recipient_hash, recipient_level):
     return f"{recipient_hash}-{recipient_level.upper()}"
 
 
+def fetch_recipient_ids(key_field: str, keys: Iterable[str]) -> Dict[str, str]:
+    """
+    Looks up the recipient id (recipient hash + recipient level) for a whole page of recipients in one query.
+    `key_field` is the RecipientProfile field the keys are matched against: "recipient_hash" or "recipient_unique_id".
+    In the recipient_profile table there is a 1 to 1 relationship between hashes and DUNS, but a recipient can have a
+    profile at more than one level; the child ("C") level is preferred, then standalone ("R"), then anything else.
+
+    Returns a dictionary of str(key) -> recipient id.  Keys with no matching profile are left out.
+    """
+    if key_field not in ("recipient_hash", "recipient_unique_id"):
+        raise ValueError(f"Unable to look up recipient ids by '{key_field}'")
+
+    keys = {str(key) for key in keys if key is not None}
+    if not keys:
+        return {}
+
+    profiles = (
+        RecipientProfile.objects.filter(**{f"{key_field}__in": keys})
+        .exclude(recipient_name__in=SPECIAL_CASES)
+        .annotate(
+            sort_order=Case(
+                When(recipient_level="C", then=Value(0)),
+                When(recipient_level="R", then=Value(1)),
+                default=Value(2),
+                output_field=IntegerField(),
+            )
+        )
+        .order_by(key_field, "sort_order")
+        .distinct(key_field)
+        .values(key_field, "recipient_hash", "recipient_level")
+    )
+
+    return {
+        str(profile[key_field]): combine_recipient_hash_and_level(profile["recipient_hash"], profile["recipient_level"])
+        for profile in profiles
+    }
+
+
 def _annotate_recipient_id(field_name, queryset, annotation_sql):
     """
     Add recipient id (recipient hash + recipient level) to a queryset.  The assumption here is that
@@ -0,0 +1,100 @@
+from django.core.cache import caches
+from unittest.mock import MagicMock
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+
+from usaspending_api.common import cache_decorator
+from usaspending_api.common.cache_decorator import LocalResponseCache, cache_response
+
+
+def test_local_response_cache_evicts_least_recently_used():
+    cache = LocalResponseCache(max_entries=2, max_bytes=1000, ttl=60)
+    cache.set("a", (b"aaa", 200, {}))
+    cache.set("b", (b"bbb", 200, {}))
+    assert cache.get("a") == (b"aaa", 200, {})
+    cache.set("c", (b"ccc", 200, {}))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+    assert cache.stats() == {"entries": 2, "bytes": 6, "hits": 3, "misses": 1, "evictions": 1}
+
+
+def test_local_response_cache_limits_bytes():
+    cache = LocalResponseCache(max_entries=10, max_bytes=10, ttl=60)
+    cache.set("a", (b"x" * 6, 200, {}))
+    cache.set("b", (b"x" * 6, 200, {}))
+    cache.set("too big", (b"x" * 11, 200, {}))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.get("too big") is None
+    assert cache.stats()["bytes"] == 6
+
+
+def test_local_response_cache_expires_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_decorator.time, "monotonic", lambda: now[0])
+    cache = LocalResponseCache(max_entries=10, max_bytes=1000, ttl=60)
+    cache.set("a", (b"aaa", 200, {}))
+    cache.set("b", (b"bbb", 200, {}), timeout=10)
+
+    now[0] += 30
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    now[0] += 31
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_local_response_cache_logs_stats(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_decorator.time, "monotonic", lambda: now[0])
+    logger = MagicMock()
+    monkeypatch.setattr(cache_decorator, "logger", logger)
+    cache = LocalResponseCache(max_entries=10, max_bytes=1000, ttl=600, stats_log_seconds=300)
+    cache.set("a", (b"aaa", 200, {}))
+
+    cache.get("a")
+    logger.info.assert_not_called()
+
+    now[0] += 300
+    cache.get("a")
+    cache.get("b")
+    logger.info.assert_called_once_with(
+        "Local response cache in process {}: {}".format(
+            cache_decorator.os.getpid(), {"entries": 1, "bytes": 3, "hits": 1, "misses": 0, "evictions": 0}
+        )
+    )
+
+
+def test_cache_response_tiers(monkeypatch, settings):
+    settings.LOCAL_RESPONSE_CACHE_MAX_ENTRIES = 10
+    local_cache = LocalResponseCache(max_entries=10, max_bytes=10000, ttl=60)
+    monkeypatch.setattr(cache_decorator, "get_local_response_cache", lambda: local_cache)
+    caches["default"].clear()
+    calls = []
+
+    class CountingView(APIView):
+        @cache_response(cache="default")
+        def get(self, request):
+            calls.append(request)
+            return Response({"calls": len(calls)})
+
+    view = CountingView.as_view()
+
+    def request():
+        return view(APIRequestFactory().get("/api/v2/test/"))
+
+    first = request()
+    assert first["Cache-Trace"] == "set-cache"
+    assert request()["Cache-Trace"] == "hit-local-cache"
+
+    local_cache.clear()
+    shared_hit = request()
+    assert shared_hit["Cache-Trace"] == "hit-cache"
+    assert shared_hit.content == first.rendered_content
+    assert shared_hit["Content-Type"] == first["Content-Type"]
+    assert request()["Cache-Trace"] == "hit-local-cache"
+    assert len(calls) == 1
@@ -0,0 +1,53 @@
+from usaspending_api.common import data_load_cache
+from usaspending_api.common.data_load_cache import DataLoadCache
+
+
+def test_data_load_cache(monkeypatch):
+    load_date = "2020-01-01"
+    monkeypatch.setattr(data_load_cache, "get_data_load_date", lambda: load_date)
+    fetched = []
+
+    def fetch_many(keys):
+        fetched.append(keys)
+        return {key: key.upper() for key in keys}
+
+    cache = DataLoadCache()
+    assert cache.get_many(["a", "b"], fetch_many) == {"a": "A", "b": "B"}
+    assert cache.get_many(["b", "c", "a"], fetch_many) == {"a": "A", "b": "B", "c": "C"}
+    assert cache.get("c", lambda: "not called") == "C"
+    assert fetched == [["a", "b"], ["c"]]
+
+    # A data load empties the cache
+    load_date = "2020-01-02"
+    assert cache.get("a", lambda: "reloaded") == "reloaded"
+
+
+def test_data_load_cache_max_age(monkeypatch, settings):
+    monkeypatch.setattr(data_load_cache, "get_data_load_date", lambda: None)
+    cache = DataLoadCache()
+    assert cache.get("a", lambda: 1) == 1
+    assert cache.get("a", lambda: 2) == 1
+
+    settings.DATA_LOAD_CACHE_MAX_AGE_SECONDS = 0
+    assert cache.get("a", lambda: 3) == 3
+
+
+def test_data_load_cache_max_entries(monkeypatch):
+    monkeypatch.setattr(data_load_cache, "get_data_load_date", lambda: None)
+    cache = DataLoadCache(max_entries=2)
+    cache.get("a", lambda: 1)
+    cache.get("b", lambda: 2)
+    cache.get("a", lambda: "not called")
+    cache.get("c", lambda: 3)
+
+    # The least recently used value is dropped
+    assert cache.get("b", lambda: 4) == 4
+    assert cache.get("c", lambda: "not called") == 3
+
+
+def test_clear_data_load_caches(monkeypatch):
+    monkeypatch.setattr(data_load_cache, "get_data_load_date", lambda: None)
+    cache = DataLoadCache()
+    cache.get("a", lambda: 1)
+    data_load_cache.clear_data_load_caches()
+    assert cache.get("a", lambda: 2) == 2
@@ -0,0 +1,31 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from usaspending_api.common.elasticsearch import client
+from usaspending_api.common.elasticsearch.search_wrappers import AwardSearch, TransactionSearch
+
+
+def test_get_shared_es_client(monkeypatch, settings):
+    settings.ES_HOSTNAME = "http://localhost:9200"
+    monkeypatch.setattr(client, "_shared_clients", {})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        clients = list(executor.map(lambda _: client.get_shared_es_client(), range(32)))
+
+    assert len({id(c) for c in clients}) == 1
+    assert client.get_shared_es_client(timeout=client.ETL_TIMEOUT) is not clients[0]
+    assert client.instantiate_elasticsearch_client() is client.get_shared_es_client(timeout=client.ETL_TIMEOUT)
+    assert TransactionSearch()._using is clients[0]
+    assert AwardSearch()._using is clients[0]
+
+
+def test_create_es_client_pool_settings(settings):
+    settings.ES_HOSTNAME = "http://localhost:9200"
+    settings.ES_MAX_CONNECTIONS = 25
+    settings.ES_KEEP_ALIVE = False
+
+    es_client = client.create_es_client()
+    connection = es_client.transport.connection_pool.connections[0]
+
+    assert connection.pool.pool.maxsize == 25
+    assert connection.headers["connection"] == "close"
+    assert es_client.transport.sniff_on_start is False
@@ -0,0 +1,76 @@
+from django.db import OperationalError, ProgrammingError
+
+from usaspending_api.awards.models import Award
+from usaspending_api.download.models import DownloadJob
+from usaspending_api.routers import replicas
+from usaspending_api.routers.replicas import ReadReplicaRouter, ReadReplicaPinningMiddleware
+
+
+class TwoReplicaRouter(ReadReplicaRouter):
+    read_replicas = ["db_r1", "db_r2"]
+
+
+def test_reads_skip_lagging_replicas(settings):
+    settings.DB_REPLICA_LAG_CHECK_SECONDS = 0
+    settings.DB_REPLICA_MAX_LAG_SECONDS = 60
+    router = TwoReplicaRouter()
+    router.record_sample("db_r1", 120.0, 0)
+    router.record_sample("db_r2", 0.0, 5)
+
+    assert {router.db_for_read(Award) for _ in range(20)} == {"db_r2"}
+    assert router.db_for_read(DownloadJob) == "default"
+
+    # A replica that can't be sampled is treated like one that's too far behind
+    router.record_sample("db_r2", None, None)
+    assert router.db_for_read(Award) == "default"
+
+    router.record_sample("db_r1", 10.0, 2)
+    assert router.db_for_read(Award) == "db_r1"
+
+    stats = router.stats()
+    assert stats["default"] == {"routed": 1, "fallbacks": 1}
+    assert stats["db_r1"] == {"routed": 1, "available": True, "lag_seconds": 10.0, "active_queries": 2}
+    assert stats["db_r2"] == {"routed": 20, "available": False, "lag_seconds": None, "active_queries": 0}
+
+
+def test_requests_are_pinned_to_one_database(settings):
+    settings.DB_REPLICA_LAG_CHECK_SECONDS = 0
+    router = TwoReplicaRouter()
+    middleware = ReadReplicaPinningMiddleware()
+
+    middleware.process_request(None)
+    database = router.db_for_read(Award)
+    assert {router.db_for_read(Award) for _ in range(20)} == {database}
+    assert replicas.get_pinned_database() == database
+    assert router.stats()[database]["routed"] == 1
+
+    middleware.process_response(None, None)
+    assert replicas.get_pinned_database() is None
+
+
+def test_failed_requests_take_unreachable_replicas_out_of_rotation(monkeypatch, settings):
+    settings.DB_REPLICA_LAG_CHECK_SECONDS = 0
+    router = TwoReplicaRouter()
+    monkeypatch.setattr(replicas, "get_read_replica_router", lambda: router)
+    monkeypatch.setattr(replicas, "_is_connected", lambda alias: False)
+    middleware = ReadReplicaPinningMiddleware()
+
+    # Errors that aren't about the connection leave the replica alone
+    middleware.process_request(None)
+    database = router.db_for_read(Award)
+    middleware.process_exception(None, ProgrammingError())
+    middleware.process_response(None, None)
+    assert router.stats()[database]["available"] is True
+
+    middleware.process_request(None)
+    database = router.db_for_read(Award)
+    middleware.process_exception(None, OperationalError())
+    middleware.process_response(None, None)
+    assert router.stats()[database]["available"] is False
+    assert {router.db_for_read(Award) for _ in range(20)} == {"db_r1", "db_r2"} - {database}
+
+
+def test_default_only_router(settings):
+    router = replicas.DefaultOnlyRouter()
+    assert router.db_for_read(Award) == "default"
+    assert router.stats() == {"default": {"routed": 0, "fallbacks": 0}}
@@ -2,7 +2,7 @@ import pytest
 
 from model_mommy import mommy
 
-from usaspending_api.common.recipient_lookups import obtain_recipient_uri
+from usaspending_api.common.recipient_lookups import fetch_recipient_ids, obtain_recipient_uri
 
 
 @pytest.fixture
@@ -101,3 +101,40 @@ def test_parent_recipient_with_id_and_name(recipient_lookup):
     }
     expected_result = "01c03484-d1bd-41cc-2aca-4b427a2d0611-P"
     assert obtain_recipient_uri(**child_recipient_parameters) == expected_result
+
+
+@pytest.mark.django_db
+def test_fetch_recipient_ids():
+    for level in ("P", "C", "R"):
+        mommy.make(
+            "recipient.RecipientProfile",
+            recipient_hash="01c03484-d1bd-41cc-2aca-4b427a2d0611",
+            recipient_unique_id="123",
+            recipient_level=level,
+        )
+    for level in ("P", "R"):
+        mommy.make(
+            "recipient.RecipientProfile",
+            recipient_hash="1c4e7c2a-efe3-1b7e-2190-6f4487f808ac",
+            recipient_unique_id="456",
+            recipient_level=level,
+        )
+    mommy.make(
+        "recipient.RecipientProfile",
+        recipient_hash="b2c8fe8e-b520-c47f-31e3-3620a358ce48",
+        recipient_unique_id="789",
+        recipient_level="R",
+        recipient_name="MULTIPLE RECIPIENTS",
+    )
+
+    assert fetch_recipient_ids("recipient_unique_id", ["123", "456", "789", "000", None]) == {
+        "123": "01c03484-d1bd-41cc-2aca-4b427a2d0611-C",
+        "456": "1c4e7c2a-efe3-1b7e-2190-6f4487f808ac-R",
+    }
+    assert fetch_recipient_ids("recipient_hash", ["1c4e7c2a-efe3-1b7e-2190-6f4487f808ac"]) == {
+        "1c4e7c2a-efe3-1b7e-2190-6f4487f808ac": "1c4e7c2a-efe3-1b7e-2190-6f4487f808ac-R"
+    }
+    assert fetch_recipient_ids("recipient_unique_id", []) == {}
+
+    with pytest.raises(ValueError):
+        fetch_recipient_ids("recipient_name", ["JOHN DOE"])
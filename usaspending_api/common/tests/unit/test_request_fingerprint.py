@@ -0,0 +1,69 @@
+from types import SimpleNamespace
+
+from usaspending_api.common.cache import GetPostQueryParamsKeyBit
+from usaspending_api.common.helpers.dict_helpers import request_fingerprint
+from usaspending_api.common.validator.tinyshield import CompiledTinyShield
+
+
+VALIDATOR = CompiledTinyShield(
+    [
+        {"name": "page", "key": "page", "type": "integer", "default": 1},
+        {"name": "limit", "key": "limit", "type": "integer", "default": 10},
+        {"name": "subawards", "key": "subawards", "type": "boolean", "default": False},
+        {"name": "naics_codes", "key": "filters|naics_codes", "type": "passthrough"},
+        {"name": "keywords", "key": "filters|keywords", "type": "array", "array_type": "text", "text_type": "search"},
+        {"name": "scope", "key": "filters|scope", "type": "text", "text_type": "search", "default": "domestic"},
+    ]
+)
+
+
+def test_request_fingerprint():
+    request = {
+        "filters": {
+            "keywords": ["b", "a", "b"],
+            "time_period": [{"start_date": "2020-01-01"}, {"start_date": "2019-01-01"}],
+            "naics_codes": {"require": [["11", "1111"], ["11"]]},
+        },
+        "auditTrail": "Download Button",
+    }
+    same_request = {
+        "limit": 10,
+        "filters": {
+            "scope": "domestic",
+            "naics_codes": {"require": [["11"], ["11", "1111"]]},
+            "time_period": [{"start_date": "2019-01-01"}, {"start_date": "2020-01-01"}],
+            "keywords": ["a", "b"],
+        },
+    }
+    assert request_fingerprint(request, VALIDATOR.defaults) == request_fingerprint(same_request, VALIDATOR.defaults)
+    assert request_fingerprint(request, VALIDATOR.defaults) != request_fingerprint({**same_request, "limit": 20})
+
+    # The request itself is left alone
+    assert request["auditTrail"] == "Download Button"
+    assert request["filters"]["keywords"] == ["b", "a", "b"]
+    assert "limit" not in request
+
+    # Positional filter tree values and values of different types aren't collapsed
+    assert request_fingerprint({"filters": {"naics_codes": {"require": [["11", "11"]]}}}) != request_fingerprint(
+        {"filters": {"naics_codes": {"require": [["11"]]}}}
+    )
+    assert request_fingerprint({"filters": {"codes": [1, True, 1.0]}}) != request_fingerprint(
+        {"filters": {"codes": [1]}}
+    )
+
+    # Defaults don't replace values of the wrong shape, they're left for validation to reject
+    assert request_fingerprint({"filters": ["scope"]}, VALIDATOR.defaults) == request_fingerprint(
+        {"filters": ["scope"], "page": 1, "limit": 10, "subawards": False}
+    )
+
+
+def test_cache_key_uses_view_defaults():
+    key_bit = GetPostQueryParamsKeyBit()
+
+    def key(view, data):
+        request = SimpleNamespace(query_params={}, data=data)
+        return key_bit.get_source_dict(None, view, None, request, None, None)
+
+    view = SimpleNamespace(request_validator=VALIDATOR)
+    assert key(view, {"page": 1, "subawards": False}) == key(view, {"limit": 10, "auditTrail": "x"})
+    assert key(object(), {"page": 1}) != key(object(), {})
@@ -187,7 +187,8 @@ def validate_object(rule):
 
 
 def validate_text(rule):
-    rule["min"] = rule.get("min") or 1
+    # An explicit min of 0 allows empty strings
+    rule["min"] = 1 if rule.get("min") is None else rule["min"]
     rule["max"] = rule.get("max") or MAX_ITEMS
     if type(rule["value"]) is not str:
         raise InvalidParameterException(INVALID_TYPE_MSG.format(**rule))
@@ -11,7 +11,7 @@ from usaspending_api.common.validator.helpers import validate_float
 from usaspending_api.common.validator.helpers import validate_integer
 from usaspending_api.common.validator.helpers import validate_object
 from usaspending_api.common.validator.helpers import validate_text
-from usaspending_api.common.validator.tinyshield import TinyShield
+from usaspending_api.common.validator.tinyshield import CompiledTinyShield, TinyShield
 
 
 ARRAY_RULE = {
@@ -140,6 +140,12 @@ def test_validate_integer():
 def test_validate_text():
     validate_text(TEXT_RULE)
 
+    rule = {"name": "test", "type": "text", "key": "test", "text_type": "raw", "value": " padded "}
+    assert validate_text(copy.copy(rule)) == " padded "
+    with pytest.raises(UnprocessableEntityException):
+        validate_text(dict(rule, value=""))
+    assert validate_text(dict(rule, value="", min=0)) == ""
+
 
 def test_validate_object():
     validate_object(OBJECT_RULE)
@@ -229,3 +235,32 @@ def test_any_rule():
     # Test with required 'value' missing.
     with pytest.raises(UnprocessableEntityException):
         TinyShield(models).block({"another_value": 2})
+
+
+def test_compiled_tinyshield():
+    models = copy.deepcopy(AWARD_FILTER) + [
+        {"name": "page", "key": "page", "type": "integer", "default": 1, "min": 1},
+        {
+            "name": "value",
+            "key": "value",
+            "type": "any",
+            "models": [{"type": "integer"}, {"type": "text", "text_type": "search"}],
+        },
+    ]
+    original_models = copy.deepcopy(models)
+    validator = CompiledTinyShield(models)
+    assert models == original_models
+
+    # Same results as a TinyShield built for the one request
+    assert validator.block(FILTER_OBJ) == TinyShield(copy.deepcopy(models)).block(FILTER_OBJ)
+
+    # One instance validates any number of requests without carrying values between them
+    assert validator.block({"page": 3, "value": "1"}) == {"page": 3, "value": 1}
+    assert validator.block({"value": "XYZ"}) == {"page": 1, "value": "XYZ"}
+    assert validator.block({}) == {"page": 1}
+    with pytest.raises(UnprocessableEntityException):
+        validator.block({"page": 0})
+
+    assert all("value" not in rule for rule in validator.rules)
+    assert all("value" not in model for rule in validator.rules for model in rule.get("models", []))
+    assert models == original_models
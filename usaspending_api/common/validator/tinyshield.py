@@ -54,10 +54,12 @@ VALIDATORS = {
 # util function. In later iterations, we will need to add GET decorators that handle the GET data
 # somewhat differently.
 def validate_post_request(model_list):
+    validator = CompiledTinyShield(model_list)
+
     def class_based_decorator(ClassBasedView):
         def view_func(function):
             def wrap(request, *args, **kwargs):
-                request = validation_function(request, model_list)
+                request = validation_function(request, validator)
                 return function(request, *args, **kwargs)
 
             return wrap
@@ -70,7 +72,10 @@ def validate_post_request(model_list):
 
 # Main entrypoint
 def validation_function(request, model_list):
-    new_request_data = TinyShield(copy.deepcopy(model_list)).block(request.data)
+    if isinstance(model_list, CompiledTinyShield):
+        new_request_data = model_list.block(request.data)
+    else:
+        new_request_data = TinyShield(copy.deepcopy(model_list)).block(request.data)
     if hasattr(request.data, "_mutable"):
         mutable = request.data._mutable
         request.data._mutable = True
@@ -238,29 +243,37 @@ class TinyShield:
 
     def parse_request(self, request):
         for item in self.rules:
-            # Loop through the request to find the expected key
-            value = request
-            for subkey in item["key"].split(TINY_SHIELD_SEPARATOR):
-                value = value.get(subkey, {})
-            if value != {}:
-                # Key found in provided request dictionary, use the value
-                item["value"] = value
-            elif item["optional"] is False:
-                # If the value is required, raise exception since key wasn't found
-                raise UnprocessableEntityException("Missing value: '{}' is a required field".format(item["key"]))
-            elif "default" in item:
-                # If value wasn't found, and this is optional, use the default
-                item["value"] = item["default"]
-            else:
-                # This model/field is optional, no value provided, and no default value.
-                # Use the "hidden" feature Ellipsis since None can be a valid value provided in the request
-                item["value"] = ...
+            item["value"] = self.get_request_value(item, request)
+
+    @staticmethod
+    def get_request_value(item, request):
+        # Loop through the request to find the expected key
+        value = request
+        for subkey in item["key"].split(TINY_SHIELD_SEPARATOR):
+            value = value.get(subkey, {})
+        if value != {}:
+            # Key found in provided request dictionary, use the value
+            return value
+        elif item["optional"] is False:
+            # If the value is required, raise exception since key wasn't found
+            raise UnprocessableEntityException("Missing value: '{}' is a required field".format(item["key"]))
+        elif "default" in item:
+            # If value wasn't found, and this is optional, use the default
+            return item["default"]
+        else:
+            # This model/field is optional, no value provided, and no default value.
+            # Use the "hidden" feature Ellipsis since None can be a valid value provided in the request
+            return ...
 
     def enforce_rules(self):
-        for item in self.rules:
+        self.enforce_rules_on(self.rules, self.data)
+
+    def enforce_rules_on(self, rules, data):
+        for item in rules:
             if item["value"] != ...:
                 struct = item["key"].split(TINY_SHIELD_SEPARATOR)
-                self.recurse_append(struct, self.data, self.apply_rule(item))
+                self.recurse_append(struct, data, self.apply_rule(item))
+        return data
 
     def apply_rule(self, rule):
         _return = None
@@ -309,7 +322,8 @@ class TinyShield:
             _return = object_result
         # Any is a "special" type since it is is really a collection of other rules.
         elif rule["type"] == "any":
-            for child_rule in rule["models"]:
+            for child_model in rule["models"]:
+                child_rule = copy.copy(child_model)
                 child_rule["value"] = rule["value"]
                 try:
                     # First successful rule wins.
@@ -357,3 +371,31 @@ class TinyShield:
             else:
                 mydict[level] = {}
                 self.recurse_append(struct, mydict[level], data)
+
+
+class CompiledTinyShield(TinyShield):
+    """
+    A TinyShield whose model list is copied and checked once, when it is created, rather than on every request.
+    Validation works on per-request copies of the checked rules, so a single instance (typically a module level
+    constant next to the view that uses it) can validate any number of requests, concurrently if need be:
+
+        SPENDING_VALIDATOR = CompiledTinyShield(AWARD_FILTER + PAGINATION)
+
+        validated = SPENDING_VALIDATOR.block(request.data)
+
+    The model list passed in is never modified, so shared models like AWARD_FILTER don't need a deepcopy first.
+    `defaults` holds the (key path, default value) of every optional rule with a default.
+    """
+
+    def __init__(self, model_list):
+        super().__init__(copy.deepcopy(model_list))
+        self.rules = tuple(self.rules)
+        self.defaults = tuple(
+            (tuple(rule["key"].split(TINY_SHIELD_SEPARATOR)), rule["default"])
+            for rule in self.rules
+            if rule["optional"] and "default" in rule
+        )
+
+    def block(self, request):
+        rules = [dict(rule, value=self.get_request_value(rule, request)) for rule in self.rules]
+        return self.enforce_rules_on(rules, {})
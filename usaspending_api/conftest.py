@@ -10,6 +10,7 @@ from django.db import connections
 from django.test import override_settings
 from pathlib import Path
 
+from usaspending_api.common.data_load_cache import clear_data_load_caches
 from usaspending_api.common.elasticsearch.elasticsearch_sql_helpers import (
     ensure_view_exists,
     ensure_business_categories_functions_exist,
@@ -272,6 +273,12 @@ def broker_server_dblink_setup(django_db_blocker, broker_db_setup):
         ensure_broker_server_dblink_exists()
 
 
+@pytest.fixture(autouse=True)
+def empty_data_load_caches():
+    """Each test loads its own data, which cached query results from an earlier test know nothing about"""
+    clear_data_load_caches()
+
+
 @pytest.fixture
 def temp_file_path():
     """
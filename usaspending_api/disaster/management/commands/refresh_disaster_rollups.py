@@ -0,0 +1,32 @@
+import logging
+
+from datetime import datetime
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from usaspending_api.disaster.models import refresh_disaster_rollups
+
+
+logger = logging.getLogger("script")
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the File B and C disaster rollups read by the disaster endpoints.  load_submission keeps them up "
+        "to date for the submissions it loads, so this is only needed to fill them initially or after File B or C "
+        "rows are changed some other way."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--submission-ids",
+            nargs="+",
+            type=int,
+            help="Only rebuild the rollups of these submissions.  All submissions are rebuilt by default.",
+        )
+
+    def handle(self, *args, **options):
+        start_time = datetime.now()
+        with transaction.atomic():
+            refresh_disaster_rollups(options["submission_ids"])
+        logger.info(f"Refreshed disaster rollups in {datetime.now() - start_time}")
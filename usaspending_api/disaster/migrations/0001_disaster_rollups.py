@@ -0,0 +1,52 @@
+# Generated by Django 2.2.28 on 2026-10-18 04:05
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('references', '0048_drop_old_gtas'),
+        ('submissions', '0010_auto_20200623_1702'),
+        ('accounts', '0005_delete_appropriationaccountbalancesquarterly'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DisasterFileCRollup',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('transaction_obligated_amount', models.DecimalField(decimal_places=2, max_digits=23, null=True)),
+                ('gross_outlay_amount_by_award_cpe', models.DecimalField(decimal_places=2, max_digits=23, null=True)),
+                ('disaster_emergency_fund', models.ForeignKey(db_column='disaster_emergency_fund_code', on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='references.DisasterEmergencyFundCode')),
+                ('submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='submissions.SubmissionAttributes')),
+                ('treasury_account', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='accounts.TreasuryAppropriationAccount')),
+            ],
+            options={
+                'db_table': 'disaster_file_c_rollup',
+                'managed': True,
+                'index_together': {('disaster_emergency_fund', 'submission')},
+            },
+        ),
+        migrations.CreateModel(
+            name='DisasterFileBRollup',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('obligations_incurred_by_program_object_class_cpe', models.DecimalField(decimal_places=2, max_digits=23, null=True)),
+                ('gross_outlay_amount_by_program_object_class_cpe', models.DecimalField(decimal_places=2, max_digits=23, null=True)),
+                ('row_count', models.IntegerField()),
+                ('disaster_emergency_fund', models.ForeignKey(db_column='disaster_emergency_fund_code', on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='references.DisasterEmergencyFundCode')),
+                ('object_class', models.ForeignKey(null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='references.ObjectClass')),
+                ('submission', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='submissions.SubmissionAttributes')),
+                ('treasury_account', models.ForeignKey(null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='accounts.TreasuryAppropriationAccount')),
+            ],
+            options={
+                'db_table': 'disaster_file_b_rollup',
+                'managed': True,
+                'index_together': {('disaster_emergency_fund', 'submission')},
+            },
+        ),
+    ]
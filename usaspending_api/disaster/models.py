@@ -0,0 +1,142 @@
+from django.db import models, connection
+
+
+class DisasterFileBRollup(models.Model):
+    """
+    Agency File B rows with a DEFC, summed by submission, TAS, object class and DEFC so the disaster endpoints don't
+    have to aggregate FinancialAccountsByProgramActivityObjectClass on every request.  Only rows with a non-zero
+    obligation or outlay are included, which is the same filter every one of those endpoints applies to File B.
+    Rows are kept by submission so the latest closed period filters can still be applied when querying.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    submission = models.ForeignKey("submissions.SubmissionAttributes", models.CASCADE, related_name="+")
+    treasury_account = models.ForeignKey(
+        "accounts.TreasuryAppropriationAccount", models.CASCADE, null=True, related_name="+"
+    )
+    object_class = models.ForeignKey("references.ObjectClass", models.DO_NOTHING, null=True, related_name="+")
+    disaster_emergency_fund = models.ForeignKey(
+        "references.DisasterEmergencyFundCode",
+        models.DO_NOTHING,
+        db_column="disaster_emergency_fund_code",
+        related_name="+",
+    )
+    obligations_incurred_by_program_object_class_cpe = models.DecimalField(max_digits=23, decimal_places=2, null=True)
+    gross_outlay_amount_by_program_object_class_cpe = models.DecimalField(max_digits=23, decimal_places=2, null=True)
+    # Number of File B rows summed.  GTAS totals are joined to each File B row, so they're multiplied by this.
+    row_count = models.IntegerField()
+
+    class Meta:
+        managed = True
+        db_table = "disaster_file_b_rollup"
+        index_together = (("disaster_emergency_fund", "submission"),)
+
+    REFRESH_SQL = """
+        INSERT INTO disaster_file_b_rollup (
+            submission_id,
+            treasury_account_id,
+            object_class_id,
+            disaster_emergency_fund_code,
+            obligations_incurred_by_program_object_class_cpe,
+            gross_outlay_amount_by_program_object_class_cpe,
+            row_count
+        )
+        SELECT
+            submission_id,
+            treasury_account_id,
+            object_class_id,
+            disaster_emergency_fund_code,
+            SUM(obligations_incurred_by_program_object_class_cpe),
+            SUM(gross_outlay_amount_by_program_object_class_cpe),
+            COUNT(*)
+        FROM
+            financial_accounts_by_program_activity_object_class
+        WHERE
+            disaster_emergency_fund_code IS NOT NULL AND
+            (
+                obligations_incurred_by_program_object_class_cpe <> 0 OR
+                gross_outlay_amount_by_program_object_class_cpe <> 0
+            )
+            {submission_filter}
+        GROUP BY
+            submission_id,
+            treasury_account_id,
+            object_class_id,
+            disaster_emergency_fund_code"""
+
+    @classmethod
+    def refresh(cls, submission_ids=None):
+        _refresh_rollup(cls._meta.db_table, cls.REFRESH_SQL, submission_ids)
+
+
+class DisasterFileCRollup(models.Model):
+    """
+    Agency File C rows with a DEFC, summed by submission, TAS and DEFC so the disaster endpoints don't have to
+    aggregate FinancialAccountsByAwards on every request.  Rows are kept by submission so the latest closed period
+    filters can still be applied when querying.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    submission = models.ForeignKey("submissions.SubmissionAttributes", models.CASCADE, related_name="+")
+    treasury_account = models.ForeignKey(
+        "accounts.TreasuryAppropriationAccount", models.CASCADE, null=True, related_name="+"
+    )
+    disaster_emergency_fund = models.ForeignKey(
+        "references.DisasterEmergencyFundCode",
+        models.DO_NOTHING,
+        db_column="disaster_emergency_fund_code",
+        related_name="+",
+    )
+    transaction_obligated_amount = models.DecimalField(max_digits=23, decimal_places=2, null=True)
+    gross_outlay_amount_by_award_cpe = models.DecimalField(max_digits=23, decimal_places=2, null=True)
+
+    class Meta:
+        managed = True
+        db_table = "disaster_file_c_rollup"
+        index_together = (("disaster_emergency_fund", "submission"),)
+
+    REFRESH_SQL = """
+        INSERT INTO disaster_file_c_rollup (
+            submission_id,
+            treasury_account_id,
+            disaster_emergency_fund_code,
+            transaction_obligated_amount,
+            gross_outlay_amount_by_award_cpe
+        )
+        SELECT
+            submission_id,
+            treasury_account_id,
+            disaster_emergency_fund_code,
+            SUM(transaction_obligated_amount),
+            SUM(gross_outlay_amount_by_award_cpe)
+        FROM
+            financial_accounts_by_awards
+        WHERE
+            disaster_emergency_fund_code IS NOT NULL
+            {submission_filter}
+        GROUP BY
+            submission_id,
+            treasury_account_id,
+            disaster_emergency_fund_code"""
+
+    @classmethod
+    def refresh(cls, submission_ids=None):
+        _refresh_rollup(cls._meta.db_table, cls.REFRESH_SQL, submission_ids)
+
+
+def _refresh_rollup(table, refresh_sql, submission_ids):
+    """Rebuilds the rollup rows of the submissions, or of every submission if submission_ids is None"""
+    with connection.cursor() as cursor:
+        if submission_ids is None:
+            cursor.execute(f"DELETE FROM {table}")
+            cursor.execute(refresh_sql.format(submission_filter=""))
+        elif submission_ids:
+            submission_ids = list(submission_ids)
+            cursor.execute(f"DELETE FROM {table} WHERE submission_id = ANY(%s)", [submission_ids])
+            cursor.execute(refresh_sql.format(submission_filter="AND submission_id = ANY(%s)"), [submission_ids])
+
+
+def refresh_disaster_rollups(submission_ids=None):
+    """Rebuilds the File B and C disaster rollups of the submissions, or all of them if submission_ids is None"""
+    DisasterFileBRollup.refresh(submission_ids)
+    DisasterFileCRollup.refresh(submission_ids)
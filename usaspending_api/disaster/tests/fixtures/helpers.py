@@ -3,10 +3,15 @@ import json
 import pytest
 import usaspending_api.common.helpers.fiscal_year_helpers
 
+from usaspending_api.disaster.models import refresh_disaster_rollups
+
 
 class Helpers:
     @staticmethod
     def post_for_spending_endpoint(client, url, **kwargs):
+        # Fixtures create File B and C rows directly rather than loading submissions, so roll them up here
+        refresh_disaster_rollups()
+
         request_body = {}
         filters = {}
         pagination = {}
@@ -0,0 +1,72 @@
+import pytest
+
+from decimal import Decimal
+from model_mommy import mommy
+
+from usaspending_api.disaster.models import DisasterFileBRollup, DisasterFileCRollup, refresh_disaster_rollups
+
+
+@pytest.fixture
+def file_b_and_c_rows():
+    defc_m = mommy.make("references.DisasterEmergencyFundCode", code="M")
+    tas = mommy.make("accounts.TreasuryAppropriationAccount", treasury_account_identifier=1)
+    sub1 = mommy.make("submissions.SubmissionAttributes", submission_id=1)
+    sub2 = mommy.make("submissions.SubmissionAttributes", submission_id=2)
+    for sub, obligation, outlay in ((sub1, 10, 1), (sub1, 20, 2), (sub1, 0, 0), (sub2, 40, 4)):
+        mommy.make(
+            "financial_activities.FinancialAccountsByProgramActivityObjectClass",
+            submission=sub,
+            treasury_account=tas,
+            disaster_emergency_fund=defc_m,
+            obligations_incurred_by_program_object_class_cpe=obligation,
+            gross_outlay_amount_by_program_object_class_cpe=outlay,
+        )
+        mommy.make(
+            "awards.FinancialAccountsByAwards",
+            submission=sub,
+            treasury_account=tas,
+            disaster_emergency_fund=defc_m,
+            transaction_obligated_amount=obligation,
+            gross_outlay_amount_by_award_cpe=outlay,
+        )
+    mommy.make(
+        "financial_activities.FinancialAccountsByProgramActivityObjectClass",
+        submission=sub1,
+        treasury_account=tas,
+        obligations_incurred_by_program_object_class_cpe=1000,
+        gross_outlay_amount_by_program_object_class_cpe=100,
+    )
+
+
+def _file_b_rollup():
+    return list(
+        DisasterFileBRollup.objects.order_by("submission_id").values_list(
+            "submission_id",
+            "obligations_incurred_by_program_object_class_cpe",
+            "gross_outlay_amount_by_program_object_class_cpe",
+            "row_count",
+        )
+    )
+
+
+@pytest.mark.django_db
+def test_refresh_all_submissions(file_b_and_c_rows):
+    refresh_disaster_rollups()
+
+    # Rows without a DEFC and File B rows without an obligation or outlay are left out
+    assert _file_b_rollup() == [(1, Decimal("30.00"), Decimal("3.00"), 2), (2, Decimal("40.00"), Decimal("4.00"), 1)]
+    assert list(
+        DisasterFileCRollup.objects.order_by("submission_id").values_list(
+            "submission_id", "transaction_obligated_amount", "gross_outlay_amount_by_award_cpe"
+        )
+    ) == [(1, Decimal("30.00"), Decimal("3.00")), (2, Decimal("40.00"), Decimal("4.00"))]
+
+
+@pytest.mark.django_db
+def test_refresh_some_submissions(file_b_and_c_rows):
+    refresh_disaster_rollups([1])
+    assert _file_b_rollup() == [(1, Decimal("30.00"), Decimal("3.00"), 2)]
+
+    DisasterFileBRollup.objects.update(row_count=99)
+    refresh_disaster_rollups([1, 2])
+    assert _file_b_rollup() == [(1, Decimal("30.00"), Decimal("3.00"), 2), (2, Decimal("40.00"), Decimal("4.00"), 1)]
@@ -9,19 +9,19 @@ from django.db.models.functions import Coalesce
 from django.views.decorators.csrf import csrf_exempt
 from rest_framework.response import Response
 
-from usaspending_api.awards.models import FinancialAccountsByAwards
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.helpers.generic_helper import get_pagination_metadata
+from usaspending_api.disaster.models import DisasterFileBRollup, DisasterFileCRollup
 from usaspending_api.disaster.v2.views.disaster_base import (
     DisasterBase,
     PaginationMixin,
     SpendingMixin,
+    rollup_total_budgetary_resources,
 )
 from usaspending_api.disaster.v2.views.elasticsearch_base import (
     ElasticsearchDisasterBase,
     ElasticsearchSpendingPaginationMixin,
 )
-from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
 
 
 logger = logging.getLogger(__name__)
@@ -77,12 +77,6 @@ class SpendingByAgencyViewSet(PaginationMixin, SpendingMixin, DisasterBase):
     @property
     def total_queryset(self):
         filters = [
-            Q(
-                Q(obligations_incurred_by_program_object_class_cpe__gt=0)
-                | Q(obligations_incurred_by_program_object_class_cpe__lt=0)
-                | Q(gross_outlay_amount_by_program_object_class_cpe__gt=0)
-                | Q(gross_outlay_amount_by_program_object_class_cpe__lt=0)
-            ),
             Q(disaster_emergency_fund__in=self.def_codes),
             Q(treasury_account__isnull=False),
             Q(treasury_account__funding_toptier_agency__isnull=False),
@@ -120,13 +114,11 @@ class SpendingByAgencyViewSet(PaginationMixin, SpendingMixin, DisasterBase):
                 ),
                 0,
             ),
-            "total_budgetary_resources": Coalesce(
-                Sum("treasury_account__gtas__budget_authority_appropriation_amount_cpe"), 0
-            ),
+            "total_budgetary_resources": rollup_total_budgetary_resources(),
         }
 
         return (
-            FinancialAccountsByProgramActivityObjectClass.objects.filter(*filters)
+            DisasterFileBRollup.objects.filter(*filters)
             .values(
                 "treasury_account__funding_toptier_agency",
                 "treasury_account__funding_toptier_agency__toptier_code",
@@ -166,7 +158,7 @@ class SpendingByAgencyViewSet(PaginationMixin, SpendingMixin, DisasterBase):
         }
 
         return (
-            FinancialAccountsByAwards.objects.filter(*filters)
+            DisasterFileCRollup.objects.filter(*filters)
             .values(
                 "treasury_account__funding_toptier_agency__agency",
                 "treasury_account__funding_toptier_agency__toptier_code",
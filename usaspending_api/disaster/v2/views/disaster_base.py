@@ -1,6 +1,6 @@
 import json
 from datetime import datetime, timezone, date
-from django.db.models import Max, Q, F, Value, Case, When, Sum
+from django.db.models import Max, Q, F, Value, Case, When, Sum, ExpressionWrapper, DecimalField
 from django.db.models.functions import Coalesce, Concat
 from django.http import HttpRequest
 from django.utils.functional import cached_property
@@ -29,6 +29,22 @@ def latest_gtas_of_each_year_queryset():
     return GTASSF133Balances.objects.filter(q)
 
 
+def rollup_total_budgetary_resources():
+    """
+    GTAS budgetary resources of the TAS, summed once for every File B row in a DisasterFileBRollup row to give the
+    same total as joining GTAS to File B itself
+    """
+    return Coalesce(
+        Sum(
+            ExpressionWrapper(
+                F("row_count") * F("treasury_account__gtas__budget_authority_appropriation_amount_cpe"),
+                output_field=DecimalField(max_digits=23, decimal_places=2),
+            )
+        ),
+        0,
+    )
+
+
 def latest_faba_of_each_year_queryset() -> FinancialAccountsByAwards:
     q = filter_by_latest_closed_periods()
     if not q:
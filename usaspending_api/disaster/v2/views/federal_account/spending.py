@@ -2,17 +2,17 @@ from django.db.models import Q, Sum, Count, F, Value, DecimalField, Case, When
 from django.db.models.functions import Coalesce
 from rest_framework.response import Response
 
-from usaspending_api.awards.models import FinancialAccountsByAwards
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.data_classes import Pagination
 from usaspending_api.common.helpers.generic_helper import get_pagination_metadata
 from usaspending_api.disaster.v2.views.federal_account.federal_account_result import FedAcctResults, FedAccount, TAS
+from usaspending_api.disaster.models import DisasterFileBRollup, DisasterFileCRollup
 from usaspending_api.disaster.v2.views.disaster_base import (
     DisasterBase,
     PaginationMixin,
     SpendingMixin,
+    rollup_total_budgetary_resources,
 )
-from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
 
 
 def construct_response(results: list, pagination: Pagination):
@@ -44,12 +44,6 @@ class SpendingViewSet(PaginationMixin, SpendingMixin, DisasterBase):
     @property
     def total_queryset(self):
         filters = [
-            Q(
-                Q(obligations_incurred_by_program_object_class_cpe__gt=0)
-                | Q(obligations_incurred_by_program_object_class_cpe__lt=0)
-                | Q(gross_outlay_amount_by_program_object_class_cpe__gt=0)
-                | Q(gross_outlay_amount_by_program_object_class_cpe__lt=0)
-            ),
             Q(disaster_emergency_fund__in=self.def_codes),
             Q(treasury_account__isnull=False),
             Q(treasury_account__federal_account__isnull=False),
@@ -88,15 +82,13 @@ class SpendingViewSet(PaginationMixin, SpendingMixin, DisasterBase):
                 ),
                 0,
             ),
-            "total_budgetary_resources": Coalesce(
-                Sum("treasury_account__gtas__budget_authority_appropriation_amount_cpe"), 0
-            ),
+            "total_budgetary_resources": rollup_total_budgetary_resources(),
         }
 
         # Assuming it is more performant to fetch all rows once rather than
         #  run a count query and fetch only a page's worth of results
         return (
-            FinancialAccountsByProgramActivityObjectClass.objects.filter(*filters)
+            DisasterFileBRollup.objects.filter(*filters)
             .values(
                 "treasury_account__federal_account__id",
                 "treasury_account__federal_account__federal_account_code",
@@ -139,7 +131,7 @@ class SpendingViewSet(PaginationMixin, SpendingMixin, DisasterBase):
         # Assuming it is more performant to fetch all rows once rather than
         #  run a count query and fetch only a page's worth of results
         return (
-            FinancialAccountsByAwards.objects.filter(*filters)
+            DisasterFileCRollup.objects.filter(*filters)
             .values(
                 "treasury_account__federal_account__id",
                 "treasury_account__federal_account__federal_account_code",
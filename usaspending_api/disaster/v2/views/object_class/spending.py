@@ -6,6 +6,7 @@ from usaspending_api.awards.models import FinancialAccountsByAwards
 from usaspending_api.common.cache_decorator import cache_response
 from usaspending_api.common.data_classes import Pagination
 from usaspending_api.common.helpers.generic_helper import get_pagination_metadata
+from usaspending_api.disaster.models import DisasterFileBRollup
 from usaspending_api.disaster.v2.views.object_class.object_class_result import (
     ObjectClassResults,
     MajorClass,
@@ -16,7 +17,6 @@ from usaspending_api.disaster.v2.views.disaster_base import (
     PaginationMixin,
     SpendingMixin,
 )
-from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
 
 
 def construct_response(results: list, pagination: Pagination, strip_total_budgetary_resources=True):
@@ -49,12 +49,6 @@ class ObjectClassSpendingViewSet(PaginationMixin, SpendingMixin, DisasterBase):
     @property
     def total_queryset(self):
         filters = [
-            Q(
-                Q(obligations_incurred_by_program_object_class_cpe__gt=0)
-                | Q(obligations_incurred_by_program_object_class_cpe__lt=0)
-                | Q(gross_outlay_amount_by_program_object_class_cpe__gt=0)
-                | Q(gross_outlay_amount_by_program_object_class_cpe__lt=0)
-            ),
             Q(disaster_emergency_fund__in=self.def_codes),
             Q(object_class__isnull=False),
             self.all_closed_defc_submissions,
@@ -92,7 +86,7 @@ class ObjectClassSpendingViewSet(PaginationMixin, SpendingMixin, DisasterBase):
         # Assuming it is more performant to fetch all rows once rather than
         #  run a count query and fetch only a page's worth of results
         return (
-            FinancialAccountsByProgramActivityObjectClass.objects.filter(*filters)
+            DisasterFileBRollup.objects.filter(*filters)
             .values("object_class__major_object_class", "object_class__major_object_class_name",)
             .annotate(**annotations)
             .values(*annotations.keys())
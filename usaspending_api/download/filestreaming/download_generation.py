@@ -1,7 +1,9 @@
+import io
 import json
 import logging
 import multiprocessing
 import os
+import queue
 from pathlib import Path
 from typing import Optional
 
@@ -13,12 +15,16 @@ import tempfile
 import time
 import traceback
 
+from collections import namedtuple
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from django.conf import settings
+from filelock import FileLock, Timeout as FileLockTimeout
+from threading import Thread
 
 from usaspending_api.awards.v2.filters.filter_helpers import add_date_range_comparison_types
 from usaspending_api.awards.v2.lookups.lookups import contract_type_mapping, assistance_type_mapping, idv_type_mapping
-from usaspending_api.common.csv_helpers import count_rows_in_delimited_file, partition_large_delimited_file
+from usaspending_api.common.csv_helpers import partition_delimited_stream, partition_large_delimited_file
 from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.helpers.orm_helpers import generate_raw_quoted_query
 from usaspending_api.common.helpers.s3_helpers import multipart_upload
@@ -40,6 +46,8 @@ WAIT_FOR_PROCESS_SLEEP = 5
 
 logger = logging.getLogger(__name__)
 
+PreparedSource = namedtuple("PreparedSource", ["source", "data_file_name", "temp_file", "temp_file_path"])
+
 
 def generate_download(download_job: DownloadJob, origination: Optional[str] = None):
     """Create data archive files from the download job object"""
@@ -69,18 +77,26 @@ def generate_download(download_job: DownloadJob, origination: Optional[str] = No
 
         # Generate sources from the JSON request object
         sources = get_download_sources(json_request, origination)
-        for source in sources:
-            # Parse and write data to the file; if there are no matching columns for a source then add an empty file
-            source_column_count = len(source.columns(columns))
-            if source_column_count == 0:
-                create_empty_data_file(
-                    source, download_job, working_dir, piid, assistance_id, zip_file_path, file_format
-                )
-            else:
-                download_job.number_of_columns += source_column_count
-                parse_source(
-                    source, columns, download_job, working_dir, piid, assistance_id, zip_file_path, limit, file_format
-                )
+        prepared_sources = []
+        try:
+            for source in sources:
+                # Parse and write data to the file; if there are no matching columns for a source then add an empty file
+                source_column_count = len(source.columns(columns))
+                if source_column_count == 0:
+                    create_empty_data_file(
+                        source, download_job, working_dir, piid, assistance_id, zip_file_path, file_format
+                    )
+                else:
+                    download_job.number_of_columns += source_column_count
+                    prepared_sources.append(
+                        prepare_source(source, columns, download_job, piid, assistance_id, limit, file_format)
+                    )
+            generate_source_files(prepared_sources, download_job, working_dir, zip_file_path, file_format)
+        finally:
+            # Remove temporary files
+            for prepared_source in prepared_sources:
+                os.close(prepared_source.temp_file)
+                os.remove(prepared_source.temp_file_path)
         include_data_dictionary = json_request.get("include_data_dictionary")
         if include_data_dictionary:
             add_data_dictionary_to_zip(working_dir, zip_file_path)
@@ -237,15 +253,14 @@ def build_data_file_name(source, download_job, piid, assistance_id):
     return data_file_name
 
 
-def parse_source(source, columns, download_job, working_dir, piid, assistance_id, zip_file_path, limit, file_format):
-    """Write to delimited text file(s) and zip file(s) using the source data"""
+def prepare_source(source, columns, download_job, piid, assistance_id, limit, file_format):
+    """Generate the export query for a source and save it to a temporary file, ready to be run by psql"""
 
     data_file_name = build_data_file_name(source, download_job, piid, assistance_id)
 
     source_query = source.row_emitter(columns)
     extension = FILE_FORMATS[file_format]["extension"]
     source.file_name = f"{data_file_name}.{extension}"
-    source_path = os.path.join(working_dir, source.file_name)
 
     write_to_log(message=f"Preparing to download data as {source.file_name}", download_job=download_job)
 
@@ -253,41 +268,82 @@ def parse_source(source, columns, download_job, working_dir, piid, assistance_id
     export_query = generate_export_query(source_query, limit, source, columns, file_format)
     temp_file, temp_file_path = generate_export_query_temp_file(export_query, download_job)
 
-    start_time = time.perf_counter()
+    return PreparedSource(source, data_file_name, temp_file, temp_file_path)
+
+
+def generate_source_files(prepared_sources, download_job, working_dir, zip_file_path, file_format):
+    """
+    Write to delimited text file(s) and zip file(s) using the prepared sources.  Sources are independent of each other
+    so each runs in its own process, up to DOWNLOAD_SOURCE_CONCURRENCY per job and DOWNLOAD_HOST_SOURCE_CONCURRENCY
+    across all of the download jobs on this host.  Every process appends its partitions to the zip as they complete,
+    holding the zip lock while it does so.
+    """
+    zip_lock = multiprocessing.Lock()
+    pending_sources = list(prepared_sources)
+    running_sources = []
     try:
-        # Create a separate process to run the PSQL command; wait
-        psql_process = multiprocessing.Process(target=execute_psql, args=(temp_file_path, source_path, download_job))
-        psql_process.start()
-        wait_for_process(psql_process, start_time, download_job)
+        while pending_sources or running_sources:
+            while pending_sources and len(running_sources) < settings.DOWNLOAD_SOURCE_CONCURRENCY:
+                host_slot = _acquire_host_download_slot()
+                if host_slot is False:
+                    break
+                prepared_source = pending_sources.pop(0)
+                output_template = f"{prepared_source.data_file_name}_%s.{FILE_FORMATS[file_format]['extension']}"
+                row_count = multiprocessing.Value("q", 0)
+                psql_process = multiprocessing.Process(
+                    target=execute_psql_and_zip,
+                    args=(
+                        prepared_source.temp_file_path,
+                        working_dir,
+                        output_template,
+                        zip_file_path,
+                        file_format,
+                        row_count,
+                        download_job,
+                        zip_lock,
+                    ),
+                )
+                psql_process.start()
+                running_sources.append((psql_process, row_count, host_slot, time.perf_counter()))
+
+            for running_source in list(running_sources):
+                psql_process, row_count, host_slot, start_time = running_source
+                over_time = (time.perf_counter() - start_time) >= MAX_VISIBILITY_TIMEOUT
+                if psql_process.is_alive() and (download_job.monthly_download or not over_time):
+                    continue
+                # Either finished or timed out; wait_for_process returns immediately and raises for either failure
+                wait_for_process(psql_process, start_time, download_job)
+                running_sources.remove(running_source)
+                if host_slot:
+                    host_slot.release()
+                download_job.number_of_rows += row_count.value
+                download_job.save()
+
+            if running_sources or pending_sources:
+                time.sleep(WAIT_FOR_PROCESS_SLEEP / 5)
+    finally:
+        for psql_process, _, host_slot, _ in running_sources:
+            if psql_process.is_alive():
+                psql_process.terminate()
+            if host_slot:
+                host_slot.release()
 
-        delim = FILE_FORMATS[file_format]["delimiter"]
 
-        # Log how many rows we have
-        write_to_log(message="Counting rows in delimited text file", download_job=download_job)
+def _acquire_host_download_slot():
+    """
+    Claims one of the DOWNLOAD_HOST_SOURCE_CONCURRENCY lock files shared by every download worker on this host.
+    Returns the held FileLock, None when the host isn't limited, or False when every slot is taken.
+    """
+    if settings.DOWNLOAD_HOST_SOURCE_CONCURRENCY <= 0:
+        return None
+    for slot in range(settings.DOWNLOAD_HOST_SOURCE_CONCURRENCY):
+        host_slot = FileLock(os.path.join(tempfile.gettempdir(), f"usaspending_download_slot_{slot}.lock"))
         try:
-            download_job.number_of_rows += count_rows_in_delimited_file(
-                filename=source_path, has_header=True, delimiter=delim
-            )
-        except Exception:
-            write_to_log(
-                message="Unable to obtain delimited text file line count", is_error=True, download_job=download_job
-            )
-        download_job.save()
-
-        # Create a separate process to split the large data files into smaller file and write to zip; wait
-        zip_process = multiprocessing.Process(
-            target=split_and_zip_data_files,
-            args=(zip_file_path, source_path, data_file_name, file_format, download_job),
-        )
-        zip_process.start()
-        wait_for_process(zip_process, start_time, download_job)
-        download_job.save()
-    except Exception as e:
-        raise e
-    finally:
-        # Remove temporary files
-        os.close(temp_file)
-        os.remove(temp_file_path)
+            host_slot.acquire(timeout=0)
+        except FileLockTimeout:
+            continue
+        return host_slot
+    return False
 
 
 def split_and_zip_data_files(zip_file_path, source_path, data_file_name, file_format, download_job=None):
@@ -525,6 +581,91 @@ def execute_psql(temp_sql_file_path, source_path, download_job):
         raise e
 
 
+def execute_psql_and_zip(
+    temp_sql_file_path, working_dir, output_template, zip_file_path, file_format, row_count, download_job, zip_lock=None
+):
+    """
+    Streaming alternative to execute_psql followed by split_and_zip_data_files.  Rows are read from PSQL's stdout as
+    they are produced, counted, and written straight into EXCEL_ROW_LIMIT sized partitions.  Each finished partition
+    is handed to a zip thread which compresses it into the archive (then deletes it) while the next partition is
+    still being written, so the full, unpartitioned file never touches the disk.
+
+    The number of rows written (excluding headers) is stored in the `row_count` multiprocessing.Value.  Pass a
+    `zip_lock` when other processes may be appending to the same zip file.
+    """
+    try:
+        log_time = time.perf_counter()
+        delim = FILE_FORMATS[file_format]["delimiter"]
+
+        zip_queue = queue.Queue()
+        zip_errors = []
+        zip_thread = Thread(target=_zip_partitions, args=(zip_queue, zip_file_path, zip_errors, zip_lock), daemon=True)
+        zip_thread.start()
+
+        try:
+            # PSQL's errors go to a file rather than a pipe so it can't block on them while its output is read
+            with open(temp_sql_file_path, "rb") as sql_file, tempfile.TemporaryFile() as psql_errors:
+                with subprocess.Popen(
+                    ["psql", "-q", retrieve_db_string(), "-v", "ON_ERROR_STOP=1"],
+                    stdin=sql_file,
+                    stdout=subprocess.PIPE,
+                    stderr=psql_errors,
+                ) as psql_command:
+                    try:
+                        list_of_files, rows = partition_delimited_stream(
+                            io.TextIOWrapper(psql_command.stdout, newline=""),
+                            working_dir,
+                            delimiter=delim,
+                            row_limit=EXCEL_ROW_LIMIT,
+                            output_name_template=output_template,
+                            partition_complete_callback=zip_queue.put,
+                        )
+                    except StopIteration:
+                        list_of_files, rows = [], 0  # No header row means PSQL failed; its return code is checked below
+
+                if psql_command.returncode:
+                    psql_errors.seek(0)
+                    raise subprocess.CalledProcessError(psql_command.returncode, psql_command.args, psql_errors.read())
+        finally:
+            # Stop the zip thread however PSQL finished so it isn't left waiting on the queue
+            zip_queue.put(None)
+            zip_thread.join()
+
+        if zip_errors:
+            raise zip_errors[0]
+
+        row_count.value = rows
+        duration = time.perf_counter() - log_time
+        write_to_log(
+            message=f"Wrote and zipped {rows:,} rows in {len(list_of_files)} files, took {duration:.4f} seconds",
+            download_job=download_job,
+        )
+    except Exception as e:
+        if not settings.IS_LOCAL:
+            # Not logging the command as it can contain the database connection string
+            e.cmd = "[redacted psql command]"
+        logger.error(e)
+        sql = subprocess.check_output(["cat", temp_sql_file_path]).decode()
+        logger.error(f"Faulty SQL: {sql}")
+        raise e
+
+
+def _zip_partitions(zip_queue, zip_file_path, zip_errors, zip_lock=None):
+    """Appends partitions to the zip file as they're queued until a None arrives; failures are left in zip_errors"""
+    while True:
+        partition_path = zip_queue.get()
+        if partition_path is None:
+            return
+        if zip_errors:
+            continue  # keep draining so the producer isn't left waiting on a dead consumer
+        try:
+            with zip_lock or nullcontext():
+                append_files_to_zip_file([partition_path], zip_file_path)
+            os.remove(partition_path)
+        except Exception as e:
+            zip_errors.append(e)
+
+
 def retrieve_db_string():
     """It is necessary for this to be a function so the test suite can mock the connection string"""
     return settings.DOWNLOAD_DATABASE_URL
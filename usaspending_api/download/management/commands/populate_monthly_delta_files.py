@@ -7,7 +7,9 @@ import shutil
 import subprocess
 import tempfile
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date
+from io import BytesIO
 from django.conf import settings
 from django.core.management.base import BaseCommand
 from django.db.models import Case, When, Value, CharField, F
@@ -24,7 +26,8 @@ from usaspending_api.download.filestreaming.download_generation import (
 from usaspending_api.download.filestreaming.download_source import DownloadSource
 from usaspending_api.download.helpers import pull_modified_agencies_cgacs
 from usaspending_api.download.lookups import VALUE_MAPPINGS
-from usaspending_api.references.models import ToptierAgency, SubtierAgency
+from usaspending_api.references.helpers import subtier_codes_by_toptier_code
+from usaspending_api.references.models import ToptierAgency
 
 
 logger = logging.getLogger(__name__)
@@ -212,87 +215,118 @@ class Command(BaseCommand):
         return zipfile_path
 
     @staticmethod
-    def split_transaction_id(tid):
+    def split_transaction_ids(tids):
         """
-        Split the transaction id on underscores and append the original transaction
-        id to the result.  The returned components should conform to the column
+        Split the transaction ids on underscores and append the original transaction
+        id to the result.  The returned columns should conform to the column
         definitions provided in AWARD_MAPPINGS[award_type]['column_headers'].
 
         USAspending uppercases transaction unique ids, but older version of Broker
         did not so we'll uppercase just to be safe.  Won't hurt anything to uppercase
         an uppercased id.
         """
-        tid = tid.upper()
-        return pd.Series(tid.split("_") + [tid])
+        tids = tids.str.upper()
+        split_tids = tids.str.split("_", expand=True)
+        split_tids[len(split_tids.columns)] = tids
+        return split_tids
 
     def add_deletion_records(self, source_path, working_dir, award_type, agency_code, source, generate_since):
         """ Retrieve deletion files from S3 and append necessary records to the end of the file """
         logger.info("Retrieving deletion records from S3 files and appending to the CSV")
 
-        # Retrieve all SubtierAgency IDs within this TopTierAgency
-        subtier_agencies = list(
-            SubtierAgency.objects.filter(agency__toptier_agency__toptier_code=agency_code).values_list(
-                "subtier_code", flat=True
-            )
-        )
-
-        # Create a list of keys in the bucket that match the date range we want
-        bucket = boto3.resource("s3", region_name=settings.USASPENDING_AWS_REGION).Bucket(
-            settings.DELETED_TRANSACTION_JOURNAL_FILES
-        )
+        # Every agency's file is cut from the same deletion records, so they're only fetched once per run
+        cache_key = (award_type, generate_since)
+        if cache_key not in self.deletion_records:
+            self.deletion_records[cache_key] = self.fetch_deletion_records(award_type, generate_since)
+        df = self.deletion_records[cache_key]
 
-        all_deletions = pd.DataFrame()
-        for key in bucket.objects.all():
-            match_date = self.check_regex_match(award_type, key.key, generate_since)
-            if match_date:
-                # Create a local copy of the deletion file
-                delete_filepath = "{}{}".format(working_dir, key.key)
-                bucket.download_file(key.key, delete_filepath)
-                df = pd.read_csv(delete_filepath)
-                os.remove(delete_filepath)
-
-                # Split unique identifier into usable columns and add unused columns
-                df = (
-                    df[AWARD_MAPPINGS[award_type]["unique_iden"]]
-                    .apply(self.split_transaction_id)
-                    .replace("-none-", "")
-                    .replace("-NONE-", "")
-                    .rename(columns=AWARD_MAPPINGS[award_type]["column_headers"])
-                )
-
-                # Only include records within the correct agency, and populated files
-                if len(df.index) == 0:
-                    continue
-                if agency_code != "all":
-                    df = df[df[AWARD_MAPPINGS[award_type]["agency_field"]].isin(subtier_agencies)]
-                    if len(df.index) == 0:
-                        continue
-
-                # Reorder columns to make it CSV-ready, and append
-                df = self.organize_deletion_columns(source, df, award_type, match_date)
-                logger.info("Found {} deletion records to include".format(len(df.index)))
-                all_deletions = all_deletions.append(df, ignore_index=True)
+        # Only include records within the correct agency
+        if agency_code != "all":
+            # Retrieve all SubtierAgency codes within this TopTierAgency
+            subtier_agencies = subtier_codes_by_toptier_code().get(agency_code, frozenset())
+            df = df[df[AWARD_MAPPINGS[award_type]["agency_field"]].isin(subtier_agencies)]
 
         # Only append to file if there are any records
-        if len(all_deletions.index) == 0:
+        if len(df.index) == 0:
             logger.info("No deletion records to append to file")
         else:
-            self.add_deletions_to_file(all_deletions, award_type, source_path)
+            logger.info("Found {} deletion records to include".format(len(df.index)))
+            self.add_deletions_to_file(self.organize_deletion_columns(source, df, award_type), award_type, source_path)
+
+    def fetch_deletion_records(self, award_type, generate_since):
+        """
+        Read every deletion file within the date range straight from S3, several at once, and split the unique
+        identifier of each record into usable columns.  Each record's last_modified_date is the date of its file.
+        """
+        s3_client = boto3.client("s3", region_name=settings.USASPENDING_AWS_REGION)
+        bucket_name = settings.DELETED_TRANSACTION_JOURNAL_FILES
+
+        # Create a list of keys in the bucket that match the date range we want
+        matching_keys = []
+        paginator = s3_client.get_paginator("list_objects_v2")
+        for prefix in self.deletion_file_prefixes(award_type, generate_since):
+            for page in paginator.paginate(Bucket=bucket_name, Prefix=prefix):
+                for s3_object in page.get("Contents", []):
+                    match_date = self.check_regex_match(award_type, s3_object["Key"], generate_since)
+                    if match_date:
+                        matching_keys.append((s3_object["Key"], match_date))
+
+        unique_iden = AWARD_MAPPINGS[award_type]["unique_iden"]
+
+        def read_deletion_file(key):
+            body = s3_client.get_object(Bucket=bucket_name, Key=key)["Body"].read()
+            return pd.read_csv(BytesIO(body), usecols=[unique_iden], dtype=str)[unique_iden].dropna()
+
+        with ThreadPoolExecutor(max_workers=settings.DELTA_DELETION_FILE_WORKERS) as executor:
+            unique_ids = list(executor.map(read_deletion_file, [key for key, _ in matching_keys]))
+
+        if not any(len(ids.index) for ids in unique_ids):
+            return pd.DataFrame(columns=list(AWARD_MAPPINGS[award_type]["column_headers"].values()))
+
+        last_modified_dates = pd.concat(
+            [pd.Series(match_date, index=ids.index) for ids, (_, match_date) in zip(unique_ids, matching_keys)],
+            ignore_index=True,
+        )
+        unique_ids = pd.concat(unique_ids, ignore_index=True)
+
+        # Split unique identifier into usable columns
+        df = (
+            self.split_transaction_ids(unique_ids)
+            .replace("-none-", "")
+            .replace("-NONE-", "")
+            .rename(columns=AWARD_MAPPINGS[award_type]["column_headers"])
+        )
+        df["last_modified_date"] = last_modified_dates
+        logger.info("Found {} deletion records in {} files".format(len(df.index), len(matching_keys)))
+        return df
+
+    def deletion_file_prefixes(self, award_type, generate_since):
+        """
+        Key prefixes the deletion files within the date range can start with.  Assistance file names start with
+        their year, so only the years since generate_since are listed; Contract file names start with their month.
+        """
+        if award_type != "Assistance":
+            return [""]
+        since_year = datetime.strptime(generate_since, "%Y-%m-%d").year
+        end_year = date.today().year
+        if self.debugging_end_date:
+            end_year = datetime.strptime(self.debugging_end_date, "%Y-%m-%d").year
+        return ["{}-".format(year) for year in range(since_year, end_year + 1)]
 
-    def organize_deletion_columns(self, source, dataframe, award_type, match_date):
+    def organize_deletion_columns(self, source, dataframe, award_type):
         """ Ensure that the dataframe has all necessary columns in the correct order """
         ordered_columns = source.columns(None)
         if "correction_delete_ind" not in ordered_columns:
             ordered_columns = ["correction_delete_ind"] + ordered_columns
 
-        # Loop through columns and populate rows for each
-        unique_values_map = {"correction_delete_ind": "D", "last_modified_date": match_date}
+        # Loop through columns and populate rows for each, leaving the caller's dataframe as it is
+        dataframe = dataframe.copy()
         for header in ordered_columns:
-            if header in unique_values_map:
-                dataframe[header] = [unique_values_map[header]] * len(dataframe.index)
+            if header == "correction_delete_ind":
+                dataframe[header] = "D"
 
-            elif header not in list(AWARD_MAPPINGS[award_type]["column_headers"].values()):
-                dataframe[header] = [""] * len(dataframe.index)
+            elif header not in list(AWARD_MAPPINGS[award_type]["column_headers"].values()) + ["last_modified_date"]:
+                dataframe[header] = ""
 
         # Ensure columns are in correct order
         return dataframe[ordered_columns]
@@ -398,6 +432,7 @@ class Command(BaseCommand):
         last_date = options["last_date"]
         self.debugging_end_date = options["debugging_end_date"]
         self.debugging_skip_deleted = options["debugging_skip_deleted"]
+        self.deletion_records = {}
 
         toptier_agencies = ToptierAgency.objects.filter(toptier_code__in=set(pull_modified_agencies_cgacs()))
         include_all = True
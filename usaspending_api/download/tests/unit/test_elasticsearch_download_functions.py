@@ -0,0 +1,45 @@
+from unittest.mock import MagicMock
+
+from usaspending_api.download.helpers.elasticsearch_download_functions import (
+    AwardsElasticsearchDownload,
+    _ElasticsearchDownload,
+)
+
+
+class FakeSearch:
+    """Stands in for an AwardSearch; every partition holds the IDs that leave `partition` when divided by the count"""
+
+    def __init__(self, ids, aggs=None):
+        self.ids = ids
+        self.aggs = aggs or MagicMock()
+
+    def handle_count(self, retries):
+        return len(self.ids)
+
+    def _clone(self):
+        return FakeSearch(self.ids, MagicMock())
+
+    def handle_execute(self, retries):
+        include = self.aggs.bucket.call_args[0][1].to_dict()["terms"]["include"]
+        keys = [i for i in self.ids if i % include["num_partitions"] == include["partition"]]
+        response = MagicMock()
+        response.to_dict.return_value = {"aggregations": {"results": {"buckets": [{"key": k} for k in keys]}}}
+        return response
+
+
+def test_download_id_partitions_are_fetched_concurrently_in_order(settings):
+    settings.MAX_DOWNLOAD_LIMIT = 100
+    settings.DOWNLOAD_ID_PARTITION_WORKERS = 3
+    search = FakeSearch(list(range(45)))
+
+    partitions = list(AwardsElasticsearchDownload._get_download_ids_generator(search, 10))
+
+    assert len(partitions) == 5
+    assert partitions[0] == [0, 5, 10, 15, 20, 25, 30, 35, 40]
+    assert partitions[4] == [4, 9, 14, 19, 24, 29, 34, 39, 44]
+    assert not search.aggs.bucket.called
+
+
+def test_ids_as_sql_array():
+    assert _ElasticsearchDownload._ids_as_sql_array([3, 1, 2]) == "'{3,1,2}'::INTEGER[]"
+    assert _ElasticsearchDownload._ids_as_sql_array([]) == "'{}'::INTEGER[]"
@@ -1,6 +1,14 @@
+import io
+import os
+import pytest
+import subprocess
+import threading
+import zipfile
+
 from unittest.mock import MagicMock
 
 from usaspending_api.awards.v2.lookups.lookups import award_type_mapping, contract_type_mapping, idv_type_mapping
+from usaspending_api.common.csv_helpers import partition_delimited_stream
 from usaspending_api.download.filestreaming import download_generation
 from usaspending_api.download.lookups import VALUE_MAPPINGS
 
@@ -127,3 +135,84 @@ def test_idv_treasury_account_funding_csv_sources():
     VALUE_MAPPINGS["idv_federal_account_funding"]["filter_function"] = original
     assert csv_sources[0].file_type == "treasury_account"
     assert csv_sources[0].source_type == "idv_federal_account_funding"
+
+
+def test_partition_delimited_stream_zips_partitions_as_they_complete(tmp_path):
+    zip_file_path = str(tmp_path / "download.zip")
+    zip_queue = download_generation.queue.Queue()
+    zip_errors = []
+    source = io.StringIO("id,name\r\n" + "".join(f"{i},row {i}\r\n" for i in range(5)))
+
+    list_of_files, rows = partition_delimited_stream(
+        source,
+        str(tmp_path),
+        row_limit=2,
+        output_name_template="data_%s.csv",
+        partition_complete_callback=zip_queue.put,
+    )
+    zip_queue.put(None)
+    download_generation._zip_partitions(zip_queue, zip_file_path, zip_errors)
+
+    assert rows == 5
+    assert [os.path.basename(f) for f in list_of_files] == ["data_1.csv", "data_2.csv", "data_3.csv"]
+    assert not zip_errors
+    assert not any(os.path.exists(f) for f in list_of_files)
+    with zipfile.ZipFile(zip_file_path, "r") as zf:
+        assert zf.namelist() == ["data_1.csv", "data_2.csv", "data_3.csv"]
+        assert zf.read("data_1.csv") == b"id,name\r\n0,row 0\r\n1,row 1\r\n"
+        assert zf.read("data_3.csv") == b"id,name\r\n4,row 4\r\n"
+
+
+def test_execute_psql_and_zip_failure(monkeypatch, tmp_path):
+    """PSQL writing more errors than a pipe holds shouldn't stall the download, nor should failing leave a zip thread"""
+    fake_psql = tmp_path / "psql"
+    fake_psql.write_text("#!/bin/sh\necho id,name\nhead -c 1000000 /dev/zero | tr '\\0' e >&2\nexit 3\n")
+    fake_psql.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+    monkeypatch.setattr(download_generation, "retrieve_db_string", lambda: "postgres://fake")
+    sql_file_path = tmp_path / "query.sql"
+    sql_file_path.write_text("SELECT 1")
+    thread_count = threading.active_count()
+
+    with pytest.raises(subprocess.CalledProcessError) as e:
+        download_generation.execute_psql_and_zip(
+            str(sql_file_path), str(tmp_path), "data_%s.csv", str(tmp_path / "download.zip"), "csv", None, None
+        )
+
+    assert e.value.returncode == 3
+    assert len(e.value.output) == 1000000
+    assert threading.active_count() == thread_count
+
+
+def _fake_execute_psql_and_zip(temp_sql_file_path, working_dir, output_template, zip_file_path, *args):
+    row_count = args[1]
+    row_count.value = int(os.path.basename(temp_sql_file_path))
+
+
+def test_generate_source_files_runs_sources_concurrently(monkeypatch, settings):
+    settings.DOWNLOAD_SOURCE_CONCURRENCY = 2
+    settings.DOWNLOAD_HOST_SOURCE_CONCURRENCY = 0
+    monkeypatch.setattr(download_generation, "execute_psql_and_zip", _fake_execute_psql_and_zip)
+    monkeypatch.setattr(download_generation, "WAIT_FOR_PROCESS_SLEEP", 0.05)
+    download_job = MagicMock(monthly_download=False, number_of_rows=0)
+    prepared_sources = [
+        download_generation.PreparedSource(None, f"file_{rows}", None, f"/tmp/{rows}") for rows in (1, 10, 100)
+    ]
+
+    download_generation.generate_source_files(prepared_sources, download_job, "/tmp", "/tmp/download.zip", "csv")
+
+    assert download_job.number_of_rows == 111
+    assert download_job.save.call_count == 3
+
+
+def test_acquire_host_download_slot(settings):
+    settings.DOWNLOAD_HOST_SOURCE_CONCURRENCY = 1
+    host_slot = download_generation._acquire_host_download_slot()
+    try:
+        assert host_slot.is_locked
+        assert download_generation._acquire_host_download_slot() is False
+    finally:
+        host_slot.release()
+
+    settings.DOWNLOAD_HOST_SOURCE_CONCURRENCY = 0
+    assert download_generation._acquire_host_download_slot() is None
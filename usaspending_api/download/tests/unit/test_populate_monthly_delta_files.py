@@ -0,0 +1,66 @@
+import io
+import pandas as pd
+
+from unittest.mock import MagicMock, patch
+
+from usaspending_api.download.management.commands.populate_monthly_delta_files import Command
+
+
+FABS_DELETION_FILES = {
+    "2020-04-01_FABSdeletions_1585742400.csv": "afa_generated_unique\nabc_fain1_-none-_10.001_0001\n",
+    "2020-04-02_FABSdeletions_1585828800.csv": "afa_generated_unique\nDEF_FAIN2_URI2_10.002_-NONE-\nghi_f_u_1_2\n",
+    "2020-03-01_FABSdeletions_1583064000.csv": "afa_generated_unique\nOLD_FAIN_URI_10.003_0001\n",
+    "not_a_deletion_file.csv": "afa_generated_unique\nXYZ_A_B_C_D\n",
+}
+
+
+def test_split_transaction_ids():
+    split = Command.split_transaction_ids(pd.Series(["a_b_c", "D_E_F"]))
+    assert split.values.tolist() == [["A", "B", "C", "A_B_C"], ["D", "E", "F", "D_E_F"]]
+
+
+def test_fetch_deletion_records():
+    s3_client = MagicMock()
+    s3_client.get_paginator.return_value.paginate.side_effect = lambda Bucket, Prefix: [
+        {"Contents": [{"Key": key} for key in FABS_DELETION_FILES if key.startswith(Prefix)]}
+    ]
+    s3_client.get_object.side_effect = lambda Bucket, Key: {
+        "Body": io.BytesIO(FABS_DELETION_FILES[Key].encode("utf-8"))
+    }
+
+    command = Command()
+    command.debugging_end_date = None
+    with patch("boto3.client", return_value=s3_client):
+        df = command.fetch_deletion_records("Assistance", "2020-03-31")
+
+    records = df.sort_values("assistance_transaction_unique_key").to_dict("records")
+    assert records == [
+        {
+            "awarding_sub_agency_code": "ABC",
+            "award_id_fain": "FAIN1",
+            "award_id_uri": "",
+            "cfda_number": "10.001",
+            "modification_number": "0001",
+            "assistance_transaction_unique_key": "ABC_FAIN1_-NONE-_10.001_0001",
+            "last_modified_date": "2020-04-01",
+        },
+        {
+            "awarding_sub_agency_code": "DEF",
+            "award_id_fain": "FAIN2",
+            "award_id_uri": "URI2",
+            "cfda_number": "10.002",
+            "modification_number": "",
+            "assistance_transaction_unique_key": "DEF_FAIN2_URI2_10.002_-NONE-",
+            "last_modified_date": "2020-04-02",
+        },
+        {
+            "awarding_sub_agency_code": "GHI",
+            "award_id_fain": "F",
+            "award_id_uri": "U",
+            "cfda_number": "1",
+            "modification_number": "2",
+            "assistance_transaction_unique_key": "GHI_F_U_1_2",
+            "last_modified_date": "2020-04-02",
+        },
+    ]
+    assert s3_client.get_object.call_count == 2
@@ -10,7 +10,7 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from usaspending_api.common.api_versioning import api_transformations, API_TRANSFORM_FUNCTIONS
-from usaspending_api.common.helpers.dict_helpers import order_nested_object
+from usaspending_api.common.helpers.dict_helpers import request_fingerprint
 from usaspending_api.common.sqs.sqs_handler import get_sqs_queue
 from usaspending_api.download.download_utils import create_unique_filename, log_new_download_job
 from usaspending_api.download.filestreaming import download_generation
@@ -52,7 +52,7 @@ class BaseDownloadViewSet(APIView):
             json_request = validate_account_request(request.data)
 
         json_request["request_type"] = request_type
-        ordered_json_request = json.dumps(order_nested_object(json_request))
+        ordered_json_request = request_fingerprint(json_request)
 
         # Check if the same request has been called today
         # TODO!!! Use external_data_load_date to determine data freshness
@@ -1,5 +1,6 @@
 from typing import Optional
 
+import csv
 import json
 import os
 import pandas as pd
@@ -11,7 +12,10 @@ from datetime import datetime
 from django.conf import settings
 from django.core.management import call_command
 from elasticsearch import helpers, TransportError
-from time import perf_counter, sleep
+from itertools import islice
+from queue import Empty
+from threading import Thread
+from time import perf_counter
 
 from usaspending_api.awards.v2.lookups.elasticsearch_lookups import INDEX_ALIASES_TO_AWARD_TYPES
 from usaspending_api.common.csv_helpers import count_rows_in_delimited_file
@@ -209,6 +213,14 @@ COPY_SQL = """"COPY (
 ) TO STDOUT DELIMITER ',' CSV HEADER" > '{filename}'
 """
 
+STREAM_COPY_SQL = """
+COPY (
+    SELECT *
+    FROM {view}
+    WHERE {type_fy}fiscal_year={fy}{update_date}
+) TO STDOUT DELIMITER ',' CSV HEADER
+"""
+
 CHECK_IDS_SQL = """
 WITH temp_{view_type}_ids AS (
   SELECT *
@@ -241,6 +253,17 @@ AWARD_DESC_CATEGORIES = {
 UNIVERSAL_TRANSACTION_ID_NAME = "generated_unique_transaction_id"
 UNIVERSAL_AWARD_ID_NAME = "generated_unique_award_id"
 
+DEFAULT_INGEST_THREADS = 4
+DEFAULT_BULK_MAX_BYTES = 100 * 1024 * 1024  # Same as the elasticsearch bulk helpers' default
+
+# Keyword fields holding the exact value of an ID column, so a single terms query can find many documents at once
+ES_ID_KEYWORD_FIELDS = {UNIVERSAL_AWARD_ID_NAME: "{}.keyword".format(UNIVERSAL_AWARD_ID_NAME)}
+TERMS_QUERY_BATCH_SIZE = 10000
+MATCH_PHRASE_QUERY_BATCH_SIZE = 1000
+
+# All jobs are queued before the download process starts, but can still be in flight through the queue's feeder thread
+JOB_QUEUE_TIMEOUT_SECONDS = 5
+
 
 class DataJob:
     def __init__(self, *args):
@@ -327,6 +350,24 @@ def configure_sql_strings(config, filename, deleted_ids):
     return copy_sql, id_sql, count_sql
 
 
+def configure_stream_sql_strings(config):
+    """Same as configure_sql_strings, but with a COPY that can be streamed over a connection instead of run by psql"""
+    update_date_str = UPDATE_DATE_SQL.format(config["starting_date"].strftime("%Y-%m-%d"))
+    if config["load_type"] == "awards":
+        view_name = settings.ES_AWARDS_ETL_VIEW_NAME
+        type_fy = ""
+    else:
+        view_name = settings.ES_TRANSACTIONS_ETL_VIEW_NAME
+        type_fy = "transaction_"
+
+    copy_sql = STREAM_COPY_SQL.format(
+        fy=config["fiscal_year"], update_date=update_date_str, view=view_name, type_fy=type_fy
+    )
+    count_sql = COUNT_SQL.format(fy=config["fiscal_year"], update_date=update_date_str, view=view_name, type_fy=type_fy)
+
+    return copy_sql, count_sql
+
+
 def execute_sql_statement(cmd, results=False, verbose=False):
     """ Simple function to execute SQL using a psycopg2 connection"""
     rows = None
@@ -349,40 +390,37 @@ def db_rows_to_dict(cursor):
 
 
 def download_db_records(fetch_jobs, done_jobs, config):
-    # There has been a recurring issue with .empty() returning true when the queue actually
-    # contains multiple jobs. Wait a few seconds before starting to see if it helps
-    sleep(5)
-    printf({"msg": "Queue has items: {}".format(not fetch_jobs.empty()), "f": "Download"})
-    while not fetch_jobs.empty():
+    while True:
+        try:
+            job = fetch_jobs.get(timeout=JOB_QUEUE_TIMEOUT_SECONDS)
+        except Empty:
+            break
+
+        start = perf_counter()
+        printf({"msg": 'Preparing to download "{}"'.format(job.csv), "job": job.name, "f": "Download"})
+
+        sql_config = {
+            "starting_date": config["starting_date"],
+            "fiscal_year": job.fy,
+            "process_deletes": config["process_deletes"],
+            "load_type": config["load_type"],
+        }
+        copy_sql, _, count_sql = configure_sql_strings(sql_config, job.csv, [])
+
+        if os.path.isfile(job.csv):
+            os.remove(job.csv)
+
+        job.count = download_csv(count_sql, copy_sql, job.csv, job.name, config["skip_counts"], config["verbose"])
         if done_jobs.full():
             printf({"msg": "Paused downloading new CSVs so ES indexing can catch up", "f": "Download"})
-            sleep(60)
-        else:
-            start = perf_counter()
-            job = fetch_jobs.get_nowait()
-            printf({"msg": 'Preparing to download "{}"'.format(job.csv), "job": job.name, "f": "Download"})
-
-            sql_config = {
-                "starting_date": config["starting_date"],
-                "fiscal_year": job.fy,
-                "process_deletes": config["process_deletes"],
-                "load_type": config["load_type"],
+        done_jobs.put(job)  # blocks until the ES ingest process takes a job off of a full queue
+        printf(
+            {
+                "msg": 'CSV "{}" copy took {} seconds'.format(job.csv, perf_counter() - start),
+                "job": job.name,
+                "f": "Download",
             }
-            copy_sql, _, count_sql = configure_sql_strings(sql_config, job.csv, [])
-
-            if os.path.isfile(job.csv):
-                os.remove(job.csv)
-
-            job.count = download_csv(count_sql, copy_sql, job.csv, job.name, config["skip_counts"], config["verbose"])
-            done_jobs.put(job)
-            printf(
-                {
-                    "msg": 'CSV "{}" copy took {} seconds'.format(job.csv, perf_counter() - start),
-                    "job": job.name,
-                    "f": "Download",
-                }
-            )
-            sleep(1)
+        )
 
     # This "Null Job" is used to notify the other (ES data load) process this is the final job
     done_jobs.put(DataJob(None, None, None, None))
@@ -409,27 +447,116 @@ def download_csv(count_sql, copy_sql, filename, job_id, skip_counts, verbose):
     return count
 
 
-def csv_chunk_gen(filename, chunksize, job_id, load_type):
-    printf({"msg": "Opening {} (batch size = {})".format(filename, chunksize), "job": job_id, "f": "ES Ingest"})
-    # Need a specific converter to handle converting strings to correct data types (e.g. string -> array)
-    converters = {
-        "business_categories": convert_postgres_array_as_string_to_list,
-        "tas_paths": convert_postgres_array_as_string_to_list,
-        "tas_components": convert_postgres_array_as_string_to_list,
-        "federal_accounts": convert_postgres_json_array_as_string_to_list,
-        "disaster_emergency_fund_codes": convert_postgres_array_as_string_to_list,
-    }
-    # Panda's data type guessing causes issues for Elasticsearch. Explicitly cast using dictionary
-    dtype = {k: str for k in VIEW_COLUMNS if k not in converters}
-    for file_df in pd.read_csv(filename, dtype=dtype, converters=converters, header=0, chunksize=chunksize):
-        file_df = file_df.where(cond=(pd.notnull(file_df)), other=None)
-        # Route all documents with the same recipient to the same shard
-        # This allows for accuracy and early-termination of "top N" recipient category aggregation queries
-        # Recipient is are highest-cardinality category with over 2M unique values to aggregate against,
-        # and this is needed for performance
-        # ES helper will pop any "meta" fields like "routing" from provided data dict and use them in the action
-        file_df["routing"] = file_df[settings.ES_ROUTING_FIELD]
-        yield file_df.to_dict(orient="records")
+# Postgres arrays and JSON arrays come out of COPY as strings and need converting into lists for Elasticsearch
+CSV_CONVERTERS = {
+    "business_categories": convert_postgres_array_as_string_to_list,
+    "tas_paths": convert_postgres_array_as_string_to_list,
+    "tas_components": convert_postgres_array_as_string_to_list,
+    "federal_accounts": convert_postgres_json_array_as_string_to_list,
+    "disaster_emergency_fund_codes": convert_postgres_array_as_string_to_list,
+}
+
+
+def convert_csv_row_to_document(row: dict) -> dict:
+    """Every value is kept as a string (or null), except for the array columns which become lists"""
+    document = {}
+    for column, value in row.items():
+        if column in CSV_CONVERTERS:
+            document[column] = CSV_CONVERTERS[column](value)
+        else:
+            document[column] = value if value != "" else None
+    # Route all documents with the same recipient to the same shard
+    # This allows for accuracy and early-termination of "top N" recipient category aggregation queries
+    # Recipient is are highest-cardinality category with over 2M unique values to aggregate against,
+    # and this is needed for performance
+    # ES helper will pop any "meta" fields like "routing" from provided data dict and use them in the action
+    document["routing"] = document[settings.ES_ROUTING_FIELD]
+    return document
+
+
+def csv_document_gen(filename, job_id):
+    """Lazily reads the CSV so only the documents currently being posted to Elasticsearch are held in memory"""
+    printf({"msg": "Opening {}".format(filename), "job": job_id, "f": "ES Ingest"})
+    with open(filename, newline="") as csv_file:
+        for row in csv.DictReader(csv_file):
+            yield convert_csv_row_to_document(row)
+
+
+def stream_copy_output(copy_sql):
+    """
+    Runs a COPY ... TO STDOUT on its own connection in a background thread and yields its output lines as they arrive,
+    so nothing is written to disk. Abandoning the generator closes the pipe, which also ends the COPY.
+    """
+    read_fd, write_fd = os.pipe()
+    errors = []
+
+    def copy_to_pipe():
+        try:
+            with open(write_fd, "w", encoding="utf-8", newline="") as pipe:
+                with psycopg2.connect(dsn=get_database_dsn_string()) as connection:
+                    with connection.cursor() as cursor:
+                        cursor.copy_expert(copy_sql, pipe)
+        except Exception as e:
+            errors.append(e)
+
+    copy_thread = Thread(target=copy_to_pipe, daemon=True)
+    copy_thread.start()
+    with open(read_fd, encoding="utf-8", newline="") as pipe:
+        yield from pipe
+    copy_thread.join()
+    if errors:
+        raise errors[0]
+
+
+def db_document_gen(copy_sql, job):
+    """
+    Streams documents straight out of Postgres, counting them as they go by instead of re-reading a file.
+    Raises (rather than exits) on problems since this is consumed from the bulk helpers' worker threads.
+    """
+    printf({"msg": "Streaming rows from the database", "job": job.name, "f": "ES Ingest"})
+    streamed_count = 0
+    for row in csv.DictReader(stream_copy_output(copy_sql)):
+        streamed_count += 1
+        yield convert_csv_row_to_document(row)
+
+    if job.count is not None and streamed_count != job.count:
+        msg = "Mismatch between streamed and DB rows! Expected: {} | Actual {}"
+        raise RuntimeError(msg.format(job.count, streamed_count))
+
+
+def document_chunk_gen(documents, chunksize):
+    while True:
+        chunk = list(islice(documents, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def es_direct_data_loader(client, fetch_jobs, config):
+    """Does the work of both download_db_records and es_data_loader, minus the CSV file in between"""
+    if config["create_new_index"]:
+        # ensure template for index is present and the latest version
+        call_command("es_configure", "--template-only", "--load_type={}".format(config["load_type"]))
+    while True:
+        try:
+            job = fetch_jobs.get(timeout=JOB_QUEUE_TIMEOUT_SECONDS)
+        except Empty:
+            break
+
+        printf({"msg": "Starting new job", "job": job.name, "f": "ES Ingest"})
+        sql_config = {
+            "starting_date": config["starting_date"],
+            "fiscal_year": job.fy,
+            "load_type": config["load_type"],
+        }
+        copy_sql, count_sql = configure_stream_sql_strings(sql_config)
+        if not config["skip_counts"]:
+            job.count = execute_sql_statement(count_sql, True, config["verbose"])[0]["count"]
+
+        post_to_elasticsearch(client, job, config, documents=db_document_gen(copy_sql, job))
+
+    printf({"msg": "Completed Elasticsearch data load", "f": "ES Ingest"})
+    return
 
 
 def es_data_loader(client, fetch_jobs, done_jobs, config):
@@ -437,27 +564,41 @@ def es_data_loader(client, fetch_jobs, done_jobs, config):
         # ensure template for index is present and the latest version
         call_command("es_configure", "--template-only", "--load_type={}".format(config["load_type"]))
     while True:
-        if not done_jobs.empty():
-            job = done_jobs.get_nowait()
-            if job.name is None:
-                break
-
-            printf({"msg": "Starting new job", "job": job.name, "f": "ES Ingest"})
-            post_to_elasticsearch(client, job, config)
-            if os.path.exists(job.csv):
-                os.remove(job.csv)
-        else:
-            printf({"msg": "No Job. Sleeping 45s", "f": "ES Ingest"})
-            sleep(45)
+        job = done_jobs.get()  # blocks until the download process has a CSV ready
+        if job.name is None:
+            break
+
+        printf({"msg": "Starting new job", "job": job.name, "f": "ES Ingest"})
+        post_to_elasticsearch(client, job, config)
+        if os.path.exists(job.csv):
+            os.remove(job.csv)
 
     printf({"msg": "Completed Elasticsearch data load", "f": "ES Ingest"})
     return
 
 
-def streaming_post_to_es(client, chunk, index_name: str, type: str, job_id=None):
+def parallel_post_to_es(client, documents, index_name: str, config, job_id=None, ignore_status=(), **bulk_kwargs):
+    """
+    Bulk posts the documents (or any other bulk actions) several chunks at a time.  Actions that fail with one of the
+    statuses in ignore_status (like a 404 deleting a document that's already gone) are counted as successes.
+    """
     success, failed = 0, 0
+    if ignore_status:
+        # The bulk helpers of the pinned elasticsearch client can't ignore statuses, so failures are checked here
+        bulk_kwargs["raise_on_error"] = False
     try:
-        for ok, item in helpers.streaming_bulk(client, chunk, index=index_name):
+        for ok, item in helpers.parallel_bulk(
+            client,
+            documents,
+            index=index_name,
+            thread_count=config.get("ingest_threads", DEFAULT_INGEST_THREADS),
+            max_chunk_bytes=config.get("bulk_max_bytes", DEFAULT_BULK_MAX_BYTES),
+            **bulk_kwargs,
+        ):
+            if not ok and ignore_status:
+                ok = next(iter(item.values())).get("status") in ignore_status
+                if not ok:
+                    raise helpers.BulkIndexError("1 document(s) failed to index.", [item])
             success = [success, success + 1][ok]
             failed = [failed + 1, failed][ok]
 
@@ -542,7 +683,8 @@ def swap_aliases(client, index, load_type):
         printf({"msg": "ERROR: Unable to delete indexes: {}".format(old_indexes), "f": "ES Alias Drop"})
 
 
-def post_to_elasticsearch(client, job, config, chunksize=250000):
+def post_to_elasticsearch(client, job, config, chunksize=250000, documents=None):
+    """Indexes the documents provided, or when none are, the documents in the job's CSV"""
     printf({"msg": 'Populating ES Index "{}"'.format(job.index), "job": job.name, "f": "ES Ingest"})
     start = perf_counter()
     try:
@@ -555,38 +697,42 @@ def post_to_elasticsearch(client, job, config, chunksize=250000):
         client.indices.create(index=job.index)
         client.indices.refresh(job.index)
 
-    csv_generator = csv_chunk_gen(job.csv, chunksize, job.name, config["load_type"])
-    for count, chunk in enumerate(csv_generator):
-        if len(chunk) == 0:
-            printf({"msg": "No documents to add/delete for chunk #{}".format(count), "f": "ES Ingest", "job": job.name})
-            continue
-        iteration = perf_counter()
-        if config["process_deletes"]:
+    if documents is None:
+        documents = csv_document_gen(job.csv, job.name)
+    if not config["process_deletes"]:
+        # Nothing needs to happen between reading and posting documents, so stream them straight through
+        printf({"msg": "Streaming to ES [{} rows]".format(job.count), "job": job.name, "f": "ES Ingest"})
+        parallel_post_to_es(client, documents, job.index, config, job.name)
+    else:
+        for count, chunk in enumerate(document_chunk_gen(documents, chunksize)):
+            iteration = perf_counter()
             if config["load_type"] == "awards":
                 id_list = [{"key": c[UNIVERSAL_AWARD_ID_NAME], "col": UNIVERSAL_AWARD_ID_NAME} for c in chunk]
-                delete_from_es(client, id_list, job.name, config, job.index)
+                delete_from_es(client, id_list, job.name, config, job.index, refresh=False)
             else:
                 id_list = [
                     {"key": c[UNIVERSAL_TRANSACTION_ID_NAME], "col": UNIVERSAL_TRANSACTION_ID_NAME} for c in chunk
                 ]
-                delete_from_es(client, id_list, job.name, config, job.index)
+                delete_from_es(client, id_list, job.name, config, job.index, refresh=False)
 
-        current_rows = "({}-{})".format(count * chunksize + 1, count * chunksize + len(chunk))
-        printf(
-            {
-                "msg": "Streaming to ES #{} rows [{}/{}]".format(count, current_rows, job.count),
-                "job": job.name,
-                "f": "ES Ingest",
-            }
-        )
-        streaming_post_to_es(client, chunk, job.index, config["load_type"], job.name)
-        printf(
-            {
-                "msg": "Iteration group #{} took {}s".format(count, perf_counter() - iteration),
-                "job": job.name,
-                "f": "ES Ingest",
-            }
-        )
+            current_rows = "({}-{})".format(count * chunksize + 1, count * chunksize + len(chunk))
+            printf(
+                {
+                    "msg": "Streaming to ES #{} rows [{}/{}]".format(count, current_rows, job.count),
+                    "job": job.name,
+                    "f": "ES Ingest",
+                }
+            )
+            parallel_post_to_es(client, chunk, job.index, config, job.name)
+            printf(
+                {
+                    "msg": "Iteration group #{} took {}s".format(count, perf_counter() - iteration),
+                    "job": job.name,
+                    "f": "ES Ingest",
+                }
+            )
+        # Deleted documents disappear from searches once, after the whole job, rather than after every chunk
+        client.indices.refresh(job.index)
     printf(
         {
             "msg": "Elasticsearch Index loading took {}s".format(perf_counter() - start),
@@ -702,17 +848,40 @@ def filter_query(column, values, query_type="match_phrase"):
     return {"query": {"bool": {"should": [queries]}}}
 
 
-def delete_query(response):
-    return {"query": {"ids": {"values": [i["_id"] for i in response["hits"]["hits"]]}}}
-
-
 def chunks(l, n):
     """Yield successive n-sized chunks from l."""
     for i in range(0, len(l), n):
         yield l[i : i + n]
 
 
-def delete_from_es(client, id_list, job_id, config, index=None):
+def id_lookup_queries(column, values):
+    """
+    Queries for the documents with any of the values in the column.  Columns with a keyword field are matched many
+    values at a time with a terms query; the rest are only mapped as text and need a match_phrase per value.
+    """
+    keyword_field = ES_ID_KEYWORD_FIELDS.get(column)
+    if keyword_field:
+        for v in chunks(values, TERMS_QUERY_BATCH_SIZE):
+            yield {"query": {"terms": {keyword_field: [str(i) for i in v]}}}
+    else:
+        for v in chunks(values, MATCH_PHRASE_QUERY_BATCH_SIZE):
+            yield filter_query(column, v)
+
+
+def delete_actions(client, col_to_items_dict, config, index):
+    """Bulk delete actions for every document with one of the IDs, found without fetching their source"""
+    for column, values in col_to_items_dict.items():
+        for body in id_lookup_queries(column, values):
+            body["_source"] = False
+            response = client.search(index=index, body=json.dumps(body), size=config["max_query_size"])
+            for hit in response["hits"]["hits"]:
+                action = {"_op_type": "delete", "_index": hit["_index"], "_id": hit["_id"]}
+                if "_routing" in hit:
+                    action["routing"] = hit["_routing"]
+                yield action
+
+
+def delete_from_es(client, id_list, job_id, config, index=None, refresh=True):
     """
     id_list = [{key:'key1',col:'tranaction_id'},
                {key:'key2',col:'generated_unique_transaction_id'}],
@@ -721,6 +890,9 @@ def delete_from_es(client, id_list, job_id, config, index=None):
     id_list = [{key:'key1',col:'award_id'},
                {key:'key2',col:'generated_unique_award_id'}],
                ...]
+
+    Documents are deleted by _id through the same bulk helper that indexes them.  The index is refreshed once at the
+    end, unless refresh is False and the caller will refresh it when it's done.
     """
     start = perf_counter()
 
@@ -728,33 +900,23 @@ def delete_from_es(client, id_list, job_id, config, index=None):
 
     if index is None:
         index = "{}-*".format(config["root_index"])
-    start_ = client.count(index=index)["count"]
-    printf({"msg": "Starting amount of indices ----- {}".format(start_), "f": "ES Delete", "job": job_id})
     col_to_items_dict = defaultdict(list)
     for l in id_list:
         col_to_items_dict[l["col"]].append(l["key"])
 
     for column, values in col_to_items_dict.items():
         printf({"msg": 'Deleting {} of "{}"'.format(len(values), column), "f": "ES Delete", "job": job_id})
-        values_generator = chunks(values, 1000)
-        for v in values_generator:
-            # IMPORTANT: This delete routine looks at just 1 index at a time. If there are duplicate records across
-            # multiple indexes, those duplicates will not be caught by this routine. It is left as is because at the
-            # time of this comment, we are migrating to using a single index.
-            body = filter_query(column, v)
-            response = client.search(index=index, body=json.dumps(body), size=config["max_query_size"])
-            delete_body = delete_query(response)
-            try:
-                client.delete_by_query(
-                    index=index, body=json.dumps(delete_body), refresh=True, size=config["max_query_size"]
-                )
-            except Exception as e:
-                printf({"msg": "[ERROR][ERROR][ERROR]\n{}".format(str(e)), "f": "ES Delete", "job": job_id})
-    end_ = client.count(index=index)["count"]
+
+    # IMPORTANT: Each lookup finds at most max_query_size documents across every index matching `index`, so a batch of
+    # IDs duplicated more often than that leaves the extra duplicates behind.
+    deleted, _ = parallel_post_to_es(
+        client, delete_actions(client, col_to_items_dict, config, index), index, config, job_id, ignore_status=(404,)
+    )
+    if refresh:
+        client.indices.refresh(index)
 
     t = perf_counter() - start
-    total = str(start_ - end_)
-    printf({"msg": "ES Deletes took {}s. Deleted {} records".format(t, total), "f": "ES Delete", "job": job_id})
+    printf({"msg": "ES Deletes took {}s. Deleted {} records".format(t, deleted), "f": "ES Delete", "job": job_id})
     return
 
 
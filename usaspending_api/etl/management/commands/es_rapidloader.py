@@ -10,7 +10,7 @@ from usaspending_api.common.elasticsearch.client import instantiate_elasticsearc
 from usaspending_api.common.elasticsearch.elasticsearch_sql_helpers import ensure_view_exists
 from usaspending_api.common.helpers.date_helper import datetime_command_line_argument_type, fy as parse_fiscal_year
 from usaspending_api.common.helpers.fiscal_year_helpers import create_fiscal_year_list
-from usaspending_api.etl.es_etl_helpers import printf
+from usaspending_api.etl.es_etl_helpers import DEFAULT_BULK_MAX_BYTES, DEFAULT_INGEST_THREADS, printf
 from usaspending_api.etl.rapidloader import Rapidloader
 
 
@@ -22,7 +22,7 @@ class Command(BaseCommand):
          2. Iterate by job
            a. Download a CSV file by year (one at a time)
                i. Continue to download a CSV file until all years are downloaded
-           b. Upload a CSV to Elasticsearch
+           b. Stream a CSV to Elasticsearch using concurrent bulk requests
                i. Continue to upload a CSV file until all years are uploaded to ES
            c. Delete CSV file
     TO RELOAD ALL data:
@@ -99,6 +99,24 @@ class Command(BaseCommand):
             help="When creating a new index skip the step that deletes the old indexes and swaps the aliases. "
             "Only used when --create-new-index is provided.",
         )
+        parser.add_argument(
+            "--stream-from-db",
+            action="store_true",
+            help="Stream rows from the database straight into Elasticsearch instead of writing a CSV file per "
+            "fiscal year first. --dir is not used for data files in this mode.",
+        )
+        parser.add_argument(
+            "--ingest-threads",
+            type=int,
+            default=DEFAULT_INGEST_THREADS,
+            help="Number of threads concurrently posting bulk requests to Elasticsearch",
+        )
+        parser.add_argument(
+            "--bulk-max-bytes",
+            type=int,
+            default=DEFAULT_BULK_MAX_BYTES,
+            help="Maximum size in bytes of a single bulk request posted to Elasticsearch",
+        )
 
     def handle(self, *args, **options):
         elasticsearch_client = instantiate_elasticsearch_client()
@@ -134,6 +152,9 @@ def process_cli_parameters(options: dict, es_client) -> dict:
         "directory",
         "skip_counts",
         "load_type",
+        "ingest_threads",
+        "bulk_max_bytes",
+        "stream_from_db",
     )
     config = set_config(simple_args, options)
 
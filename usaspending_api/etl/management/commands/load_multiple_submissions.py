@@ -4,17 +4,64 @@ from collections import namedtuple
 from django.conf import settings
 from django.core.management import call_command
 from django.core.management.base import BaseCommand
+from django.db import connections, transaction
+from usaspending_api.accounts.models import AppropriationAccountBalances
+from usaspending_api.broker.helpers.parallel_load import load_in_groups
 from usaspending_api.common.helpers.date_helper import datetime_command_line_argument_type
 from usaspending_api.common.helpers.sql_helpers import execute_sql_to_named_tuple
 from usaspending_api.etl.management.helpers.load_submission import (
     calculate_load_submissions_since_datetime,
     get_publish_history_table,
 )
+from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
 from usaspending_api.submissions.models import SubmissionAttributes
 
 logger = logging.getLogger("script")
 
 
+def load_submissions(submission_ids):
+    """
+    Loads each of the submissions in order, each in its own transaction, leaving final_of_fy to be recalculated once
+    everything is loaded.  Returns the ids of the submissions that failed to load.
+    """
+    failed_submissions = []
+    for submission_id in submission_ids:
+        try:
+            call_command("load_submission", submission_id, "--skip-final-of-fy")
+        except (Exception, SystemExit):
+            logger.exception(f"Submission {submission_id} failed to load")
+            failed_submissions.append(submission_id)
+    return failed_submissions
+
+
+def get_submission_partition_keys(submission_ids):
+    """
+    Submissions for the same agency and fiscal year supersede one another (and create the same program activities)
+    so they share a key and are loaded in order by the same worker.
+    """
+    with connections["data_broker"].cursor() as cursor:
+        cursor.execute(
+            """
+                select  submission_id, coalesce(cgac_code, frec_code), reporting_fiscal_year
+                from    submission
+                where   submission_id = any(%s)
+            """,
+            [list(submission_ids)],
+        )
+        return {submission_id: f"{toptier_code}/{fiscal_year}" for submission_id, toptier_code, fiscal_year in cursor}
+
+
+def group_submissions(submission_ids, partition_keys):
+    """
+    The submission_ids grouped on their partition key (see get_submission_partition_keys), in their original order
+    within each group, with the largest groups first.  Submissions without a key are each a group of their own.
+    """
+    groups = {}
+    for submission_id in submission_ids:
+        groups.setdefault(partition_keys.get(submission_id, submission_id), []).append(submission_id)
+    return sorted(groups.values(), key=len, reverse=True)
+
+
 class Command(BaseCommand):
     def add_arguments(self, parser):
         mutually_exclusive_group = parser.add_mutually_exclusive_group(required=True)
@@ -40,6 +87,16 @@ class Command(BaseCommand):
             action="store_true",
             help="Only list submissions to be loaded.  Do not actually load them.",
         )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=1,
+            help=(
+                "Number of submissions to load at the same time, each in its own process and transaction.  "
+                "Submissions for the same agency and fiscal year are always loaded one after another in the order "
+                "they were published."
+            ),
+        )
 
     def handle(self, *args, **options):
         certified_only_submission_ids, load_submission_ids = self.get_submission_ids(
@@ -54,7 +111,7 @@ class Command(BaseCommand):
             logger.info("Exiting script before data load occurs in accordance with the --list-ids-only flag.")
             return
 
-        self.process_submissions(certified_only_submission_ids, load_submission_ids)
+        self.process_submissions(certified_only_submission_ids, load_submission_ids, options["processes"])
 
     def get_submission_ids(self, submission_ids, start_datetime):
         if submission_ids:
@@ -89,7 +146,7 @@ class Command(BaseCommand):
         return since_datetime
 
     @staticmethod
-    def process_submissions(certified_only_submission_ids, load_submission_ids):
+    def process_submissions(certified_only_submission_ids, load_submission_ids, processes=1):
         failed_submissions = []
 
         for submission in certified_only_submission_ids:
@@ -103,12 +160,21 @@ class Command(BaseCommand):
                 logger.exception(f"Submission {submission.submission_id} failed to update")
                 failed_submissions.append(submission.submission_id)
 
-        for submission_id in load_submission_ids:
-            try:
-                call_command("load_submission", submission_id)
-            except (Exception, SystemExit):
-                logger.exception(f"Submission {submission_id} failed to load")
-                failed_submissions.append(submission_id)
+        if load_submission_ids:
+            if processes > 1 and len(load_submission_ids) > 1:
+                # Each group goes to whichever worker is free next so one worker isn't left with most of the load
+                groups = group_submissions(load_submission_ids, get_submission_partition_keys(load_submission_ids))
+                for failed_submission_ids in load_in_groups(groups, load_submissions, min(processes, len(groups))):
+                    failed_submissions.extend(failed_submission_ids)
+            else:
+                failed_submissions.extend(load_submissions(load_submission_ids))
+
+            # These recalculate whole tables, so run them once after all of the loads rather than once per submission
+            logger.info("Updating final_of_fy and File C to D linkages")
+            with transaction.atomic():
+                AppropriationAccountBalances.populate_final_of_fy()
+                FinancialAccountsByProgramActivityObjectClass.populate_final_of_fy()
+            call_command("update_file_c_linkages")
 
         if failed_submissions:
             logger.error(
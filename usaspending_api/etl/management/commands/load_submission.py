@@ -5,20 +5,20 @@ import signal
 from datetime import datetime, timezone
 from django.core.management import call_command
 from django.core.management.base import CommandError
-from django.db import transaction
+from django.db import connection, transaction
+from psycopg2.extras import execute_values
 from usaspending_api.accounts.models import AppropriationAccountBalances, TreasuryAppropriationAccount
 from usaspending_api.awards.models import Award, FinancialAccountsByAwards
 from usaspending_api.common.helpers.dict_helpers import upper_case_dict_values
+from usaspending_api.disaster.models import refresh_disaster_rollups
 from usaspending_api.etl.broker_etl_helpers import dictfetchall
 from usaspending_api.etl.helpers import get_fiscal_quarter
 from usaspending_api.etl.management import load_base
 from usaspending_api.etl.management.helpers.load_submission import (
     CertifiedAwardFinancial,
+    SubmissionLookups,
     defc_exists,
-    get_object_class,
-    get_or_create_program_activity,
     get_publish_history_table,
-    get_disaster_emergency_fund,
 )
 from usaspending_api.etl.management.load_base import load_data_into_model
 from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
@@ -30,6 +30,71 @@ from usaspending_api.submissions.models import SubmissionAttributes
 # account data
 TAS_ID_TO_ACCOUNT = {}
 
+BULK_CREATE_BATCH_SIZE = 5000
+
+# File C award keys are staged here so every row of a chunk is matched to its award with one query
+CREATE_AWARD_KEYS_TEMP_TABLE = """
+    drop table if exists temp_load_submission_award_keys;
+
+    create temporary table temp_load_submission_award_keys (
+        piid text,
+        parent_award_id text,
+        fain text,
+        uri text
+    );
+"""
+
+MATCH_AWARD_KEYS_SQL = """
+    with piid_matches as (
+        select      k.piid, k.parent_award_id, min(a.id) as award_id
+        from        (
+                        select distinct piid, parent_award_id
+                        from            temp_load_submission_award_keys
+                        where           piid is not null
+                    ) as k
+                    inner join awards as a on
+                        a.piid = k.piid and
+                        (k.parent_award_id is null or a.parent_award_piid = k.parent_award_id)
+        where       a.latest_transaction_id is not null
+        group by    k.piid, k.parent_award_id
+        having      count(*) = 1
+    ), fain_matches as (
+        select      a.fain, min(a.id) as award_id
+        from        awards as a
+        where       a.fain in (select fain from temp_load_submission_award_keys where piid is null) and
+                    a.latest_transaction_id is not null
+        group by    a.fain
+        having      count(*) = 1
+    ), uri_matches as (
+        select      a.uri, min(a.id) as award_id
+        from        awards as a
+        where       a.uri in (select uri from temp_load_submission_award_keys where piid is null) and
+                    a.latest_transaction_id is not null
+        group by    a.uri
+        having      count(*) = 1
+    )
+    select
+        k.piid,
+        k.parent_award_id,
+        k.fain,
+        k.uri,
+        case
+            when k.piid is not null then p.award_id
+            else coalesce(f.award_id, u.award_id)
+        end as award_id
+    from
+        temp_load_submission_award_keys as k
+        left outer join piid_matches as p on
+            p.piid = k.piid and p.parent_award_id is not distinct from k.parent_award_id
+        left outer join fain_matches as f on f.fain = k.fain
+        left outer join uri_matches as u on u.uri = k.uri
+    where
+        case
+            when k.piid is not null then p.award_id
+            else coalesce(f.award_id, u.award_id)
+        end is not null
+"""
+
 logger = logging.getLogger("script")
 
 
@@ -46,6 +111,14 @@ class Command(load_base.Command):
 
     def add_arguments(self, parser):
         parser.add_argument("submission_id", help="Broker submission_id to load", type=int)
+        parser.add_argument(
+            "--skip-final-of-fy",
+            action="store_true",
+            help=(
+                "Don't recalculate final_of_fy for Files A and B after loading.  For callers loading several "
+                "submissions that will recalculate it once they're all loaded."
+            ),
+        )
         super(Command, self).add_arguments(parser)
 
     @transaction.atomic
@@ -106,6 +179,7 @@ class Command(load_base.Command):
             raise RuntimeError(f"d2_submission {submission_data['d2_submission']} is not allowed")
 
         submission_attributes = get_submission_attributes(submission_id, submission_data)
+        lookups = SubmissionLookups(submission_attributes)
 
         logger.info("Getting File A data")
         db_cursor.execute("SELECT * FROM certified_appropriation WHERE submission_id = %s", [submission_id])
@@ -115,7 +189,7 @@ class Command(load_base.Command):
         )
         logger.info("Loading File A data")
         start_time = datetime.now()
-        load_file_a(submission_attributes, appropriation_data, db_cursor)
+        load_file_a(submission_attributes, appropriation_data, db_cursor, not options["skip_final_of_fy"])
         logger.info(f"Finished loading File A data, took {datetime.now() - start_time}")
 
         logger.info("Getting File B data")
@@ -126,11 +200,11 @@ class Command(load_base.Command):
         )
         logger.info("Loading File B data")
         start_time = datetime.now()
-        load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor)
+        load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor, lookups, not options["skip_final_of_fy"])
         logger.info(f"Finished loading File B data, took {datetime.now() - start_time}")
 
         logger.info("Getting File C data")
-        certified_award_financial = CertifiedAwardFinancial(submission_attributes)
+        certified_award_financial = CertifiedAwardFinancial(submission_attributes, lookups)
         logger.info(
             f"Acquired File C (award financial) data for {submission_id}, "
             f"there are {certified_award_financial.count:,} rows."
@@ -140,6 +214,9 @@ class Command(load_base.Command):
         load_file_c(submission_attributes, db_cursor, certified_award_financial)
         logger.info(f"Finished loading File C data, took {datetime.now() - start_time}")
 
+        logger.info("Refreshing disaster rollups")
+        refresh_disaster_rollups([submission_id])
+
         # Once all the files have been processed, run any global cleanup/post-load tasks.
         # Cleanup not specific to this submission is run in the `.handle` method
         logger.info(f"Successfully loaded submission {submission_id}.")
@@ -155,36 +232,59 @@ def update_skipped_tas(row, tas_rendering_label, skipped_tas):
         skipped_tas[tas_rendering_label]["rows"] += [row["row_number"]]
 
 
-def get_treasury_appropriation_account_tas_lookup(tas_lookup_id, db_cursor):
-    """Get the matching TAS object from the broker database and save it to our running list."""
-    if tas_lookup_id in TAS_ID_TO_ACCOUNT:
-        return TAS_ID_TO_ACCOUNT[tas_lookup_id]
-    # Checks the broker DB tas_lookup table for the tas_id and returns the matching TAS object in the datastore
-    db_cursor.execute(
-        "SELECT * FROM tas_lookup WHERE (financial_indicator2 <> 'F' OR financial_indicator2 IS NULL) "
-        "AND account_num = %s",
-        [tas_lookup_id],
-    )
-    tas_data = dictfetchall(db_cursor)
-
-    if tas_data is None or len(tas_data) == 0:
-        return None, f"Account number {tas_lookup_id} not found in Broker"
-
-    tas_rendering_label = TreasuryAppropriationAccount.generate_tas_rendering_label(
-        ata=tas_data[0]["allocation_transfer_agency"],
-        aid=tas_data[0]["agency_identifier"],
-        typecode=tas_data[0]["availability_type_code"],
-        bpoa=tas_data[0]["beginning_period_of_availa"],
-        epoa=tas_data[0]["ending_period_of_availabil"],
-        mac=tas_data[0]["main_account_code"],
-        sub=tas_data[0]["sub_account_code"],
-    )
+def _skip_missing_tas(row, tas_lookups, skipped_tas):
+    treasury_account, tas_rendering_label = tas_lookups[row.get("tas_id")]
+    if treasury_account is None:
+        update_skipped_tas(row, tas_rendering_label, skipped_tas)
+        return True
+    return False
 
-    TAS_ID_TO_ACCOUNT[tas_lookup_id] = (
-        TreasuryAppropriationAccount.objects.filter(tas_rendering_label=tas_rendering_label).first(),
-        tas_rendering_label,
-    )
-    return TAS_ID_TO_ACCOUNT[tas_lookup_id]
+
+def get_treasury_appropriation_account_tas_lookups(tas_lookup_ids, db_cursor):
+    """
+    Get the matching (TAS object, TAS rendering label) of every one of the tas_lookup_ids, keyed by id.  Ids that aren't
+    in our running list yet are looked up with one broker query and one TreasuryAppropriationAccount query rather than
+    a pair of queries per id, then saved to the list.
+    """
+    missing_ids = {tas_lookup_id for tas_lookup_id in tas_lookup_ids if tas_lookup_id not in TAS_ID_TO_ACCOUNT}
+
+    # Checks the broker DB tas_lookup table for the tas_ids and finds the matching TAS objects in the datastore
+    tas_rendering_labels = {}
+    query_ids = [tas_lookup_id for tas_lookup_id in missing_ids if tas_lookup_id is not None]
+    if query_ids:
+        db_cursor.execute(
+            "SELECT * FROM tas_lookup WHERE (financial_indicator2 <> 'F' OR financial_indicator2 IS NULL) "
+            "AND account_num = ANY(%s)",
+            [query_ids],
+        )
+        for tas_data in dictfetchall(db_cursor) or []:
+            if tas_data["account_num"] in tas_rendering_labels:
+                continue
+            tas_rendering_labels[tas_data["account_num"]] = TreasuryAppropriationAccount.generate_tas_rendering_label(
+                ata=tas_data["allocation_transfer_agency"],
+                aid=tas_data["agency_identifier"],
+                typecode=tas_data["availability_type_code"],
+                bpoa=tas_data["beginning_period_of_availa"],
+                epoa=tas_data["ending_period_of_availabil"],
+                mac=tas_data["main_account_code"],
+                sub=tas_data["sub_account_code"],
+            )
+
+    treasury_accounts = {}
+    for treasury_account in TreasuryAppropriationAccount.objects.filter(
+        tas_rendering_label__in=set(tas_rendering_labels.values())
+    ).order_by("pk"):
+        treasury_accounts.setdefault(treasury_account.tas_rendering_label, treasury_account)
+
+    for tas_lookup_id, tas_rendering_label in tas_rendering_labels.items():
+        TAS_ID_TO_ACCOUNT[tas_lookup_id] = (treasury_accounts.get(tas_rendering_label), tas_rendering_label)
+
+    return {
+        tas_lookup_id: TAS_ID_TO_ACCOUNT.get(
+            tas_lookup_id, (None, f"Account number {tas_lookup_id} not found in Broker")
+        )
+        for tas_lookup_id in tas_lookup_ids
+    }
 
 
 def get_submission_attributes(submission_id, submission_data):
@@ -223,7 +323,7 @@ def get_submission_attributes(submission_id, submission_data):
     return new_submission
 
 
-def load_file_a(submission_attributes, appropriation_data, db_cursor):
+def load_file_a(submission_attributes, appropriation_data, db_cursor, populate_final_of_fy=True):
     """ Process and load file A broker data (aka TAS balances, aka appropriation account balances). """
     reverse = re.compile("gross_outlay_amount_by_tas_cpe")
 
@@ -233,13 +333,16 @@ def load_file_a(submission_attributes, appropriation_data, db_cursor):
     # rows = row numbers skipped, corresponding to the original row numbers in the file that was submitted
     skipped_tas = {}
 
+    tas_lookups = get_treasury_appropriation_account_tas_lookups(
+        [row.get("tas_id") for row in appropriation_data], db_cursor
+    )
+    appropriation_balances_to_create = []
+
     # Create account objects
     for row in appropriation_data:
 
         # Check and see if there is an entry for this TAS
-        treasury_account, tas_rendering_label = get_treasury_appropriation_account_tas_lookup(
-            row.get("tas_id"), db_cursor
-        )
+        treasury_account, tas_rendering_label = tas_lookups[row.get("tas_id")]
         if treasury_account is None:
             update_skipped_tas(row, tas_rendering_label, skipped_tas)
             continue
@@ -259,11 +362,15 @@ def load_file_a(submission_attributes, appropriation_data, db_cursor):
 
         field_map = {}
 
-        load_data_into_model(
-            appropriation_balances, row, field_map=field_map, value_map=value_map, save=True, reverse=reverse
+        appropriation_balances_to_create.append(
+            load_data_into_model(appropriation_balances, row, field_map=field_map, value_map=value_map, reverse=reverse)
         )
 
-    AppropriationAccountBalances.populate_final_of_fy()
+    AppropriationAccountBalances.objects.bulk_create(
+        appropriation_balances_to_create, batch_size=BULK_CREATE_BATCH_SIZE
+    )
+    if populate_final_of_fy:
+        AppropriationAccountBalances.populate_final_of_fy()
 
     for key in skipped_tas:
         logger.info(f"Skipped {skipped_tas[key]['count']:,} rows due to missing TAS: {key}")
@@ -411,9 +518,10 @@ def get_file_b(submission_attributes, db_cursor):
     return data
 
 
-def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
+def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor, lookups=None, populate_final_of_fy=True):
     """ Process and load file B broker data (aka TAS balances by program activity and object class). """
     reverse = re.compile(r"(_(cpe|fyb)$)|^transaction_obligated_amount$")
+    lookups = lookups or SubmissionLookups(submission_attributes)
 
     # dictionary to capture TAS that were skipped and some metadata
     # tas = top-level key
@@ -421,24 +529,32 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
     # rows = row numbers skipped, corresponding to the original row numbers in the file that was submitted
     skipped_tas = {}
 
-    test_counter = 0
+    tas_lookups = get_treasury_appropriation_account_tas_lookups(
+        [row.get("tas_id") for row in prg_act_obj_cls_data], db_cursor
+    )
+
+    # the account balances rows (aka "File A" records) of this submission, by TAS
+    account_balances_by_tas = {
+        account_balances.treasury_account_identifier_id: account_balances
+        for account_balances in AppropriationAccountBalances.objects.filter(
+            submission_id=submission_attributes.submission_id
+        )
+    }
+
+    financial_by_prg_act_obj_cls_to_create = []
     for row in prg_act_obj_cls_data:
-        test_counter += 1
-        try:
-            # Check and see if there is an entry for this TAS
-            treasury_account, tas_rendering_label = get_treasury_appropriation_account_tas_lookup(
-                row.get("tas_id"), db_cursor
-            )
-            if treasury_account is None:
-                update_skipped_tas(row, tas_rendering_label, skipped_tas)
-                continue
-        except Exception:  # TODO: What is this trying to catch, actually?
+        # Check and see if there is an entry for this TAS
+        treasury_account, tas_rendering_label = tas_lookups[row.get("tas_id")]
+        if treasury_account is None:
+            update_skipped_tas(row, tas_rendering_label, skipped_tas)
             continue
 
         # get the corresponding account balances row (aka "File A" record)
-        account_balances = AppropriationAccountBalances.objects.get(
-            treasury_account_identifier=treasury_account, submission_id=submission_attributes.submission_id
-        )
+        account_balances = account_balances_by_tas.get(treasury_account.treasury_account_identifier)
+        if account_balances is None:
+            raise AppropriationAccountBalances.DoesNotExist(
+                f"No File A record for {tas_rendering_label} in submission {submission_attributes.submission_id}"
+            )
 
         financial_by_prg_act_obj_cls = FinancialAccountsByProgramActivityObjectClass()
 
@@ -448,13 +564,19 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
             "reporting_period_end": submission_attributes.reporting_period_end,
             "treasury_account": treasury_account,
             "appropriation_account_balances": account_balances,
-            "object_class": get_object_class(row["object_class"], row["by_direct_reimbursable_fun"]),
-            "program_activity": get_or_create_program_activity(row, submission_attributes),
-            "disaster_emergency_fund": get_disaster_emergency_fund(row),
+            "object_class": lookups.object_class(row["object_class"], row["by_direct_reimbursable_fun"]),
+            "program_activity": lookups.program_activity(row),
+            "disaster_emergency_fund": lookups.disaster_emergency_fund(row),
         }
-        load_data_into_model(financial_by_prg_act_obj_cls, row, value_map=value_map, save=True, reverse=reverse)
+        financial_by_prg_act_obj_cls_to_create.append(
+            load_data_into_model(financial_by_prg_act_obj_cls, row, value_map=value_map, reverse=reverse)
+        )
 
-    FinancialAccountsByProgramActivityObjectClass.populate_final_of_fy()
+    FinancialAccountsByProgramActivityObjectClass.objects.bulk_create(
+        financial_by_prg_act_obj_cls_to_create, batch_size=BULK_CREATE_BATCH_SIZE
+    )
+    if populate_final_of_fy:
+        FinancialAccountsByProgramActivityObjectClass.populate_final_of_fy()
 
     for key in skipped_tas:
         logger.info(f"Skipped {skipped_tas[key]['count']:,} rows due to missing TAS: {key}")
@@ -466,48 +588,46 @@ def load_file_b(submission_attributes, prg_act_obj_cls_data, db_cursor):
     logger.info(f"Skipped a total of {total_tas_skipped:,} TAS rows for File B")
 
 
-def find_matching_award(piid=None, parent_piid=None, fain=None, uri=None):
+def award_key(row):
     """
-        Check for a distinct award that matches based on the parameters provided
-
-        :param piid: PIID associated with a contract
-        :param parent_piid: Parent Award ID associated with a contract
-        :param fain: FAIN associated with a financial assistance award
-        :param uri: URI associated with a financial assistancw award
-        :return: Award object containing an exact matched award OR None if no exact match found
+    The File C values we match awards on, as (piid, parent_award_id, fain, uri).  Blank values are None and the parent
+    award id is only kept alongside a PIID since it's ignored otherwise.
     """
-    filters = {"latest_transaction_id__isnull": False}
-
-    if not (piid or fain or uri):
-        return None
-
-    # check piid and parent_piid
-    if piid:
-        filters["piid"] = piid
-        if parent_piid:
-            filters["parent_award_piid"] = parent_piid
-    elif fain and not uri:
-        # if only the fain is populated, filter on that
-        filters["fain"] = fain
-    elif not fain and uri:
-        # if only the uri is populated, filter on that
-        filters["uri"] = uri
-    else:
-        # if both fain and uri are populated, filter on fain first for an exact match. if no exact match found,
-        # then try filtering on the uri
-        filters["fain"] = fain
-        fain_award_count = Award.objects.filter(**filters).count()
+    piid = row.get("piid") or None
+    return (
+        piid,
+        (row.get("parent_award_id") or None) if piid else None,
+        row.get("fain") or None,
+        row.get("uri") or None,
+    )
 
-        if fain_award_count != 1:
-            del filters["fain"]
-            filters["uri"] = uri
 
-    awards = Award.objects.filter(**filters).all()
+def find_matching_awards(award_keys):
+    """
+        Check for a distinct award matching each of the award_keys (see award_key) with one query
 
-    if len(awards) == 1:
-        return awards[0]
-    else:
-        return None
+        - a PIID matches on piid, and parent_award_piid too when a parent award id is provided
+        - otherwise a FAIN matches on fain and a URI on uri, and if both are provided the FAIN is tried first
+        - only awards with a latest transaction are considered, and only an exact (one award) match counts
+
+        :param award_keys: (piid, parent_award_id, fain, uri) tuples
+        :return: dictionary of award key to the id of its exactly matched award, leaving out keys with no exact match
+    """
+    award_keys = {key for key in award_keys if any(key)}
+    if not award_keys:
+        return {}
+
+    with connection.cursor() as cursor:
+        cursor.execute(CREATE_AWARD_KEYS_TEMP_TABLE)
+        execute_values(
+            cursor.cursor,
+            "insert into temp_load_submission_award_keys (piid, parent_award_id, fain, uri) values %s",
+            award_keys,
+            page_size=BULK_CREATE_BATCH_SIZE,
+        )
+        cursor.execute("analyze temp_load_submission_award_keys")
+        cursor.execute(MATCH_AWARD_KEYS_SQL)
+        return {(piid, parent_award_id, fain, uri): award_id for piid, parent_award_id, fain, uri, award_id in cursor}
 
 
 def load_file_c(submission_attributes, db_cursor, certified_award_financial):
@@ -532,62 +652,46 @@ def load_file_c(submission_attributes, db_cursor, certified_award_financial):
     skipped_tas = {}
     total_rows = certified_award_financial.count
     start_time = datetime.now()
-    awards_touched = []
-
-    for index, row in enumerate(certified_award_financial, 1):
-        if not (index % 100):
-            logger.info(f"C File Load: Loading row {index:,} of {total_rows:,} ({datetime.now() - start_time})")
-
-        upper_case_dict_values(row)
-
-        # Check and see if there is an entry for this TAS
-        treasury_account, tas_rendering_label = get_treasury_appropriation_account_tas_lookup(
-            row.get("tas_id"), db_cursor
-        )
-        if treasury_account is None:
-            update_skipped_tas(row, tas_rendering_label, skipped_tas)
-            continue
-
-        # Find a matching transaction record, so we can use its subtier agency information to match to (or create) an
-        # Award record.
-
-        # Find the award that this award transaction belongs to. If it doesn't exist, create it.
-        filters = {}
-        if row.get("piid"):
-            filters["piid"] = row.get("piid")
-            filters["parent_piid"] = row.get("parent_award_id")
-        else:
-            if row.get("fain") and not row.get("uri"):
-                filters["fain"] = row.get("fain")
-            elif row.get("uri") and not row.get("fain"):
-                filters["uri"] = row.get("uri")
-            else:
-                filters["fain"] = row.get("fain")
-                filters["uri"] = row.get("uri")
-
-        award = find_matching_award(**filters)
-
-        if award:
-            awards_touched += [award]
-
-        award_financial_data = FinancialAccountsByAwards()
-
-        value_map_faba = {
-            "award": award,
-            "submission": submission_attributes,
-            "reporting_period_start": submission_attributes.reporting_period_start,
-            "reporting_period_end": submission_attributes.reporting_period_end,
-            "treasury_account": treasury_account,
-            "object_class": row.get("object_class"),
-            "program_activity": row.get("program_activity"),
-            "disaster_emergency_fund": get_disaster_emergency_fund(row),
-        }
-
-        # Still using the cpe|fyb regex compiled above for reverse
-        load_data_into_model(award_financial_data, row, value_map=value_map_faba, save=True, reverse=reverse)
+    awards_touched = set()
+    rows_loaded = 0
+
+    for chunk in certified_award_financial.chunks():
+        for row in chunk:
+            upper_case_dict_values(row)
+
+        # Check and see if there are entries for these TAS
+        tas_lookups = get_treasury_appropriation_account_tas_lookups([row.get("tas_id") for row in chunk], db_cursor)
+        chunk = [row for row in chunk if not _skip_missing_tas(row, tas_lookups, skipped_tas)]
+
+        # Find the award each row belongs to, matching all of the rows in the chunk at once
+        matching_awards = find_matching_awards(award_key(row) for row in chunk)
+        awards_touched.update(matching_awards.values())
+
+        award_financial_to_create = []
+        for row in chunk:
+            award_financial_data = FinancialAccountsByAwards()
+
+            value_map_faba = {
+                "submission": submission_attributes,
+                "reporting_period_start": submission_attributes.reporting_period_start,
+                "reporting_period_end": submission_attributes.reporting_period_end,
+                "treasury_account": tas_lookups[row.get("tas_id")][0],
+                "object_class": row.get("object_class"),
+                "program_activity": row.get("program_activity"),
+                "disaster_emergency_fund": certified_award_financial.lookups.disaster_emergency_fund(row),
+            }
+
+            # Still using the cpe|fyb regex compiled above for reverse
+            load_data_into_model(award_financial_data, row, value_map=value_map_faba, reverse=reverse)
+            award_financial_data.award_id = matching_awards.get(award_key(row))
+            award_financial_to_create.append(award_financial_data)
+
+        FinancialAccountsByAwards.objects.bulk_create(award_financial_to_create, batch_size=BULK_CREATE_BATCH_SIZE)
+        rows_loaded += len(award_financial_to_create)
+        logger.info(f"C File Load: Loaded {rows_loaded:,} of {total_rows:,} rows ({datetime.now() - start_time})")
 
     # Mark the award as updated, so it will be reloaded into ElasticSearch during nightly job
-    Award.objects.filter(id__in=set(a.id for a in awards_touched)).update(update_date=datetime.now(timezone.utc))
+    Award.objects.filter(id__in=awards_touched).update(update_date=datetime.now(timezone.utc))
 
     for key in skipped_tas:
         logger.info(f"Skipped {skipped_tas[key]['count']:,} rows due to missing TAS: {key}")
@@ -598,4 +702,4 @@ def load_file_c(submission_attributes, db_cursor, certified_award_financial):
 
     logger.info(f"Skipped a total of {total_tas_skipped:,} TAS rows for File C")
 
-    return [award.id for award in awards_touched if award]
+    return list(awards_touched)
@@ -1,8 +1,8 @@
 import numpy as np
 import pandas as pd
 
-from collections import deque
 from datetime import timedelta
+from itertools import chain
 from django.conf import settings
 from django.db import connections
 from django.db.models import Max
@@ -18,9 +18,8 @@ class Bunch:
         self.__dict__.update(kwds)
 
 
-def get_or_create_program_activity(row, submission_attributes):
-    # We do it this way rather than .get_or_create because we do not want to duplicate existing pk's with null values
-    filters = {
+def program_activity_filters(row, submission_attributes):
+    return {
         "program_activity_code": row["program_activity_code"],
         "program_activity_name": row["program_activity_name"].upper()
         if row["program_activity_name"]
@@ -30,6 +29,11 @@ def get_or_create_program_activity(row, submission_attributes):
         "allocation_transfer_agency_id": row["allocation_transfer_agency"],
         "main_account_code": row["main_account_code"],
     }
+
+
+def get_or_create_program_activity(row, submission_attributes):
+    # We do it this way rather than .get_or_create because we do not want to duplicate existing pk's with null values
+    filters = program_activity_filters(row, submission_attributes)
     prg_activity = RefProgramActivity.objects.filter(**filters).first()
     if prg_activity is None and row["program_activity_code"] is not None:
         # If the PA has a blank name, create it with the value in the row.
@@ -49,6 +53,41 @@ def get_disaster_emergency_fund(row):
         return None
 
 
+class SubmissionLookups:
+    """
+    Remembers the object class, program activity and DEFC of every distinct combination of values seen while loading
+    one submission so each is only looked up (or created) once rather than once per row.  Created program activities
+    are only valid inside the loading transaction, so don't share one of these across submissions.
+    """
+
+    def __init__(self, submission_attributes):
+        self.submission_attributes = submission_attributes
+        self._object_classes = {}
+        self._program_activities = {}
+        self._disaster_emergency_funds = {}
+
+    def object_class(self, row_object_class, row_direct_reimbursable):
+        key = (row_object_class, row_direct_reimbursable)
+        if key not in self._object_classes:
+            self._object_classes[key] = get_object_class(row_object_class, row_direct_reimbursable)
+        return self._object_classes[key]
+
+    def object_class_row(self, row):
+        return self.object_class(row.object_class, row.by_direct_reimbursable_fun)
+
+    def program_activity(self, row):
+        key = tuple(program_activity_filters(row, self.submission_attributes).values())
+        if key not in self._program_activities:
+            self._program_activities[key] = get_or_create_program_activity(row, self.submission_attributes)
+        return self._program_activities[key]
+
+    def disaster_emergency_fund(self, row):
+        key = row.get("disaster_emergency_fund_code")
+        if key not in self._disaster_emergency_funds:
+            self._disaster_emergency_funds[key] = get_disaster_emergency_fund(row)
+        return self._disaster_emergency_funds[key]
+
+
 def get_object_class_row(row):
     """Lookup an object class record.
 
@@ -109,22 +148,21 @@ def get_object_class(row_object_class, row_direct_reimbursable):
     return get_object_class_row(row)
 
 
-class CertifiedAwardFinancialIterator:
+class CertifiedAwardFinancial:
+    """ Abstract away the messy details of how we retrieve and prepare certified_award_financial rows. """
+
     chunk_size = 100000
 
-    def __init__(self, submission_attributes):
+    def __init__(self, submission_attributes, lookups=None):
         self.submission_attributes = submission_attributes
+        self.lookups = lookups or SubmissionLookups(submission_attributes)
 
-        # For managing state.
-        self._last_id = None
-        self._current_chunk = None
-
-    def _retrieve_and_prepare_next_chunk(self):
+    @cached_property
+    def count(self):
         sql = f"""
-            select  *
+            select  count(*)
             from    certified_award_financial
             where   submission_id = {self.submission_attributes.submission_id} and
-                    {"" if self._last_id is None else f"certified_award_financial_id > {self._last_id} and"}
                     (
                         (
                             transaction_obligated_amou is not null and
@@ -134,46 +172,17 @@ class CertifiedAwardFinancialIterator:
                             gross_outlay_amount_by_awa_cpe != 0
                         )
                     )
-            order   by certified_award_financial_id
-            limit   {self.chunk_size}
         """
+        with connections["data_broker"].cursor() as cursor:
+            cursor.execute(sql)
+            return cursor.fetchall()[0][0]
 
-        award_financial_frame = pd.read_sql(sql, connections["data_broker"])
-
-        if award_financial_frame.size > 0:
-            award_financial_frame["object_class"] = award_financial_frame.apply(get_object_class_row, axis=1)
-            award_financial_frame["program_activity"] = award_financial_frame.apply(
-                get_or_create_program_activity, axis=1, submission_attributes=self.submission_attributes
-            )
-            award_financial_frame = award_financial_frame.replace({np.nan: None})
-
-            self._last_id = award_financial_frame["certified_award_financial_id"].max()
-            self._current_chunk = deque(award_financial_frame.to_dict(orient="records"))
-
-        else:
-            self._last_id = None
-            self._current_chunk = None
-
-    def __next__(self):
-        if not self._current_chunk:
-            self._retrieve_and_prepare_next_chunk()
-            if not self._current_chunk:
-                raise StopIteration
-        return self._current_chunk.popleft()
-
-
-class CertifiedAwardFinancial:
-    """ Abstract away the messy details of how we retrieve and prepare certified_award_financial rows. """
-
-    def __init__(self, submission_attributes):
-        self.submission_attributes = submission_attributes
-
-    @cached_property
-    def count(self):
+    def _retrieve_and_prepare_chunk(self, last_id):
         sql = f"""
-            select  count(*)
+            select  *
             from    certified_award_financial
             where   submission_id = {self.submission_attributes.submission_id} and
+                    {"" if last_id is None else f"certified_award_financial_id > {last_id} and"}
                     (
                         (
                             transaction_obligated_amou is not null and
@@ -183,13 +192,33 @@ class CertifiedAwardFinancial:
                             gross_outlay_amount_by_awa_cpe != 0
                         )
                     )
+            order   by certified_award_financial_id
+            limit   {self.chunk_size}
         """
-        with connections["data_broker"].cursor() as cursor:
-            cursor.execute(sql)
-            return cursor.fetchall()[0][0]
+
+        award_financial_frame = pd.read_sql(sql, connections["data_broker"])
+
+        if award_financial_frame.size == 0:
+            return None, []
+
+        award_financial_frame["object_class"] = award_financial_frame.apply(self.lookups.object_class_row, axis=1)
+        award_financial_frame["program_activity"] = award_financial_frame.apply(self.lookups.program_activity, axis=1)
+        award_financial_frame = award_financial_frame.replace({np.nan: None})
+
+        return (
+            award_financial_frame["certified_award_financial_id"].max(),
+            award_financial_frame.to_dict(orient="records"),
+        )
+
+    def chunks(self):
+        """ Rows in lists of up to chunk_size, in certified_award_financial_id order. """
+        last_id, chunk = self._retrieve_and_prepare_chunk(None)
+        while chunk:
+            yield chunk
+            last_id, chunk = self._retrieve_and_prepare_chunk(last_id)
 
     def __iter__(self):
-        return CertifiedAwardFinancialIterator(self.submission_attributes)
+        return chain.from_iterable(self.chunks())
 
 
 def calculate_load_submissions_since_datetime():
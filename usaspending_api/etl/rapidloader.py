@@ -10,6 +10,7 @@ from usaspending_api.etl.es_etl_helpers import (
     deleted_awards,
     download_db_records,
     es_data_loader,
+    es_direct_data_loader,
     printf,
     process_guarddog,
     set_final_index_config,
@@ -44,20 +45,29 @@ class Rapidloader:
 
         printf({"msg": "There are {} jobs to process".format(job_number)})
 
-        process_list = [
-            Process(
-                name="Download Process",
-                target=download_db_records,
-                args=(download_queue, es_ingest_queue, self.config),
-            ),
-            Process(
-                name="ES Index Process",
-                target=es_data_loader,
-                args=(self.elasticsearch_client, download_queue, es_ingest_queue, self.config),
-            ),
-        ]
-
-        process_list[0].start()  # Start Download process
+        if self.config.get("stream_from_db"):
+            # Rows are streamed from Postgres by the ES Index Process itself, so there's nothing to download
+            process_list = [
+                Process(
+                    name="ES Index Process",
+                    target=es_direct_data_loader,
+                    args=(self.elasticsearch_client, download_queue, self.config),
+                )
+            ]
+        else:
+            process_list = [
+                Process(
+                    name="ES Index Process",
+                    target=es_data_loader,
+                    args=(self.elasticsearch_client, download_queue, es_ingest_queue, self.config),
+                ),
+                Process(
+                    name="Download Process",
+                    target=download_db_records,
+                    args=(download_queue, es_ingest_queue, self.config),
+                ),
+            ]
+            process_list[-1].start()  # Start Download process
 
         if self.config["process_deletes"]:
             process_list.append(
@@ -72,7 +82,7 @@ class Rapidloader:
                 printf({"msg": "Waiting to start ES ingest until S3 deletes are complete"})
                 sleep(7)
 
-        process_list[1].start()  # start ES ingest process
+        process_list[0].start()  # start ES ingest process
 
         while True:
             sleep(10)
@@ -6,10 +6,16 @@ from django.core.management import call_command, CommandError
 from django.db import connections, DEFAULT_DB_ALIAS, ProgrammingError
 from django.test import override_settings, TransactionTestCase
 from model_mommy import mommy
+from unittest.mock import call, patch
 from usaspending_api.accounts.models import AppropriationAccountBalances
 from usaspending_api.awards.models import FinancialAccountsByAwards
 from usaspending_api.common.helpers.sql_helpers import ordered_dictionary_fetcher
-from usaspending_api.etl.management.commands.load_multiple_submissions import Command as LoadMultipleCommand
+from usaspending_api.etl.management.commands import load_multiple_submissions
+from usaspending_api.etl.management.commands.load_multiple_submissions import (
+    Command as LoadMultipleCommand,
+    get_submission_partition_keys,
+    group_submissions,
+)
 from usaspending_api.financial_activities.models import FinancialAccountsByProgramActivityObjectClass
 from usaspending_api.submissions.models import SubmissionAttributes
 
@@ -469,3 +475,34 @@ class TestWithMultipleDatabases(TransactionTestCase):
         assert SubmissionAttributes.objects.get(submission_id=3).create_date == create_date_sub_3
 
         # Ok.  That's probably good enough for now.  Thanks for bearing with me.
+
+    def test_load_in_worker_processes(self):
+        # Submissions 1 and 2 now share an agency and fiscal year, so one worker loads them one after the other.
+        with connections["data_broker"].cursor() as cursor:
+            cursor.execute("update submission set cgac_code = '001' where submission_id = 2")
+        partition_keys = get_submission_partition_keys([1, 2, 3])
+        assert partition_keys == {1: "001/2000", 2: "001/2000", 3: "003/2000"}
+        assert group_submissions([3, 2, 4, 1], partition_keys) == [[2, 1], [3], [4]]
+
+        with patch.object(
+            load_multiple_submissions, "call_command", wraps=call_command
+        ) as mock_call_command, patch.object(
+            AppropriationAccountBalances,
+            "populate_final_of_fy",
+            wraps=AppropriationAccountBalances.populate_final_of_fy,
+        ) as mock_aab_final_of_fy, patch.object(
+            FinancialAccountsByProgramActivityObjectClass,
+            "populate_final_of_fy",
+            wraps=FinancialAccountsByProgramActivityObjectClass.populate_final_of_fy,
+        ) as mock_fabpaoc_final_of_fy:
+            call_command("load_multiple_submissions", "--submission-ids", 1, 2, 3, "--processes", 2)
+
+        assert SubmissionAttributes.objects.count() == 3
+        assert AppropriationAccountBalances.objects.count() == 3
+        assert FinancialAccountsByProgramActivityObjectClass.objects.count() == 5
+        assert FinancialAccountsByAwards.objects.count() == 9
+
+        # The workers load the submissions, then this process updates final_of_fy and the File C linkages once.
+        assert mock_call_command.call_args_list == [call("update_file_c_linkages")]
+        mock_aab_final_of_fy.assert_called_once_with()
+        mock_fabpaoc_final_of_fy.assert_called_once_with()
@@ -0,0 +1,165 @@
+import pytest
+
+from django.db import connections
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from model_mommy import mommy
+from unittest.mock import patch
+from usaspending_api.etl.management.commands import load_submission
+from usaspending_api.etl.management.commands.load_submission import (
+    find_matching_awards,
+    get_treasury_appropriation_account_tas_lookups,
+)
+from usaspending_api.etl.management.helpers.load_submission import SubmissionLookups
+from usaspending_api.etl.transaction_loaders.data_load_helpers import format_insert_or_update_column_sql
+
+
+@pytest.mark.usefixtures("broker_db_setup")
+class TestTasLookups(TestCase):
+    databases = "__all__"
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.treasury_account = mommy.make(
+            "accounts.TreasuryAppropriationAccount",
+            treasury_account_identifier=-99999,
+            tas_rendering_label="1004-1002-1003-1007-1008",
+        )
+
+        base_record = {
+            "tas_id": None,
+            "account_num": None,
+            "allocation_transfer_agency": "1004",
+            "agency_identifier": "1002",
+            "availability_type_code": "1003",
+            "beginning_period_of_availa": None,
+            "ending_period_of_availabil": None,
+            "main_account_code": "1007",
+            "sub_account_code": "1008",
+            "financial_indicator2": None,
+            "internal_start_date": "2015-01-01",
+        }
+        tas_lookup_records = [
+            # Two broker rows for the same account only resolve to one TAS
+            dict(base_record, tas_id=-1, account_num=-11),
+            dict(base_record, tas_id=-2, account_num=-11),
+            # An account with no TAS in USAspending
+            dict(base_record, tas_id=-3, account_num=-12, main_account_code="2007"),
+            # Financing accounts are never looked up
+            dict(base_record, tas_id=-4, account_num=-13, financial_indicator2="F"),
+        ]
+        with connections["data_broker"].cursor() as cursor:
+            for record in tas_lookup_records:
+                columns, values, pairs = format_insert_or_update_column_sql(
+                    cursor, {"tas_lookup": record}, "tas_lookup"
+                )
+                cursor.execute(
+                    f"INSERT INTO tas_lookup {columns} VALUES {values} ON CONFLICT (tas_id) DO UPDATE SET {pairs};"
+                )
+
+    def test_tas_lookups_are_batched(self):
+        with patch.dict(load_submission.TAS_ID_TO_ACCOUNT, clear=True), connections["data_broker"].cursor() as cursor:
+            with CaptureQueriesContext(connections["data_broker"]) as broker_queries:
+                tas_lookups = get_treasury_appropriation_account_tas_lookups([-11, -12, -11, -13, -99, None], cursor)
+
+            assert len(broker_queries) == 1
+            assert tas_lookups == {
+                -11: (self.treasury_account, "1004-1002-1003-1007-1008"),
+                -12: (None, "1004-1002-1003-2007-1008"),
+                -13: (None, "Account number -13 not found in Broker"),
+                -99: (None, "Account number -99 not found in Broker"),
+                None: (None, "Account number None not found in Broker"),
+            }
+
+            # Ids that were found are remembered, and the rest are looked up again
+            with CaptureQueriesContext(connections["data_broker"]) as broker_queries:
+                again = get_treasury_appropriation_account_tas_lookups([-11, -12], cursor)
+            assert len(broker_queries) == 0
+            assert again == {key: tas_lookups[key] for key in (-11, -12)}
+
+            with CaptureQueriesContext(connections["data_broker"]) as broker_queries:
+                get_treasury_appropriation_account_tas_lookups([-11, -99], cursor)
+            assert len(broker_queries) == 1
+
+
+def _make_award(award_id, **kwargs):
+    mommy.make("awards.Award", id=award_id, latest_transaction_id=award_id, **kwargs)
+    mommy.make("awards.TransactionNormalized", id=award_id, award_id=award_id)
+
+
+@pytest.mark.django_db
+def test_find_matching_awards_by_fain_and_uri():
+    _make_award(-1, fain="SHARED_FAIN", uri="URI_1")
+    _make_award(-2, fain="SHARED_FAIN", uri="URI_2")
+    _make_award(-3, fain="UNIQUE_FAIN", uri="URI_3")
+    mommy.make("awards.Award", id=-4, fain="NO_TRANSACTION_FAIN", uri="URI_4")
+
+    keys = [
+        (None, None, "UNIQUE_FAIN", "URI_1"),  # The FAIN is tried first
+        (None, None, "SHARED_FAIN", "URI_2"),  # An ambiguous FAIN falls back to the URI
+        (None, None, "SHARED_FAIN", None),  # Ambiguous without a URI to fall back to
+        (None, None, "SHARED_FAIN", "UNKNOWN_URI"),
+        (None, None, "UNKNOWN_FAIN", "URI_1"),
+        (None, None, "UNKNOWN_FAIN", "UNKNOWN_URI"),  # Neither matches
+        (None, None, "NO_TRANSACTION_FAIN", "URI_4"),  # Awards without a latest transaction aren't matched
+        (None, None, None, None),
+    ]
+    assert find_matching_awards(keys) == {
+        (None, None, "UNIQUE_FAIN", "URI_1"): -3,
+        (None, None, "SHARED_FAIN", "URI_2"): -2,
+        (None, None, "UNKNOWN_FAIN", "URI_1"): -1,
+    }
+    assert find_matching_awards([(None, None, None, None)]) == {}
+
+
+@pytest.mark.django_db
+def test_find_matching_awards_by_piid():
+    _make_award(-1, piid="SHARED_PIID", parent_award_piid="PARENT_1")
+    _make_award(-2, piid="SHARED_PIID", parent_award_piid="PARENT_2")
+    _make_award(-3, piid="UNIQUE_PIID", parent_award_piid=None, fain="FAIN_3")
+
+    assert find_matching_awards(
+        [
+            ("SHARED_PIID", "PARENT_2", None, None),
+            ("SHARED_PIID", None, None, None),  # Ambiguous without the parent award id
+            ("SHARED_PIID", "UNKNOWN_PARENT", None, None),
+            ("UNIQUE_PIID", None, None, None),
+            ("UNKNOWN_PIID", None, "FAIN_3", None),  # A PIID is never matched on FAIN
+        ]
+    ) == {("SHARED_PIID", "PARENT_2", None, None): -2, ("UNIQUE_PIID", None, None, None): -3}
+
+
+@pytest.mark.django_db
+def test_submission_lookups_are_only_queried_once(django_assert_num_queries):
+    submission_attributes = mommy.make("submissions.SubmissionAttributes", reporting_fiscal_year=2020)
+    object_class = mommy.make("references.ObjectClass", object_class="111", direct_reimbursable="D")
+    defc = mommy.make("references.DisasterEmergencyFundCode", code="L")
+    row = {
+        "program_activity_code": "0001",
+        "program_activity_name": "Program Activity",
+        "agency_identifier": "002",
+        "allocation_transfer_agency": None,
+        "main_account_code": "0003",
+        "disaster_emergency_fund_code": "L",
+    }
+
+    lookups = SubmissionLookups(submission_attributes)
+    with django_assert_num_queries(5):
+        # 4 digit object classes carry their direct/reimbursable flag in the leading digit
+        assert lookups.object_class("111", "D") == object_class
+        assert lookups.object_class("1111", None) == object_class
+        assert lookups.disaster_emergency_fund(row) == defc
+        # A missing program activity is looked for and created
+        program_activity = lookups.program_activity(row)
+
+    with django_assert_num_queries(0):
+        for _ in range(3):
+            assert lookups.object_class("111", "D") == object_class
+            assert lookups.object_class("1111", None) == object_class
+            assert lookups.disaster_emergency_fund(row) == defc
+            assert lookups.program_activity(row) == program_activity
+            assert lookups.program_activity(dict(row, program_activity_name="program activity")) == program_activity
+
+    assert program_activity.program_activity_name == "PROGRAM ACTIVITY"
+    assert program_activity.budget_year == 2020
+    assert SubmissionLookups(submission_attributes).program_activity(row) == program_activity
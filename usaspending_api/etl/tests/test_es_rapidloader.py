@@ -7,7 +7,13 @@ from pathlib import Path
 from usaspending_api.common.elasticsearch.client import instantiate_elasticsearch_client
 from usaspending_api.common.helpers.sql_helpers import execute_sql_to_ordered_dictionary
 from usaspending_api.common.helpers.text_helpers import generate_random_string
-from usaspending_api.etl.es_etl_helpers import configure_sql_strings, check_awards_for_deletes, get_deleted_award_ids
+from usaspending_api.etl.es_etl_helpers import (
+    configure_sql_strings,
+    configure_stream_sql_strings,
+    check_awards_for_deletes,
+    convert_csv_row_to_document,
+    get_deleted_award_ids,
+)
 from usaspending_api.etl.rapidloader import Rapidloader
 
 
@@ -96,7 +102,6 @@ def baby_sleeps(monkeypatch):
     def _sleep(seconds):
         sleep(0.001)
 
-    monkeypatch.setattr("usaspending_api.etl.es_etl_helpers.sleep", _sleep)
     monkeypatch.setattr("usaspending_api.etl.rapidloader.sleep", _sleep)
 
 
@@ -117,6 +122,8 @@ config = {
     "starting_date": datetime(2007, 10, 1, 0, 0, tzinfo=timezone.utc),
     "max_query_size": 10000,
     "is_incremental_load": False,
+    "ingest_threads": 2,
+    "bulk_max_bytes": 10 * 1024 * 1024,
 }
 
 
@@ -140,6 +147,17 @@ def test_es_transaction_loader_class(award_data_fixture, elasticsearch_transacti
     elasticsearch_client.indices.delete(index=config["index_name"], ignore_unavailable=False)
 
 
+def test_es_transaction_loader_streaming_from_db(award_data_fixture, elasticsearch_transaction_index, baby_sleeps):
+    stream_config = {**config, "root_index": "transaction-query", "load_type": "transactions", "stream_from_db": True}
+    elasticsearch_client = instantiate_elasticsearch_client()
+    loader = Rapidloader(stream_config, elasticsearch_client)
+    loader.run_load_steps()
+    assert elasticsearch_client.indices.exists(stream_config["index_name"])
+    elasticsearch_client.indices.refresh(stream_config["index_name"])
+    assert elasticsearch_client.count(index=stream_config["index_name"])["count"] == 2
+    elasticsearch_client.indices.delete(index=stream_config["index_name"], ignore_unavailable=False)
+
+
 def test_configure_sql_strings():
     config["fiscal_year"] = 2019
     config["root_index"] = "award-query"
@@ -160,6 +178,21 @@ WHERE fiscal_year=2019 AND update_date >= '2007-10-01'
     assert count == count_sql
 
 
+def test_configure_stream_sql_strings():
+    copy, count = configure_stream_sql_strings(
+        {"fiscal_year": 2019, "load_type": "transactions", "starting_date": datetime(2007, 10, 1, tzinfo=timezone.utc)}
+    )
+    copy_sql = """
+COPY (
+    SELECT *
+    FROM transaction_delta_view
+    WHERE transaction_fiscal_year=2019 AND update_date >= '2007-10-01'
+) TO STDOUT DELIMITER ',' CSV HEADER
+"""
+    assert copy == copy_sql
+    assert "transaction_fiscal_year=2019" in count
+
+
 # SQL method is being mocked here since the `execute_sql_statement` used doesn't use the same DB connection to avoid multiprocessing errors
 def mock_execute_sql(sql, results):
     return execute_sql_to_ordered_dictionary(sql)
@@ -184,3 +217,23 @@ def test_get_award_ids(award_data_fixture, elasticsearch_transaction_index):
     client = elasticsearch_transaction_index.client
     ids = get_deleted_award_ids(client, id_list, config, index=elasticsearch_transaction_index.index_name)
     assert ids == ["CONT_AWD_IND12PB00323"]
+
+
+def test_convert_csv_row_to_document():
+    row = {
+        "generated_unique_award_id": "CONT_AWD_IND12PB00323",
+        "recipient_agg_key": "abc",
+        "piid": "",
+        "business_categories": "{small_business,category_business}",
+        "tas_paths": "",
+        "federal_accounts": '[{"id": 1, "account_title": null}]',
+    }
+    assert convert_csv_row_to_document(row) == {
+        "generated_unique_award_id": "CONT_AWD_IND12PB00323",
+        "recipient_agg_key": "abc",
+        "piid": None,
+        "business_categories": ["small_business", "category_business"],
+        "tas_paths": None,
+        "federal_accounts": ['{"account_title": "", "id": "1"}'],
+        "routing": "abc",
+    }
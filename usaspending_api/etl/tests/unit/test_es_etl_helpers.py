@@ -0,0 +1,73 @@
+import json
+import pytest
+
+from unittest.mock import MagicMock
+
+from usaspending_api.etl.es_etl_helpers import delete_from_es, id_lookup_queries, parallel_post_to_es
+
+
+def test_id_lookup_queries():
+    award_ids = ["CONT_AWD_{}".format(i) for i in range(10001)]
+    queries = list(id_lookup_queries("generated_unique_award_id", award_ids))
+    assert [len(q["query"]["terms"]["generated_unique_award_id.keyword"]) for q in queries] == [10000, 1]
+
+    transaction_ids = ["CONT_TX_{}".format(i) for i in range(1001)]
+    queries = list(id_lookup_queries("generated_unique_transaction_id", transaction_ids))
+    assert [len(q["query"]["bool"]["should"][0]) for q in queries] == [1000, 1]
+    assert queries[1]["query"]["bool"]["should"][0] == [
+        {"match_phrase": {"generated_unique_transaction_id": "CONT_TX_1000"}}
+    ]
+
+
+def test_delete_from_es_bulk_deletes_by_id():
+    client = MagicMock()
+    client.transport.serializer.dumps.side_effect = json.dumps
+    client.search.return_value = {
+        "hits": {
+            "hits": [
+                {"_index": "awards-1", "_id": "a", "_routing": "r1"},
+                {"_index": "awards-2", "_id": "b", "_routing": "r2"},
+            ]
+        }
+    }
+    client.bulk.side_effect = _bulk_responding_with(200, 404)
+    id_list = [{"key": "CONT_AWD_1", "col": "generated_unique_award_id"}]
+
+    delete_from_es(client, id_list, None, {"max_query_size": 50000, "root_index": "awards"}, refresh=False)
+
+    search_body = json.loads(client.search.call_args[1]["body"])
+    assert search_body == {"query": {"terms": {"generated_unique_award_id.keyword": ["CONT_AWD_1"]}}, "_source": False}
+    assert client.search.call_args[1]["index"] == "awards-*"
+
+    bulk_lines = [json.loads(line) for line in client.bulk.call_args[0][0].splitlines()]
+    assert bulk_lines == [
+        {"delete": {"_index": "awards-1", "_id": "a", "routing": "r1"}},
+        {"delete": {"_index": "awards-2", "_id": "b", "routing": "r2"}},
+    ]
+    client.delete_by_query.assert_not_called()
+    client.indices.refresh.assert_not_called()
+
+    delete_from_es(client, id_list, None, {"max_query_size": 50000, "root_index": "awards"}, index="awards-1")
+    client.indices.refresh.assert_called_once_with("awards-1")
+
+
+def test_parallel_post_to_es_ignore_status():
+    client = MagicMock()
+    client.transport.serializer.dumps.side_effect = json.dumps
+    actions = [{"_op_type": "delete", "_index": "awards-1", "_id": str(i)} for i in range(2)]
+
+    client.bulk.side_effect = _bulk_responding_with(200, 404)
+    assert parallel_post_to_es(client, actions, "awards-1", {}, ignore_status=(404,)) == (2, 0)
+
+    client.bulk.side_effect = _bulk_responding_with(200, 409)
+    with pytest.raises(SystemExit):
+        parallel_post_to_es(client, actions, "awards-1", {}, ignore_status=(404,))
+
+
+def _bulk_responding_with(*statuses):
+    """Fake Elasticsearch.bulk, which like the real one rejects arguments that aren't bulk API parameters"""
+
+    def bulk(body, index=None, doc_type=None, params=None, headers=None):
+        return {"items": [{"delete": {"status": status}} for status in statuses]}
+
+    return bulk
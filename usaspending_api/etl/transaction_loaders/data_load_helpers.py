@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date, datetime
+import io
 import os
 import re
 import boto3
@@ -9,6 +10,9 @@ from django.conf import settings
 
 logger = logging.getLogger("console")
 
+# Columns that are only written when a row is first created
+NON_UPDATABLE_COLUMNS = ["create_date", "created_at"]
+
 
 def capitalize_if_string(val):
     try:
@@ -61,7 +65,7 @@ def format_insert_or_update_column_sql(cursor, load_object, type):
         columns.append('"{}"'.format(key))
         val = format_value_for_sql(load_object[type][key], cursor)
         values.append(val)
-        if key not in ["create_date", "created_at"]:
+        if key not in NON_UPDATABLE_COLUMNS:
             update_pairs.append(" {}={}".format(key, val))
 
     col_string = "({})".format(",".join(map(str, columns)))
@@ -71,6 +75,37 @@ def format_insert_or_update_column_sql(cursor, load_object, type):
     return col_string, val_string, pairs_string
 
 
+def format_value_for_copy(val):
+    """formats a value as a single field of a Postgres COPY text format row"""
+    if val is None:
+        return r"\N"
+    if isinstance(val, bool):
+        val = "t" if val else "f"
+    elif isinstance(val, (list, tuple)):
+        val = "{{{}}}".format(",".join(_format_array_element_for_copy(element) for element in val))
+    elif isinstance(val, (datetime, date)):
+        val = val.isoformat()
+    else:
+        val = str(val)
+    return val.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _format_array_element_for_copy(val):
+    if val is None:
+        return "NULL"
+    return '"{}"'.format(str(val).replace("\\", "\\\\").replace('"', '\\"'))
+
+
+def format_bulk_copy_data(load_objects, type, columns):
+    """creates an in-memory file of COPY text format rows holding the given columns of each load object"""
+    buffer = io.StringIO()
+    for load_object in load_objects:
+        buffer.write("\t".join(format_value_for_copy(load_object[type].get(column)) for column in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
 def get_deleted_fpds_data_from_s3(date):
     ids_to_delete = []
     regex_str = ".*_delete_records_(IDV|award).*"
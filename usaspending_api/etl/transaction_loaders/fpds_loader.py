@@ -1,7 +1,7 @@
 import logging
 from psycopg2.extras import DictCursor
 from psycopg2 import Error
-from django.db import connection
+from django.db import connection, transaction
 
 from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
     transaction_fpds_nonboolean_columns,
@@ -20,6 +20,12 @@ from usaspending_api.etl.transaction_loaders.generic_loaders import (
     insert_transaction_normalized,
     insert_transaction_fpds,
     insert_award,
+    stage_load_objects,
+    bulk_match_awards,
+    bulk_insert_awards,
+    bulk_match_fpds_transactions,
+    bulk_update_from_staging,
+    bulk_insert_fpds_transactions,
 )
 from usaspending_api.common.helpers.timing_helpers import ConsoleTimer as Timer
 
@@ -80,11 +86,14 @@ def delete_stale_fpds(detached_award_procurement_ids):
         return awards_touched
 
 
-def load_fpds_transactions(chunk):
+def load_fpds_transactions(chunk, bulk_load=False):
     """
     Run transaction load for the provided ids. This will create any new rows in other tables to support the transaction
     data, but does NOT update "secondary" award values like total obligations or C -> D linkages.
 
+    When bulk_load is set, the chunk is staged into temporary tables and upserted with set-based statements instead of
+    several statements per transaction.
+
     returns ids for each award touched
     """
     with Timer() as timer:
@@ -94,11 +103,24 @@ def load_fpds_transactions(chunk):
             if broker_transactions:
                 load_objects = _transform_objects(broker_transactions)
 
-                retval = _load_transactions(load_objects)
+                if bulk_load:
+                    retval = _load_transactions_in_bulk(load_objects)
+                else:
+                    retval = _load_transactions(load_objects)
     logger.info("batch completed in {}".format(timer.as_string(timer.elapsed)))
     return retval
 
 
+def load_fpds_transactions_in_worker(chunk, bulk_load=False):
+    """
+    Same as load_fpds_transactions, for use in a worker process. Since failed_ids only lives in the worker's memory,
+    the ids that failed in this chunk are handed back alongside the award ids touched.
+    """
+    previously_failed_count = len(failed_ids)
+    award_ids = load_fpds_transactions(chunk, bulk_load)
+    return award_ids, failed_ids[previously_failed_count:]
+
+
 def _extract_broker_objects(id_list):
 
     connection.ensure_connection()
@@ -192,6 +214,53 @@ def _load_transactions(load_objects):
     return list(ids_of_awards_created_or_updated)
 
 
+def _load_transactions_in_bulk(load_objects):
+    """
+    Set-based equivalent of _load_transactions. The whole batch is loaded in one database transaction; if any statement
+    fails it is rolled back and the batch is re-run row-by-row so that only the offending ids end up in failed_ids.
+
+    returns ids for each award touched
+    """
+    # Row-by-row, a repeated transaction would be inserted then overwritten by its last occurrence
+    load_objects = list({lo["transaction_fpds"]["detached_award_proc_unique"]: lo for lo in load_objects}.values())
+
+    try:
+        with transaction.atomic():
+            connection.ensure_connection()
+            with connection.connection.cursor() as cursor:
+                award_table, award_columns = stage_load_objects(cursor, load_objects, "award", "awards", ["id"])
+                normalized_table, normalized_columns = stage_load_objects(
+                    cursor, load_objects, "transaction_normalized", "transaction_normalized", ["id", "award_id"]
+                )
+                fpds_table, fpds_columns = stage_load_objects(
+                    cursor, load_objects, "transaction_fpds", "transaction_fpds", ["transaction_id"]
+                )
+
+                # AWARD GET OR CREATE
+                bulk_match_awards(cursor, award_table)
+                bulk_insert_awards(cursor, award_table, award_columns)
+
+                # TRANSACTION UPSERT
+                bulk_match_fpds_transactions(cursor, fpds_table, normalized_table, award_table)
+                updated = bulk_update_from_staging(
+                    cursor, "transaction_fpds", fpds_table, fpds_columns, "transaction_id"
+                )
+                bulk_update_from_staging(
+                    cursor, "transaction_normalized", normalized_table, normalized_columns + ["award_id"], "id"
+                )
+                inserted = bulk_insert_fpds_transactions(
+                    cursor, fpds_table, fpds_columns, normalized_table, normalized_columns
+                )
+                logger.debug("updated {} and created {} fpds transactions".format(updated, inserted))
+
+                cursor.execute("SELECT DISTINCT id FROM {}".format(award_table))
+                return [row[0] for row in cursor.fetchall()]
+
+    except Error as e:
+        logger.error(f"bulk load failed, retrying batch one transaction at a time!\nDetails: {e.pgerror}")
+        return _load_transactions(load_objects)
+
+
 def _matching_award(cursor, load_object):
     """ Try to find an award for this transaction to belong to by unique_award_key"""
     find_matching_award_sql = "select id from awards where generated_unique_award_id = '{}'".format(
@@ -1,4 +1,8 @@
-from usaspending_api.etl.transaction_loaders.data_load_helpers import format_insert_or_update_column_sql
+from usaspending_api.etl.transaction_loaders.data_load_helpers import (
+    NON_UPDATABLE_COLUMNS,
+    format_bulk_copy_data,
+    format_insert_or_update_column_sql,
+)
 
 
 def insert_award(cursor, load_object):
@@ -39,3 +43,103 @@ def insert_transaction_fpds(cursor, load_object):
     cursor.execute(transaction_fpds_sql)
     created_transaction_fpds = cursor.fetchall()
     return created_transaction_fpds
+
+
+def _column_list(columns, alias=None):
+    prefix = "{}.".format(alias) if alias else ""
+    return ",".join('{}"{}"'.format(prefix, column) for column in columns)
+
+
+def stage_load_objects(cursor, load_objects, type, destination_table, key_columns):
+    """
+    COPYs one table's worth of load objects into a temporary table shaped like the destination table.
+    The staging table is dropped at the end of the surrounding transaction.
+
+    returns the staging table name and the load object columns it holds
+    """
+    columns = list(load_objects[0][type].keys())
+    staging_table = "temp_{}_staging".format(type)
+    cursor.execute("DROP TABLE IF EXISTS {}".format(staging_table))
+    cursor.execute(
+        "CREATE TEMPORARY TABLE {} ON COMMIT DROP AS SELECT {} FROM {} WHERE false".format(
+            staging_table, _column_list(key_columns + columns), destination_table
+        )
+    )
+    # Preserves load order so "first transaction wins" ties can be resolved the same way as a row-by-row load
+    cursor.execute("ALTER TABLE {} ADD COLUMN load_ordinal SERIAL".format(staging_table))
+    cursor.copy_expert(
+        "COPY {} ({}) FROM STDIN".format(staging_table, _column_list(columns)),
+        format_bulk_copy_data(load_objects, type, columns),
+    )
+    return staging_table, columns
+
+
+def bulk_match_awards(cursor, award_staging_table):
+    cursor.execute(
+        "UPDATE {} s SET id = a.id FROM awards a "
+        "WHERE a.generated_unique_award_id = s.generated_unique_award_id AND s.id IS NULL".format(award_staging_table)
+    )
+
+
+def bulk_insert_awards(cursor, award_staging_table, columns):
+    """creates one award per unmatched award key (using its earliest staged transaction) and links them back"""
+    cursor.execute(
+        "WITH inserted AS ("
+        "  INSERT INTO awards ({columns}) "
+        "  SELECT DISTINCT ON (generated_unique_award_id) {columns} FROM {staging} WHERE id IS NULL "
+        "  ORDER BY generated_unique_award_id, load_ordinal "
+        "  RETURNING id, generated_unique_award_id"
+        ") "
+        "UPDATE {staging} s SET id = i.id FROM inserted i "
+        "WHERE i.generated_unique_award_id = s.generated_unique_award_id".format(
+            columns=_column_list(columns), staging=award_staging_table
+        )
+    )
+
+
+def bulk_match_fpds_transactions(cursor, fpds_staging_table, normalized_staging_table, award_staging_table):
+    cursor.execute(
+        "UPDATE {} s SET transaction_id = f.transaction_id FROM transaction_fpds f "
+        "WHERE f.detached_award_proc_unique = s.detached_award_proc_unique".format(fpds_staging_table)
+    )
+    cursor.execute(
+        "UPDATE {} s SET id = f.transaction_id, award_id = a.id FROM {} f, {} a "
+        "WHERE f.detached_award_proc_unique = s.transaction_unique_id "
+        "AND a.transaction_unique_id = s.transaction_unique_id".format(
+            normalized_staging_table, fpds_staging_table, award_staging_table
+        )
+    )
+
+
+def bulk_update_from_staging(cursor, destination_table, staging_table, columns, key_column):
+    """updates every destination row whose key was matched during staging"""
+    pairs = ",".join('"{0}" = s."{0}"'.format(column) for column in columns if column not in NON_UPDATABLE_COLUMNS)
+    cursor.execute(
+        'UPDATE {} d SET {} FROM {} s WHERE s."{key}" IS NOT NULL AND d."{key}" = s."{key}"'.format(
+            destination_table, pairs, staging_table, key=key_column
+        )
+    )
+    return cursor.rowcount
+
+
+def bulk_insert_fpds_transactions(
+    cursor, fpds_staging_table, fpds_columns, normalized_staging_table, normalized_columns
+):
+    """transaction_normalized and transaction_fpds should be one-to-one, so both are inserted in one statement"""
+    cursor.execute(
+        "WITH inserted AS ("
+        "  INSERT INTO transaction_normalized (award_id,{normalized_columns}) "
+        "  SELECT award_id,{normalized_columns} FROM {normalized_staging} WHERE id IS NULL "
+        "  RETURNING id, transaction_unique_id"
+        ") "
+        "INSERT INTO transaction_fpds (transaction_id,{fpds_columns}) "
+        "SELECT i.id,{staged_fpds_columns} FROM {fpds_staging} s "
+        "INNER JOIN inserted i ON i.transaction_unique_id = s.detached_award_proc_unique".format(
+            normalized_columns=_column_list(normalized_columns),
+            normalized_staging=normalized_staging_table,
+            fpds_columns=_column_list(fpds_columns),
+            staged_fpds_columns=_column_list(fpds_columns, "s"),
+            fpds_staging=fpds_staging_table,
+        )
+    )
+    return cursor.rowcount
@@ -59,7 +59,8 @@ def _assemble_source_procurement_records(id_list):
 
 
 @pytest.mark.django_db
-def test_load_source_procurement_by_ids():
+@pytest.mark.parametrize("load_mode_args", [[], ["--bulk-load"]])
+def test_load_source_procurement_by_ids(load_mode_args):
     """
     Simple end-to-end integration test to exercise the fpds loader given 3 records in an actual broker database
     to load into an actual usaspending database
@@ -68,7 +69,7 @@ def test_load_source_procurement_by_ids():
     _assemble_source_procurement_records(source_procurement_id_list)
 
     # Run core logic to be tested
-    call_command("load_fpds_transactions", "--ids", *source_procurement_id_list)
+    call_command("load_fpds_transactions", "--ids", *source_procurement_id_list, *load_mode_args)
 
     # Lineage should trace back to the broker records
     usaspending_transactions = TransactionFPDS.objects.all()
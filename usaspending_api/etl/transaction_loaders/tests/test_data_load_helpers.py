@@ -1,4 +1,11 @@
-from usaspending_api.etl.transaction_loaders.data_load_helpers import capitalize_if_string, false_if_null
+import datetime
+
+from usaspending_api.etl.transaction_loaders.data_load_helpers import (
+    capitalize_if_string,
+    false_if_null,
+    format_bulk_copy_data,
+    format_value_for_copy,
+)
 
 
 def test_capitalize_if_string():
@@ -14,3 +21,26 @@ def test_false_if_null():
     assert false_if_null(True)
     assert not false_if_null(False)
     assert not false_if_null(None)
+
+
+def test_format_value_for_copy():
+    assert format_value_for_copy(None) == r"\N"
+    assert format_value_for_copy(True) == "t"
+    assert format_value_for_copy(False) == "f"
+    assert format_value_for_copy(7) == "7"
+    assert format_value_for_copy("tab\tnew\nline\\") == "tab\\tnew\\nline\\\\"
+    assert format_value_for_copy(datetime.date(2010, 1, 1)) == "2010-01-01"
+    assert format_value_for_copy(datetime.datetime(2010, 1, 1, 12)) == "2010-01-01T12:00:00"
+    assert (
+        format_value_for_copy(["small_business", 'quoted "name"', None])
+        == '{"small_business","quoted \\\\"name\\\\"",NULL}'
+    )
+    assert format_value_for_copy([]) == "{}"
+
+
+def test_format_bulk_copy_data():
+    load_objects = [
+        {"table": {"val1": 4, "string_val": "bob"}},
+        {"table": {"val1": None, "string_val": "alice"}},
+    ]
+    assert format_bulk_copy_data(load_objects, "table", ["string_val", "val1"]).read() == "bob\t4\nalice\t\\N\n"
@@ -5,6 +5,7 @@ from usaspending_api.etl.transaction_loaders.fpds_loader import (
     _create_load_object,
     _transform_objects,
     _load_transactions,
+    _load_transactions_in_bulk,
 )
 from usaspending_api.etl.transaction_loaders.field_mappings_fpds import (
     transaction_fpds_nonboolean_columns,
@@ -226,6 +227,70 @@ def test_load_transactions(mock__fetch_subtier_agency_id, mock_connection):
     mock_cursor.mogrify = lambda val1, val2: str(val2[0]).encode()
     mock_connection.connection.cursor().__enter__.return_value = mock_cursor
 
+    load_objects = _transform_objects([_assemble_mega_broker_row()])
+    _load_transactions(load_objects)
+
+
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader.transaction")
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader.connection")
+@patch("usaspending_api.etl.transaction_loaders.derived_field_functions_fpds._fetch_subtier_agency_id", return_value=1)
+def test_load_transactions_in_bulk(mock__fetch_subtier_agency_id, mock_connection, mock_transaction):
+    """The whole batch should be staged with one COPY per table rather than loaded row-by-row"""
+
+    # Setup Mocks
+    mock_cursor = MagicMock()
+    mock_cursor.execute.return_value = None
+    mock_cursor.fetchall.return_value = [[10], [11]]
+    mock_connection.connection.cursor().__enter__.return_value = mock_cursor
+
+    broker_rows = []
+    for broker_id in (1, 2, 2):
+        broker_row = _assemble_mega_broker_row()
+        broker_row["detached_award_proc_unique"] = str(broker_id)
+        broker_rows.append(broker_row)
+
+    award_ids = _load_transactions_in_bulk(_transform_objects(broker_rows))
+
+    assert award_ids == [10, 11]
+    assert mock_cursor.copy_expert.call_count == 3
+
+    # Duplicate transactions are only staged once
+    staged_fpds_rows = mock_cursor.copy_expert.call_args_list[2][0][1].read().splitlines()
+    assert len(staged_fpds_rows) == 2
+
+    # Awards and transactions are written with set-based statements rather than one per transaction
+    statements = [call[0][0] for call in mock_cursor.execute.call_args_list]
+    assert len([sql for sql in statements if "INSERT INTO awards" in sql]) == 1
+    assert len([sql for sql in statements if "INSERT INTO transaction_fpds" in sql]) == 1
+    assert len([sql for sql in statements if sql.startswith("UPDATE transaction_fpds d")]) == 1
+    assert len([sql for sql in statements if sql.startswith("UPDATE transaction_normalized d")]) == 1
+    assert not [sql for sql in statements if " VALUES " in sql]
+
+
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader._load_transactions", return_value=[10])
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader.transaction")
+@patch("usaspending_api.etl.transaction_loaders.fpds_loader.connection")
+@patch("usaspending_api.etl.transaction_loaders.derived_field_functions_fpds._fetch_subtier_agency_id", return_value=1)
+def test_load_transactions_in_bulk_falls_back(
+    mock__fetch_subtier_agency_id, mock_connection, mock_transaction, mock__load_transactions
+):
+    """A batch that fails to load in bulk should be re-run one transaction at a time"""
+
+    def execute(sql, *args):
+        if "INSERT INTO awards" in sql:
+            raise fpds_loader.Error("bulk insert failed")
+
+    mock_cursor = MagicMock()
+    mock_cursor.execute.side_effect = execute
+    mock_connection.connection.cursor().__enter__.return_value = mock_cursor
+
+    load_objects = _transform_objects([_assemble_mega_broker_row()])
+
+    assert _load_transactions_in_bulk(load_objects) == [10]
+    mock__load_transactions.assert_called_once_with(load_objects)
+
+
+def _assemble_mega_broker_row():
     mega_key_list = {}
     mega_key_list.update(transaction_fpds_nonboolean_columns)
     mega_key_list.update(transaction_normalized_nonboolean_columns)
@@ -248,5 +313,4 @@ def test_load_transactions(mock__fetch_subtier_agency_id, mock_connection):
 
     mega_key_list.update(mega_boolean_key_list)
 
-    load_objects = _transform_objects([mega_key_list])
-    _load_transactions(load_objects)
+    return mega_key_list
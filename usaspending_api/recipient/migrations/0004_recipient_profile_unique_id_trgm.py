@@ -0,0 +1,16 @@
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipient', '0003_auto_20200312_1656'),
+    ]
+
+    # The recipient list keyword search matches anywhere in the name or DUNS, which only a trigram index can serve
+    operations = [
+        migrations.RunSQL(
+            sql='create index if not exists idx_recipient_profile_unique_id_trgm on recipient_profile using gin (recipient_unique_id gin_trgm_ops)',
+            reverse_sql='drop index if exists idx_recipient_profile_unique_id_trgm',
+        ),
+    ]
@@ -95,12 +95,14 @@ class RecipientProfile(models.Model):
         managed = True
         db_table = "recipient_profile"
         unique_together = ("recipient_hash", "recipient_level")
-        # Note:  A custom index was added in the migration because there's
+        # Note:  Custom indexes were added in the migrations because there's
         # currently not a Django native means by which to add a GinIndex with
         # a specific Postgres operator class:
         #
         #     create index idx_recipient_profile_name on
         #         public.recipient_profile using gin (recipient_name public.gin_trgm_ops)
+        #     create index idx_recipient_profile_unique_id_trgm on
+        #         public.recipient_profile using gin (recipient_unique_id public.gin_trgm_ops)
         #
         indexes = [GinIndex(fields=["award_types"]), models.Index(fields=["recipient_unique_id"])]
 
@@ -1,5 +1,6 @@
 # Stdlib imports
 import datetime
+import json
 import pytest
 
 # Core Django imports
@@ -9,6 +10,7 @@ from rest_framework import status
 from model_mommy import mommy
 
 # Imports from your apps
+from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.helpers.fiscal_year_helpers import generate_fiscal_year
 from usaspending_api.recipient.models import RecipientProfile
 from usaspending_api.recipient.v2.views.list_recipients import get_recipients
@@ -193,3 +195,74 @@ def test_award_type_filter():
     assert results[0]["recipient_level"] == "C"
     assert float(results[0]["amount"]) == float(99.99)
     assert results[0]["id"] == "5770e860-0f7b-69f1-182f-4d6966ebaa62-C"
+
+
+@pytest.mark.django_db
+def test_keyset_pagination():
+    for level, name, amount in [("A", "ALPHA", 300), ("B", "BRAVO", 200), ("C", "CHARLIE", 200), ("R", None, 100)]:
+        mommy.make(
+            RecipientProfile,
+            recipient_level=level,
+            recipient_hash="00077a9a-5a70-8919-fd19-330762af6b84",
+            recipient_unique_id="00000012{}".format(level),
+            recipient_name=name,
+            last_12_months=amount,
+        )
+
+    for sort in ["amount", "name", "duns"]:
+        for order in ["asc", "desc"]:
+            filters = {"limit": 4, "page": 1, "order": order, "sort": sort, "award_type": "all"}
+            expected, _ = get_recipients(filters=filters)
+
+            filters["limit"] = 1
+            results, meta = get_recipients(filters=filters)
+            while meta["hasNext"]:
+                filters["page"] += 1
+                filters["last_record_unique_id"] = meta["last_record_unique_id"]
+                filters["last_record_sort_value"] = meta["last_record_sort_value"]
+                page, meta = get_recipients(filters=filters)
+                results.extend(page)
+
+            assert meta["total"] == 4
+            assert [result["id"] for result in results] == [result["id"] for result in expected]
+
+    # The sort value can't be left out, only sent as null
+    filters = {"limit": 1, "page": 2, "order": "desc", "sort": "amount", "award_type": "all"}
+    filters["last_record_unique_id"] = results[0]["id"]
+    with pytest.raises(InvalidParameterException):
+        get_recipients(filters=filters)
+
+
+@pytest.mark.django_db
+def test_keyset_pagination_with_unsearchable_names(client):
+    # Names a search text_type would strip (or reject outright) must be sent back unchanged to page past them
+    for level, name, amount in [("A", "", 300), ("B", "  BRAVO  ", 200), ("C", "\tCHARLIE", 100)]:
+        mommy.make(
+            RecipientProfile,
+            recipient_level=level,
+            recipient_hash="00077a9a-5a70-8919-fd19-330762af6b84",
+            recipient_unique_id="00000012{}".format(level),
+            recipient_name=name,
+            last_12_months=amount,
+        )
+
+    for order in ["asc", "desc"]:
+        request = {"limit": 3, "page": 1, "order": order, "sort": "name"}
+        resp = client.post(list_recipients_endpoint(), content_type="application/json", data=json.dumps(request))
+        expected = resp.data["results"]
+
+        request["limit"] = 1
+        results = []
+        while True:
+            resp = client.post(list_recipients_endpoint(), content_type="application/json", data=json.dumps(request))
+            assert resp.status_code == status.HTTP_200_OK
+            results.extend(resp.data["results"])
+            meta = resp.data["page_metadata"]
+            if not meta["hasNext"]:
+                break
+            request["page"] += 1
+            request["last_record_unique_id"] = meta["last_record_unique_id"]
+            request["last_record_sort_value"] = meta["last_record_sort_value"]
+
+        assert [result["name"] for result in results] == [result["name"] for result in expected]
+        assert sorted(result["name"] for result in results) == ["", "\tCHARLIE", "  BRAVO  "]
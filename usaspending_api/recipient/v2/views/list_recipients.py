@@ -1,11 +1,15 @@
 import logging
 import copy
+import uuid
 
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django.db.models import F, Q
+from typing import Optional
 
 from usaspending_api.common.cache_decorator import cache_response
+from usaspending_api.common.data_load_cache import DataLoadCache
+from usaspending_api.common.exceptions import InvalidParameterException
 from usaspending_api.common.helpers.generic_helper import get_pagination_metadata
 from usaspending_api.common.validator.pagination import PAGINATION
 from usaspending_api.common.validator.tinyshield import TinyShield
@@ -26,12 +30,18 @@ AWARD_TYPES = {
 }
 
 
+# Counts only change when recipient profiles are reloaded, so they're kept per keyword and award type.  Keywords come
+# from users, so only the most recently used counts are kept.
+recipient_count_cache = DataLoadCache(max_entries=1000)
+
+
 def get_recipients(filters={}):
     lower_limit = (filters["page"] - 1) * filters["limit"]
     upper_limit = filters["page"] * filters["limit"]
 
     qs_filter = Q()
     if "keyword" in filters:
+        # Both columns have trigram indexes, which serve these unanchored LIKEs
         qs_filter |= Q(recipient_name__contains=filters["keyword"].upper())
         qs_filter |= Q(recipient_unique_id__contains=filters["keyword"])
 
@@ -47,14 +57,30 @@ def get_recipients(filters={}):
     )
 
     api_to_db_mapper = {"amount": amount_column, "duns": "recipient_unique_id", "name": "recipient_name"}
+    sort_column = api_to_db_mapper[filters["sort"]]
+
+    count = recipient_count_cache.get((filters.get("keyword"), filters["award_type"]), queryset.count)
+    page_metadata = get_pagination_metadata(count, filters["limit"], filters["page"])
 
+    # Ties are broken on the unique recipient_hash and recipient_level so that pages never overlap
     if filters["order"] == "desc":
-        queryset = queryset.order_by(F(api_to_db_mapper[filters["sort"]]).desc(nulls_last=True))
+        queryset = queryset.order_by(F(sort_column).desc(nulls_last=True), "recipient_hash", "recipient_level")
     else:
-        queryset = queryset.order_by(F(api_to_db_mapper[filters["sort"]]).asc(nulls_last=True))
-
-    count = queryset.count()
-    page_metadata = get_pagination_metadata(count, filters["limit"], filters["page"])
+        queryset = queryset.order_by(F(sort_column).asc(nulls_last=True), "recipient_hash", "recipient_level")
+
+    if filters.get("last_record_unique_id") is not None:
+        if "last_record_sort_value" not in filters:
+            # Only an explicit null means the last record had no value to sort on
+            raise InvalidParameterException("last_record_unique_id requires last_record_sort_value")
+        # Seek past the last record of the previous page rather than counting off every row before this page
+        queryset = queryset.filter(
+            _after_last_record(
+                sort_column, filters["order"], filters["last_record_sort_value"], filters["last_record_unique_id"]
+            )
+        )
+        rows = queryset[: filters["limit"]]
+    else:
+        rows = queryset[lower_limit:upper_limit]
 
     results = [
         {
@@ -64,12 +90,43 @@ def get_recipients(filters={}):
             "recipient_level": row["recipient_level"],
             "amount": row[amount_column],
         }
-        for row in queryset[lower_limit:upper_limit]
+        for row in rows
     ]
 
+    page_metadata["last_record_unique_id"] = None
+    page_metadata["last_record_sort_value"] = None
+    if results and page_metadata["hasNext"]:
+        last_sort_value = results[-1][filters["sort"]]
+        page_metadata["last_record_unique_id"] = results[-1]["id"]
+        page_metadata["last_record_sort_value"] = str(last_sort_value) if last_sort_value is not None else None
+
     return results, page_metadata
 
 
+def _after_last_record(sort_column: str, order: str, last_sort_value: Optional[str], last_unique_id: str) -> Q:
+    """Filter for the rows sorted after the given one, with the nulls of sort_column last"""
+    try:
+        recipient_hash, recipient_level = last_unique_id.rsplit("-", 1)
+        recipient_hash = uuid.UUID(recipient_hash)
+    except ValueError:
+        raise InvalidParameterException(
+            "last_record_unique_id ('{}') is not a recipient id from a previous page".format(last_unique_id)
+        )
+    after_last_tie = Q(recipient_hash__gt=recipient_hash) | Q(
+        recipient_hash=recipient_hash, recipient_level__gt=recipient_level
+    )
+
+    if last_sort_value is None:
+        return Q(**{f"{sort_column}__isnull": True}) & after_last_tie
+
+    comparison = "lt" if order == "desc" else "gt"
+    return (
+        Q(**{f"{sort_column}__{comparison}": last_sort_value})
+        | Q(**{f"{sort_column}__isnull": True})
+        | (Q(**{sort_column: last_sort_value}) & after_last_tie)
+    )
+
+
 class ListRecipients(APIView):
     """
     This route takes a single keyword filter (and pagination filters), and returns a list of recipients
@@ -83,6 +140,16 @@ class ListRecipients(APIView):
         models = [
             {"name": "keyword", "key": "keyword", "type": "text", "text_type": "search"},
             {"name": "award_type", "key": "award_type", "type": "enum", "enum_values": award_types, "default": "all"},
+            # Paging values are echoed back exactly as returned: names can be empty or have surrounding whitespace
+            {"name": "last_record_unique_id", "key": "last_record_unique_id", "type": "text", "text_type": "raw"},
+            {
+                "name": "last_record_sort_value",
+                "key": "last_record_sort_value",
+                "type": "text",
+                "text_type": "raw",
+                "min": 0,
+                "allow_nulls": True,
+            },
         ]
         models.extend(copy.deepcopy(PAGINATION))  # page, limit, sort, order
 
@@ -1,6 +1,34 @@
-from typing import Optional
+from collections import defaultdict
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from usaspending_api.common.data_load_cache import DataLoadCache
+from usaspending_api.references.models import (
+    Agency,
+    Cfda,
+    DisasterEmergencyFundCode,
+    NAICS,
+    PSC,
+    SubtierAgency,
+)
 from usaspending_api.references.models.cgac import CGAC
 from usaspending_api.references.models.frec import FREC
+from usaspending_api.submissions.models import SubmissionAttributes
+
+# Reference tables are small and only change with a data load, so the API and the loaders read them once per process
+# rather than once per request or record.  Values handed out are shared; callers copy anything they intend to change.
+reference_data_cache = DataLoadCache()
+
+CFDA_DETAIL_FIELDS = (
+    "applicant_eligibility",
+    "beneficiary_eligibility",
+    "program_title",
+    "objectives",
+    "federal_agency",
+    "website_address",
+    "url",
+    "obligations",
+    "popular_name",
+)
 
 
 def retrive_agency_name_from_code(code: str) -> Optional[str]:
@@ -15,3 +43,120 @@ def retrive_agency_name_from_code(code: str) -> Optional[str]:
         return frec_agency["agency_name"]
 
     return None
+
+
+def psc_descriptions() -> Dict[str, str]:
+    """Description of every PSC, by code"""
+    return reference_data_cache.get("psc", lambda: dict(PSC.objects.values_list("code", "description")))
+
+
+def naics_descriptions() -> Dict[str, str]:
+    """Description of every NAICS, by code"""
+    return reference_data_cache.get("naics", lambda: dict(NAICS.objects.values_list("code", "description")))
+
+
+def cfda_details(program_numbers: Iterable[str]) -> Dict[str, dict]:
+    """CFDA_DETAIL_FIELDS of each of the program numbers found, by program number.  Only unseen numbers are queried"""
+
+    def fetch_cfda_details(keys):
+        details = {key: None for key in keys}
+        cfdas = Cfda.objects.filter(program_number__in=[program_number for _, program_number in keys])
+        for cfda in cfdas.values("program_number", *CFDA_DETAIL_FIELDS):
+            details[("cfda", cfda.pop("program_number"))] = cfda
+        return details
+
+    cached = reference_data_cache.get_many(
+        [("cfda", program_number) for program_number in program_numbers], fetch_cfda_details
+    )
+    return {program_number: details for (_, program_number), details in cached.items() if details is not None}
+
+
+def agencies() -> Dict[int, dict]:
+    """Every Agency with its toptier and subtier names, codes and abbreviations, by id"""
+
+    def fetch_agencies():
+        values = Agency.objects.values(
+            "id",
+            "toptier_flag",
+            "toptier_agency_id",
+            "subtier_agency_id",
+            "toptier_agency__toptier_code",
+            "toptier_agency__name",
+            "toptier_agency__abbreviation",
+            "subtier_agency__subtier_code",
+            "subtier_agency__name",
+            "subtier_agency__abbreviation",
+        )
+        return {agency["id"]: agency for agency in values.order_by("id")}
+
+    return reference_data_cache.get("agencies", fetch_agencies)
+
+
+def agencies_by_subtier_code() -> Dict[str, dict]:
+    """The Agency (from agencies) of every subtier agency, by subtier code"""
+    return reference_data_cache.get(
+        "agencies_by_subtier_code",
+        lambda: {
+            agency["subtier_agency__subtier_code"]: agency
+            for agency in agencies().values()
+            if agency["subtier_agency__subtier_code"] is not None
+        },
+    )
+
+
+def toptier_agencies_by_subtier_agency_id() -> Dict[int, dict]:
+    """The toptier flagged Agency (from agencies) over each subtier agency, by subtier agency id"""
+
+    def fetch_toptier_agencies():
+        toptier_flagged = {}
+        for agency in agencies().values():
+            if agency["toptier_flag"]:
+                toptier_flagged.setdefault(agency["toptier_agency_id"], agency)
+        toptier_agencies = {}
+        for agency in agencies().values():
+            if agency["subtier_agency_id"] is not None and agency["toptier_agency_id"] in toptier_flagged:
+                toptier_agencies.setdefault(agency["subtier_agency_id"], toptier_flagged[agency["toptier_agency_id"]])
+        return toptier_agencies
+
+    return reference_data_cache.get("toptier_agencies_by_subtier_agency_id", fetch_toptier_agencies)
+
+
+def subtier_codes_by_toptier_code() -> Dict[str, FrozenSet[str]]:
+    """Subtier codes of the agencies under each toptier agency, by toptier code"""
+
+    def fetch_subtier_codes():
+        subtier_codes = defaultdict(set)
+        for agency in agencies().values():
+            if agency["subtier_agency__subtier_code"] is not None:
+                subtier_codes[agency["toptier_agency__toptier_code"]].add(agency["subtier_agency__subtier_code"])
+        return {toptier_code: frozenset(codes) for toptier_code, codes in subtier_codes.items()}
+
+    return reference_data_cache.get("subtier_codes_by_toptier_code", fetch_subtier_codes)
+
+
+def subtier_agencies() -> Dict[str, dict]:
+    """Name and id of every SubtierAgency, by subtier code"""
+    return reference_data_cache.get(
+        "subtier_agencies",
+        lambda: {
+            subtier["subtier_code"]: subtier
+            for subtier in SubtierAgency.objects.values("subtier_code", "name", "subtier_agency_id")
+        },
+    )
+
+
+def toptier_codes_with_submissions() -> FrozenSet[str]:
+    """Toptier codes of the agencies that have submitted File C, and so have an agency page"""
+    return reference_data_cache.get(
+        "toptier_codes_with_submissions",
+        lambda: frozenset(SubmissionAttributes.objects.values_list("toptier_code", flat=True).distinct()),
+    )
+
+
+def disaster_emergency_fund_codes(group_name: str) -> FrozenSet[str]:
+    return reference_data_cache.get(
+        ("defc", group_name),
+        lambda: frozenset(
+            DisasterEmergencyFundCode.objects.filter(group_name=group_name).values_list("code", flat=True)
+        ),
+    )
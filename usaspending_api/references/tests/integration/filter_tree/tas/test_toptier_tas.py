@@ -54,6 +54,18 @@ def test_positive_depth(client, cfo_agencies):
     assert len([elem["children"][0] for elem in resp.json()["results"]]) == 5
 
 
+# Does the endpoint look up each tier of the tree in one go, rather than node by node?
+def test_query_count_independent_of_node_count(client, cfo_agencies, non_cfo_agencies, django_assert_max_num_queries):
+    # Two to check the data load date, then one each for the agencies, federal accounts and TAS
+    with django_assert_max_num_queries(5):
+        resp = _call_and_expect_200(client, base_query + "?depth=2")
+    assert len(resp.json()["results"]) == 100 - len(CFO_CGACS) + 5
+
+    # A second request is answered from the data load cache, once the data load date has been checked
+    with django_assert_max_num_queries(0):
+        _call_and_expect_200(client, base_query + "?depth=2")
+
+
 def _call_and_expect_200(client, url):
     resp = client.get(url)
     assert resp.status_code == status.HTTP_200_OK, "Failed to return 200 Response"
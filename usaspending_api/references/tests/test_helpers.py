@@ -57,3 +57,36 @@ def test_obtain_agency_name_from_cgac(load_agency_data):
 def test_missing_agency(load_agency_data):
     for code in ["410", "", None, "0", "000", "0100", "90", "09", "4101", "40", "409", "X"]:
         assert helpers.retrive_agency_name_from_code(code) is None
+
+
+def test_cfda_details_are_fetched_once(db, django_assert_num_queries):
+    mommy.make("references.Cfda", program_number="10.001", program_title="Agricultural Research")
+
+    # Two queries for the latest data load date and one for the CFDA
+    with django_assert_num_queries(3):
+        details = helpers.cfda_details(["10.001", "99.999"])
+    assert list(details) == ["10.001"]
+    assert details["10.001"]["program_title"] == "Agricultural Research"
+    assert set(details["10.001"]) == set(helpers.CFDA_DETAIL_FIELDS)
+
+    with django_assert_num_queries(0):
+        assert helpers.cfda_details(["10.001", "99.999"]) == details
+        assert helpers.cfda_details(["99.999"]) == {}
+
+
+def test_agencies_by_subtier_code(db):
+    toptier = mommy.make("references.ToptierAgency", toptier_code="012", name="Department of Agriculture")
+    subtier_1 = mommy.make("references.SubtierAgency", subtier_code="1200", name="Agricultural Research Service")
+    subtier_2 = mommy.make("references.SubtierAgency", subtier_code="1205", name="Forest Service")
+    agency_1 = mommy.make("references.Agency", toptier_agency=toptier, subtier_agency=subtier_1, toptier_flag=True)
+    agency_2 = mommy.make("references.Agency", toptier_agency=toptier, subtier_agency=subtier_2)
+    mommy.make("references.Agency", toptier_agency=toptier, subtier_agency=None)
+
+    agencies = helpers.agencies_by_subtier_code()
+    assert {code: agency["id"] for code, agency in agencies.items()} == {"1200": agency_1.id, "1205": agency_2.id}
+    assert agencies["1205"]["toptier_agency__name"] == "Department of Agriculture"
+    assert helpers.subtier_codes_by_toptier_code() == {"012": frozenset(["1200", "1205"])}
+    assert helpers.toptier_agencies_by_subtier_agency_id() == {
+        subtier_1.subtier_agency_id: agencies["1200"],
+        subtier_2.subtier_agency_id: agencies["1200"],
+    }
@@ -1,6 +1,8 @@
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, List, Optional, Tuple
+
+from usaspending_api.common.data_load_cache import DataLoadCache
 
 DEFAULT_CHILDREN = 0
 
@@ -31,6 +33,14 @@ class Node:
 
 
 class FilterTree(metaclass=ABCMeta):
+    """
+    Nodes are linked a tier at a time: the children of every node in a tier are found with a single call to
+    raw_search_many, all the way down to the leaves since a node's count is the number of leaves below it.  Trees
+    that set `data_load_cache` keep their raw_search_many results between requests until the next data load.
+    """
+
+    data_load_cache: Optional[DataLoadCache] = None
+
     def search(self, tier1, tier2, tier3, child_layers, filter_string) -> list:
         if tier3:
             ancestor_array = [tier1, tier2, tier3]
@@ -41,33 +51,50 @@ class FilterTree(metaclass=ABCMeta):
         else:
             ancestor_array = []
 
-        retval = [
-            self._linked_node_from_data(ancestor_array, elem, filter_string, child_layers)
-            for elem in self.raw_search(ancestor_array)
-        ]
+        retval = self._linked_nodes_from_data(
+            [(ancestor_array, elem) for elem in self._cached_raw_search_many([ancestor_array])[0]], child_layers
+        )
         if filter_string:
             retval = [elem for elem in retval if self.matches_filter(elem, filter_string)]
         return retval
 
-    def _linked_node_from_data(self, ancestor_array, data, filter_string, child_layers):
-        retval = self.unlinked_node_from_data(ancestor_array, data)
-        raw_children = self.raw_search(ancestor_array + [retval.id])
-        temp_children = [
-            self._linked_node_from_data(ancestor_array + [retval.id], elem, filter_string, child_layers - 1)
-            for elem in raw_children
-        ]
-        if child_layers:
-            children = temp_children
-        else:
-            children = None
-
-        return Node(
-            id=retval.id,
-            ancestors=retval.ancestors,
-            description=retval.description,
-            count=sum([node.count if node.count else 1 for node in temp_children]),
-            children=children,
+    def _linked_nodes_from_data(self, tier: List[Tuple[list, Any]], child_layers) -> List[Node]:
+        """Links every (ancestors, data) pair in a tier, returning their nodes in the same order"""
+        unlinked_nodes = [self.unlinked_node_from_data(ancestors, data) for ancestors, data in tier]
+        paths = [ancestors + [node.id] for (ancestors, _), node in zip(tier, unlinked_nodes)]
+        raw_children = self._cached_raw_search_many(paths) if paths else []
+        child_tier = [(path, elem) for path, elems in zip(paths, raw_children) for elem in elems]
+        linked_children = iter(self._linked_nodes_from_data(child_tier, child_layers - 1) if child_tier else [])
+
+        retval = []
+        for node, elems in zip(unlinked_nodes, raw_children):
+            temp_children = [next(linked_children) for _ in elems]
+            retval.append(
+                Node(
+                    id=node.id,
+                    ancestors=node.ancestors,
+                    description=node.description,
+                    count=sum([child.count if child.count else 1 for child in temp_children]),
+                    children=temp_children if child_layers else None,
+                )
+            )
+        return retval
+
+    def _cached_raw_search_many(self, tiered_keys_list: List[list]) -> List[list]:
+        if self.data_load_cache is None:
+            return self.raw_search_many(tiered_keys_list)
+        keys = [tuple(tiered_keys) for tiered_keys in tiered_keys_list]
+        cached = self.data_load_cache.get_many(
+            keys, lambda missing: dict(zip(missing, self.raw_search_many([list(key) for key in missing])))
         )
+        return [cached[key] for key in keys]
+
+    def raw_search_many(self, tiered_keys_list: List[list]) -> List[list]:
+        """
+        raw_search for each of a list of paths, returning a list of results per path.  Trees should override this to
+        search for all of the paths at once.
+        """
+        return [self.raw_search(tiered_keys) for tiered_keys in tiered_keys_list]
 
     @abstractmethod
     def raw_search(self, tiered_keys: list, filter_string: str) -> list:
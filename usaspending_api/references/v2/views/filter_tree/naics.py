@@ -1,5 +1,5 @@
 import logging
-from collections import OrderedDict
+from collections import Counter, OrderedDict
 
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -8,12 +8,24 @@ from django.db.models.functions import Length
 from django.db.models import Q
 
 from usaspending_api.common.cache_decorator import cache_response
+from usaspending_api.common.data_load_cache import DataLoadCache
 from usaspending_api.common.validator.tinyshield import TinyShield
 from usaspending_api.references.models import NAICS
 from usaspending_api.references.v2.views.filter_tree.filter_tree import DEFAULT_CHILDREN
 
 logger = logging.getLogger("console")
 
+naics_data_load_cache = DataLoadCache()
+
+
+def _count_naics_leaves() -> Counter:
+    """Number of six digit NAICS under every shorter code, from a single query"""
+    counts = Counter()
+    for code in NAICS.objects.annotate(text_len=Length("code")).filter(text_len=6).values_list("code", flat=True):
+        for length in range(1, 6):
+            counts[code[:length]] += 1
+    return counts
+
 
 class NAICSViewSet(APIView):
     """
@@ -40,6 +52,10 @@ class NAICSViewSet(APIView):
         validated = TinyShield(models).block(data)
         return validated
 
+    @staticmethod
+    def _leaf_count(naics_code: str) -> int:
+        return naics_data_load_cache.get("leaf_counts", _count_naics_leaves)[naics_code]
+
     def _fetch_children(self, naics_code, naics_filter=None) -> list:
         results = []
         if naics_filter:
@@ -55,11 +71,7 @@ class NAICSViewSet(APIView):
                 result = OrderedDict()
                 result["naics"] = naic.code
                 result["naics_description"] = naic.description
-                result["count"] = (
-                    NAICS.objects.annotate(text_len=Length("code"))
-                    .filter(code__startswith=naic.code, text_len=6)
-                    .count()
-                )
+                result["count"] = self._leaf_count(naic.code)
             else:
                 result = OrderedDict()
                 result["naics"] = naic.code
@@ -100,9 +112,7 @@ class NAICSViewSet(APIView):
             result = OrderedDict()
             result["naics"] = naic.code
             result["naics_description"] = naic.description
-            result["count"] = (
-                NAICS.objects.annotate(text_len=Length("code")).filter(code__startswith=naic.code, text_len=6).count()
-            )
+            result["count"] = self._leaf_count(naic.code)
             result["children"] = []
             tier2_results[naic.code] = result
 
@@ -118,9 +128,7 @@ class NAICSViewSet(APIView):
             result = OrderedDict()
             result["naics"] = naic.code
             result["naics_description"] = naic.description
-            result["count"] = (
-                NAICS.objects.annotate(text_len=Length("code")).filter(code__startswith=naic.code, text_len=6).count()
-            )
+            result["count"] = self._leaf_count(naic.code)
             result["children"] = []
             tier1_results[naic.code] = result
         for key in tier2_results.keys():
@@ -140,9 +148,7 @@ class NAICSViewSet(APIView):
             result = OrderedDict()
             result["naics"] = naic.code
             result["naics_description"] = naic.description
-            result["count"] = (
-                NAICS.objects.annotate(text_len=Length("code")).filter(code__startswith=naic.code, text_len=6).count()
-            )
+            result["count"] = self._leaf_count(naic.code)
             results.append(result)
         results.sort(key=lambda x: x["naics"])
         response_content = OrderedDict({"results": results})
@@ -168,11 +174,7 @@ class NAICSViewSet(APIView):
             if len(naic.code) < 6:
                 result["naics"] = naic.code
                 result["naics_description"] = naic.description
-                result["count"] = (
-                    NAICS.objects.annotate(text_len=Length("code"))
-                    .filter(code__startswith=naic.code, text_len=6)
-                    .count()
-                )
+                result["count"] = self._leaf_count(naic.code)
                 result["children"] = self._fetch_children(naic.code)
             else:
                 result["naics"] = naic.code
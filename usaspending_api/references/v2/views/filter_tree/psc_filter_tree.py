@@ -1,6 +1,8 @@
 import re
 
+from collections import defaultdict
 from string import ascii_uppercase, digits
+from usaspending_api.common.data_load_cache import DataLoadCache
 from usaspending_api.references.models import PSC
 from usaspending_api.references.v2.views.filter_tree.filter_tree import UnlinkedNode, FilterTree
 
@@ -16,16 +18,29 @@ PSC_GROUPS = {
 
 
 class PSCFilterTree(FilterTree):
+    data_load_cache = DataLoadCache()
+
     def raw_search(self, tiered_keys):
-        if not self._path_is_valid(tiered_keys):
-            return []
+        return self.raw_search_many([tiered_keys])[0]
 
-        if len(tiered_keys) == 0:
-            return self._toptier_search()
-        elif len(tiered_keys) == 1:
-            return self._psc_from_group(tiered_keys[0])
-        else:
-            return self._psc_from_parent(tiered_keys[-1])
+    def raw_search_many(self, tiered_keys_list):
+        valid_keys_list = [tiered_keys for tiered_keys in tiered_keys_list if self._path_is_valid(tiered_keys)]
+        groups = {tiered_keys[0] for tiered_keys in valid_keys_list if len(tiered_keys) == 1}
+        parents = {tiered_keys[-1] for tiered_keys in valid_keys_list if len(tiered_keys) > 1}
+        psc_by_group = self._psc_from_groups(groups) if groups else {}
+        psc_by_parent = self._psc_from_parents(parents) if parents else {}
+
+        retval = []
+        for tiered_keys in tiered_keys_list:
+            if not self._path_is_valid(tiered_keys):
+                retval.append([])
+            elif len(tiered_keys) == 0:
+                retval.append(self._toptier_search())
+            elif len(tiered_keys) == 1:
+                retval.append(psc_by_group.get(tiered_keys[0], []))
+            else:
+                retval.append(psc_by_parent.get(tiered_keys[-1], []))
+        return retval
 
     def _path_is_valid(self, path: list) -> bool:
         if len(path) > 1:
@@ -39,22 +54,33 @@ class PSCFilterTree(FilterTree):
     def _toptier_search(self):
         return PSC_GROUPS.keys()
 
-    def _psc_from_group(self, group):
-        # The default regex value will match nothing
-        return self._psc_from_regex(PSC_GROUPS.get(group, {}).get("pattern") or "(?!)")
+    def _psc_from_groups(self, groups):
+        """PSC of every one of the groups in a single query, by group"""
+        patterns = {group: PSC_GROUPS[group]["pattern"] for group in groups if group in PSC_GROUPS}
+        if not patterns:
+            return {}
+        retval = defaultdict(list)
+        for object in PSC.objects.filter(code__iregex="|".join(f"({pattern})" for pattern in patterns.values())):
+            for group, pattern in patterns.items():
+                if re.match(pattern, object.code, re.IGNORECASE):
+                    retval[group].append({"id": object.code, "description": object.description})
+        return retval
 
-    def _psc_from_regex(self, regex):
-        return [
-            {"id": object.code, "description": object.description} for object in PSC.objects.filter(code__iregex=regex)
-        ]  # normally very unsafe, but regexes are not being supplied by the user
+    def _psc_from_parents(self, parents):
+        """Children of every one of the parents in a single query, by parent"""
+        parent_lengths = {len(parent) for parent in parents}
+        children = defaultdict(list)
+        for object in PSC.objects.filter(length__in={self._child_length(parent) for parent in parents}):
+            for parent_length in parent_lengths:
+                children[(object.code[:parent_length], object.length)].append(
+                    {"id": object.code, "description": object.description}
+                )
+        return {parent: children.get((parent, self._child_length(parent)), []) for parent in parents}
 
-    def _psc_from_parent(self, parent):
+    @staticmethod
+    def _child_length(parent):
         # two out of three branches of the PSC tree "jump" over 3 character codes
-        desired_len = len(parent) + 2 if len(parent) == 2 and parent[0] != "A" else len(parent) + 1
-        return [
-            {"id": object.code, "description": object.description}
-            for object in PSC.objects.filter(length=desired_len, code__startswith=parent)
-        ]
+        return len(parent) + 2 if len(parent) == 2 and parent[0] != "A" else len(parent) + 1
 
     def unlinked_node_from_data(self, ancestors: list, data) -> UnlinkedNode:
         if len(ancestors) == 0:  # A tier zero search is returning an agency dictionary
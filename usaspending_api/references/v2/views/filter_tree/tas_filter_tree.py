@@ -1,3 +1,6 @@
+from collections import defaultdict
+
+from usaspending_api.common.data_load_cache import DataLoadCache
 from usaspending_api.common.helpers.business_logic_helpers import cfo_presentation_order, faba_with_file_D_data
 from usaspending_api.accounts.models import TreasuryAppropriationAccount, FederalAccount
 from usaspending_api.references.v2.views.filter_tree.filter_tree import UnlinkedNode, FilterTree
@@ -6,14 +9,30 @@ from django.db.models import Exists, OuterRef
 
 
 class TASFilterTree(FilterTree):
+    data_load_cache = DataLoadCache()
+
     def raw_search(self, tiered_keys):
-        if len(tiered_keys) == 0:
-            return self._toptier_search()
-        if len(tiered_keys) == 1:
-            return self._fa_given_agency(tiered_keys[0])
-        if len(tiered_keys) == 2:
-            return self._tas_given_fa(tiered_keys[0], tiered_keys[1])
-        return []
+        return self.raw_search_many([tiered_keys])[0]
+
+    def raw_search_many(self, tiered_keys_list):
+        agencies = {tiered_keys[0] for tiered_keys in tiered_keys_list if len(tiered_keys) == 1}
+        federal_accounts = {tuple(tiered_keys) for tiered_keys in tiered_keys_list if len(tiered_keys) == 2}
+
+        toptier_results = self._toptier_search() if any(len(keys) == 0 for keys in tiered_keys_list) else []
+        fa_results = self._fa_given_agencies(agencies) if agencies else {}
+        tas_results = self._tas_given_fas(federal_accounts) if federal_accounts else {}
+
+        retval = []
+        for tiered_keys in tiered_keys_list:
+            if len(tiered_keys) == 0:
+                retval.append(toptier_results)
+            elif len(tiered_keys) == 1:
+                retval.append(fa_results.get(tiered_keys[0], []))
+            elif len(tiered_keys) == 2:
+                retval.append(tas_results.get(tuple(tiered_keys), []))
+            else:
+                retval.append([])
+        return retval
 
     def _toptier_search(self):
         agency_set = (
@@ -35,27 +54,57 @@ class TASFilterTree(FilterTree):
     def _dictionary_from_agency(self, agency):
         return {"toptier_code": agency["toptier_code"], "name": agency["name"], "abbreviation": agency["abbreviation"]}
 
-    def _fa_given_agency(self, agency):
-        return FederalAccount.objects.annotate(
-            has_faba=Exists(faba_with_file_D_data().filter(treasury_account__federal_account=OuterRef("pk")))
-        ).filter(has_faba=True, parent_toptier_agency__toptier_code=agency)
-
-    def _tas_given_fa(self, agency, fed_account):
-        return TreasuryAppropriationAccount.objects.annotate(
-            has_faba=Exists(faba_with_file_D_data().filter(treasury_account=OuterRef("pk")))
-        ).filter(
-            has_faba=True,
-            federal_account__federal_account_code=fed_account,
-            federal_account__parent_toptier_agency__toptier_code=agency,
+    def _fa_given_agencies(self, agencies):
+        """Federal accounts of every one of the agencies, by agency"""
+        federal_accounts = (
+            FederalAccount.objects.annotate(
+                has_faba=Exists(faba_with_file_D_data().filter(treasury_account__federal_account=OuterRef("pk")))
+            )
+            .filter(has_faba=True, parent_toptier_agency__toptier_code__in=agencies)
+            .values("federal_account_code", "account_title", "parent_toptier_agency__toptier_code")
+        )
+
+        retval = defaultdict(list)
+        for federal_account in federal_accounts:
+            retval[federal_account["parent_toptier_agency__toptier_code"]].append(federal_account)
+        return retval
+
+    def _tas_given_fas(self, federal_accounts):
+        """TAS of every one of the (agency, federal account) pairs, by pair"""
+        tas_set = (
+            TreasuryAppropriationAccount.objects.annotate(
+                has_faba=Exists(faba_with_file_D_data().filter(treasury_account=OuterRef("pk")))
+            )
+            .filter(
+                has_faba=True,
+                federal_account__federal_account_code__in={fed_account for _, fed_account in federal_accounts},
+                federal_account__parent_toptier_agency__toptier_code__in={agency for agency, _ in federal_accounts},
+            )
+            .values(
+                "tas_rendering_label",
+                "account_title",
+                "federal_account__federal_account_code",
+                "federal_account__parent_toptier_agency__toptier_code",
+            )
         )
 
+        retval = defaultdict(list)
+        for tas in tas_set:
+            key = (
+                tas["federal_account__parent_toptier_agency__toptier_code"],
+                tas["federal_account__federal_account_code"],
+            )
+            if key in federal_accounts:
+                retval[key].append(tas)
+        return retval
+
     def unlinked_node_from_data(self, ancestors: list, data) -> UnlinkedNode:
         if len(ancestors) == 0:  # A tier zero search is returning an agency dictionary
             return self._generate_agency_node(ancestors, data)
-        if len(ancestors) == 1:  # A tier one search is returning a FederalAccount object
+        if len(ancestors) == 1:  # A tier one search is returning a federal account dictionary
             return self._generate_federal_account_node(ancestors, data)
-        if len(ancestors) == 2:  # A tier two search will be returning a TreasuryAppropriationAccount object
-            return UnlinkedNode(id=data.tas_rendering_label, ancestors=ancestors, description=data.account_title)
+        if len(ancestors) == 2:  # A tier two search will be returning a treasury appropriation account dictionary
+            return UnlinkedNode(id=data["tas_rendering_label"], ancestors=ancestors, description=data["account_title"])
 
     def _generate_agency_node(self, ancestors, data):
         return UnlinkedNode(
@@ -63,4 +112,4 @@ class TASFilterTree(FilterTree):
         )
 
     def _generate_federal_account_node(self, ancestors, data):
-        return UnlinkedNode(id=data.federal_account_code, ancestors=ancestors, description=data.account_title)
+        return UnlinkedNode(id=data["federal_account_code"], ancestors=ancestors, description=data["account_title"])
@@ -1,31 +1,78 @@
+import logging
+import os
 import random
+import re
+import threading
+import time
 
-from django.db import DEFAULT_DB_ALIAS
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, InterfaceError, OperationalError, connections, router
+from django.utils.deprecation import MiddlewareMixin
 from usaspending_api.references.models import FilterHash
 from usaspending_api.download.models import DownloadJob
 
+logger = logging.getLogger("console")
+
+REPLICA_ALIAS_PATTERN = re.compile(r"db_r\d+")
+
+# Replication lag in seconds (0 once the replica has replayed everything it has received) and the number of other
+# queries running on the replica
+REPLICA_STATUS_SQL = """
+    SELECT
+        CASE
+            WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+            ELSE COALESCE(EXTRACT(EPOCH FROM NOW() - pg_last_xact_replay_timestamp()), 0)
+        END,
+        (SELECT COUNT(*) FROM pg_stat_activity WHERE state = 'active' AND pid <> pg_backend_pid())
+"""
+
+# The database picked for the request being handled by this thread (see ReadReplicaPinningMiddleware)
+_request_state = threading.local()
+
 
 class ReadReplicaRouter:
     """
     The USAspending API is *mostly* a readonly application.  This router is used to balance loads
     between multiple databases defined by the environment variables in settings.py, and handle
     the models that are *not* readonly appropriately.  Also prevents model access/migrations to Broker.
+
+    Reads go to the read replicas whose replication lag, sampled every DB_REPLICA_LAG_CHECK_SECONDS by a
+    background thread, is no more than DB_REPLICA_MAX_LAG_SECONDS.  Less busy replicas are favored and the
+    writable database is only read from when no replica is available.  Every read of a request goes to the
+    same database so one response isn't built from servers at different points of replication.  A replica
+    that fails a request is skipped until it's next sampled, but the failed request itself isn't retried.
+    The routing counters from stats() are logged every DB_REPLICA_STATS_LOG_SECONDS.
     """
 
     writable_database = DEFAULT_DB_ALIAS
-    read_replicas = ["db_r1"]
+    read_replicas = None  # None for every db_r<number> database in settings.DATABASES
 
     def __init__(self):
+        if self.read_replicas is None:
+            self.read_replicas = sorted(alias for alias in settings.DATABASES if REPLICA_ALIAS_PATTERN.fullmatch(alias))
         self.usaspending_databases = [self.writable_database] + self.read_replicas
+        self._lock = threading.Lock()
+        self._sampler_pid = None
+        # Replicas are available until a sample says otherwise so a new process doesn't start on the primary
+        self._replica_status = {
+            alias: {"available": True, "lag_seconds": None, "active_queries": 0} for alias in self.read_replicas
+        }
+        self._routed = {alias: 0 for alias in self.usaspending_databases}
+        self._fallbacks = 0
 
     def db_for_read(self, model, **hints):
         """
         FilterHash and DownloadJob are writable tables so always read from source (default) to
-        mitigate replication lag.  Otherwise, choose a connection randomly.
+        mitigate replication lag.  Otherwise, use the database the request is pinned to, if any.
         """
         if model in [FilterHash, DownloadJob]:
             return self.writable_database
-        return random.choice(self.usaspending_databases)
+        database = getattr(_request_state, "database", None)
+        if database is None:
+            database = self.choose_read_database()
+            if getattr(_request_state, "pinning", False):
+                _request_state.database = database
+        return database
 
     def db_for_write(self, model, **hints):
         return self.writable_database
@@ -38,8 +85,135 @@ class ReadReplicaRouter:
         """ Migrations should only run in USAspending against the writable database. """
         return db == self.writable_database
 
+    def choose_read_database(self) -> str:
+        """
+        Picks one of the available replicas, weighted against the number of queries they were last seen running,
+        or the writable database if there are none.
+        """
+        if not self.read_replicas:
+            return self.writable_database
+        self._start_sampler()
+        with self._lock:
+            available = [alias for alias, status in self._replica_status.items() if status["available"]]
+            if available:
+                weights = [1 / (1 + self._replica_status[alias]["active_queries"]) for alias in available]
+                database = random.choices(available, weights)[0]
+            else:
+                database = self.writable_database
+                self._fallbacks += 1
+            self._routed[database] += 1
+        return database
+
+    def record_sample(self, alias, lag_seconds, active_queries):
+        """Updates what's known of a replica.  A lag_seconds of None means the replica couldn't be sampled."""
+        available = lag_seconds is not None and lag_seconds <= settings.DB_REPLICA_MAX_LAG_SECONDS
+        with self._lock:
+            status = self._replica_status[alias]
+            if status["available"] != available:
+                if available:
+                    logger.info(f"Routing reads to read replica {alias} again (lag {lag_seconds:.1f}s)")
+                elif lag_seconds is None:
+                    logger.warning(f"No longer routing reads to read replica {alias}: it can't be reached")
+                else:
+                    logger.warning(f"No longer routing reads to read replica {alias}: lag {lag_seconds:.1f}s")
+            status.update(available=available, lag_seconds=lag_seconds, active_queries=active_queries or 0)
+
+    def mark_unavailable(self, alias):
+        """Stops routing reads to a replica until it's next sampled successfully"""
+        self.record_sample(alias, None, None)
+
+    def sample_replica(self, alias):
+        try:
+            with connections[alias].cursor() as cursor:
+                cursor.execute(REPLICA_STATUS_SQL)
+                lag_seconds, active_queries = cursor.fetchone()
+        except Exception:
+            if self._replica_status[alias]["available"]:  # Only log the first of a run of failures
+                logger.exception(f"Unable to read the replication status of {alias}")
+            connections[alias].close()  # Reconnect on the next sample rather than reuse a broken connection
+            self.record_sample(alias, None, None)
+        else:
+            self.record_sample(alias, float(lag_seconds), active_queries)
+
+    def stats(self) -> dict:
+        """Reads routed to each database, replica status and the number of reads that fell back to the primary"""
+        with self._lock:
+            stats = {alias: {"routed": count} for alias, count in self._routed.items()}
+            for alias, status in self._replica_status.items():
+                stats[alias].update(status)
+            stats[self.writable_database]["fallbacks"] = self._fallbacks
+            return stats
+
+    def _start_sampler(self):
+        """Starts the lag sampler in this process if it isn't running yet, including in processes forked since"""
+        if settings.DB_REPLICA_LAG_CHECK_SECONDS <= 0 or self._sampler_pid == os.getpid():
+            return
+        with self._lock:
+            if self._sampler_pid != os.getpid():
+                self._sampler_pid = os.getpid()
+                threading.Thread(target=self._sample_replicas, name="replica-lag-sampler", daemon=True).start()
+
+    def _sample_replicas(self):
+        stats_logged_at = time.monotonic()
+        while True:
+            for alias in self.read_replicas:
+                self.sample_replica(alias)
+            if (
+                settings.DB_REPLICA_STATS_LOG_SECONDS > 0
+                and time.monotonic() - stats_logged_at >= settings.DB_REPLICA_STATS_LOG_SECONDS
+            ):
+                logger.info(f"Read replica routing in process {os.getpid()}: {self.stats()}")
+                stats_logged_at = time.monotonic()
+            time.sleep(settings.DB_REPLICA_LAG_CHECK_SECONDS)
+
 
 class DefaultOnlyRouter(ReadReplicaRouter):
     """ For when only the default connection is used.  Prevents model access/migrations to Broker. """
 
     read_replicas = []
+
+
+class ReadReplicaPinningMiddleware(MiddlewareMixin):
+    """Sends every read of a request to the database the router chooses for its first read"""
+
+    def process_request(self, request):
+        _request_state.pinning = True
+        _request_state.database = None
+
+    def process_response(self, request, response):
+        unpin_read_database()
+        return response
+
+    def process_exception(self, request, exception):
+        """Takes the replica the request was reading from out of rotation if the request failed because it's down"""
+        database = get_pinned_database()
+        replica_router = get_read_replica_router()
+        if (
+            isinstance(exception, (InterfaceError, OperationalError))
+            and replica_router
+            and database in replica_router.read_replicas
+            and not _is_connected(database)
+        ):
+            logger.warning(f"Request failed reading from read replica {database}: {exception}")
+            replica_router.mark_unavailable(database)
+
+
+def _is_connected(alias):
+    """False if this thread couldn't connect to the database or its connection has stopped working"""
+    connection = connections[alias]
+    return connection.connection is not None and connection.is_usable()
+
+
+def get_read_replica_router():
+    """The ReadReplicaRouter Django routes queries with, if it's using one"""
+    return next((r for r in router.routers if isinstance(r, ReadReplicaRouter)), None)
+
+
+def get_pinned_database():
+    """The database reads of the current request are going to, or None if it hasn't read anything yet"""
+    return getattr(_request_state, "database", None)
+
+
+def unpin_read_database():
+    _request_state.pinning = False
+    _request_state.database = None
@@ -7,6 +7,7 @@ from rest_framework import status
 from usaspending_api.awards.v2.lookups.lookups import all_award_types_mappings
 from usaspending_api.search.tests.data.search_filters_test_data import non_legacy_filters, legacy_filters
 from usaspending_api.search.tests.data.utilities import setup_elasticsearch_test
+from usaspending_api.search.v2.views.spending_by_award import SpendingByAwardVisualizationViewSet
 
 
 @pytest.mark.django_db
@@ -1330,3 +1331,41 @@ def test_search_after(client, monkeypatch, spending_by_award_test_data, elastics
     assert resp.status_code == status.HTTP_200_OK
     assert len(resp.json().get("results")) == 2
     assert resp.json().get("results") == expected_result, "Award Type Code filter does not match expected result"
+
+
+@pytest.mark.django_db
+def test_page_level_agency_and_recipient_lookups():
+    mommy.make("references.ToptierAgency", pk=1, toptier_code="012")
+    mommy.make("references.ToptierAgency", pk=2, toptier_code="097")
+    mommy.make("references.Agency", pk=11, toptier_agency_id=1, toptier_flag=True)
+    mommy.make("references.Agency", pk=12, toptier_agency_id=1, toptier_flag=True)
+    mommy.make("references.Agency", pk=21, toptier_agency_id=2, toptier_flag=True)
+    mommy.make("submissions.SubmissionAttributes", toptier_code="012")
+    mommy.make("recipient.RecipientLookup", recipient_hash="bb7d6b0b-f890-4cec-a8ae-f777c8f5c3a9", duns="111")
+    mommy.make("recipient.RecipientLookup", recipient_hash="180bddfc-67f0-42d6-8279-a014d1062d65", duns="222")
+    for recipient_hash, level in (
+        ("bb7d6b0b-f890-4cec-a8ae-f777c8f5c3a9", "R"),
+        ("bb7d6b0b-f890-4cec-a8ae-f777c8f5c3a9", "C"),
+        ("180bddfc-67f0-42d6-8279-a014d1062d65", "P"),
+    ):
+        mommy.make("recipient.RecipientProfile", recipient_hash=recipient_hash, recipient_level=level)
+
+    view = SpendingByAwardVisualizationViewSet()
+    view.fields = ["Award ID", "Awarding Agency", "recipient_id"]
+
+    codes = [view.format_toptier_code(code) for code in (12, 12.0, "097")]
+    assert view.get_agency_database_ids(codes) == {"012": 11}
+
+    results = [
+        {"recipient_id": "111", "parent_recipient_unique_id": None},
+        {"recipient_id": "111", "parent_recipient_unique_id": "999"},
+        {"recipient_id": "222", "parent_recipient_unique_id": None},
+        {"recipient_id": None, "parent_recipient_unique_id": None},
+    ]
+    recipient_hash_levels = view.get_recipient_hash_levels(results)
+    assert [view.append_recipient_hash_level(row, recipient_hash_levels)["recipient_id"] for row in results] == [
+        "bb7d6b0b-f890-4cec-a8ae-f777c8f5c3a9-R",
+        "bb7d6b0b-f890-4cec-a8ae-f777c8f5c3a9-C",
+        None,
+        None,
+    ]
@@ -1,5 +1,6 @@
 import pytest
 
+from elasticsearch_dsl import Q as ES_Q
 from model_mommy import mommy
 
 from usaspending_api.common.helpers.generic_helper import get_time_period_message
@@ -1051,3 +1052,35 @@ def test_category_federal_accounts(federal_accounts_test_data, monkeypatch, elas
     }
 
     assert expected_response == spending_by_category_logic
+
+
+def test_category_awarding_agency_awards_separate_bucket_count(
+    agency_test_data, monkeypatch, elasticsearch_transaction_index
+):
+    setup_elasticsearch_test(monkeypatch, elasticsearch_transaction_index)
+    monkeypatch.setattr(AwardingAgencyViewSet, "combine_bucket_count_query", False)
+
+    test_payload = {"category": "awarding_agency", "subawards": False, "page": 1, "limit": 50}
+
+    spending_by_category_logic = AwardingAgencyViewSet().perform_search(test_payload, {})
+
+    expected_response = {
+        "category": "awarding_agency",
+        "limit": 50,
+        "page_metadata": {"page": 1, "next": None, "previous": None, "hasNext": False, "hasPrevious": False},
+        "results": [{"amount": 15, "name": "Awarding Toptier Agency 1", "code": "TA1", "id": 1001}],
+        "messages": [get_time_period_message()],
+    }
+
+    assert expected_response == spending_by_category_logic
+
+
+def test_bucket_count_requested_with_aggregations():
+    view = AwardingAgencyViewSet()
+    view.pagination = view._get_pagination({"page": 1, "limit": 10})
+
+    aggs = view.build_elasticsearch_search_with_aggregations(ES_Q("match_all")).to_dict()["aggs"]
+
+    assert aggs["field_count"] == {"cardinality": {"field": "awarding_toptier_agency_agg_key.hash"}}
+    assert aggs["group_by_agg_key"]["terms"]["size"] == 9900
+    assert aggs["group_by_agg_key"]["terms"]["shard_size"] == 10000
@@ -184,11 +184,22 @@ def _get_number_of_unique_terms(search, field: str) -> int:
         "The maximum supported value is 40000, thresholds above this number will
         have the same effect as a threshold of 40000"
     """
-    cardinality_aggregation = A("cardinality", field=field)
-    search.aggs.metric("field_count", cardinality_aggregation)
+    add_unique_terms_aggregation(search, field)
     response = search.handle_execute()
-    response_dict = response.aggs.to_dict()
-    return response_dict.get("field_count", {"value": 0})["value"]
+    return get_unique_terms_from_response(response.aggs.to_dict())
+
+
+def add_unique_terms_aggregation(search, field: str) -> None:
+    """
+    Adds the cardinality aggregation behind get_number_of_unique_terms_* to a search that is also running other
+    aggregations, so the count is returned in the same round trip; read it back with get_unique_terms_from_response.
+    The same 40k limit applies.
+    """
+    search.aggs.metric("field_count", A("cardinality", field=field))
+
+
+def get_unique_terms_from_response(response: dict) -> int:
+    return response.get("field_count", {"value": 0})["value"]
 
 
 def get_scaled_sum_aggregations(field_to_sum: str, pagination: Optional[Pagination] = None) -> Dict[str, A]:
@@ -2,7 +2,8 @@ import copy
 
 from sys import maxsize
 from django.conf import settings
-from django.db.models import F
+from django.db.models import Exists, F, OuterRef
+from psycopg2.sql import Literal, SQL
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
@@ -306,14 +307,34 @@ class SpendingByAwardVisualizationViewSet(APIView):
 
     # For an unknown reason, ES tends to return the awarding agency toptier codes as integers or floats, instead of as
     # text. This function casts the code back to a string and appends any leading zeroes that were lost.
-    def get_agency_database_id(self, code):
+    @staticmethod
+    def format_toptier_code(code):
         if len(str(int(code))) < 3:
             code = "{zeroes}{code}".format(zeroes=("0" * (3 - len(str(int(code))))), code=int(code))
-        agency_id = Agency.objects.filter(toptier_agency__toptier_code=code, toptier_flag=True).first()
-        submission = SubmissionAttributes.objects.filter(toptier_code=code).first()
-        if submission is None or agency_id is None:
-            return None
-        return agency_id.id
+        return code
+
+    @staticmethod
+    def get_agency_database_ids(codes) -> dict:
+        """
+        Maps each toptier code to the id of its toptier Agency for every code on the page in a single query.  As
+        before, codes for agencies without a submission have no id.
+        """
+        codes = set(codes)
+        if not codes:
+            return {}
+        agencies = (
+            Agency.objects.filter(toptier_agency__toptier_code__in=codes, toptier_flag=True)
+            .annotate(
+                has_submission=Exists(
+                    SubmissionAttributes.objects.filter(toptier_code=OuterRef("toptier_agency__toptier_code"))
+                )
+            )
+            .filter(has_submission=True)
+            .order_by("-id")
+            .values_list("toptier_agency__toptier_code", "id")
+        )
+        # Ordered so the lowest id wins, same as the Agency.objects...first() this replaced
+        return dict(agencies)
 
     def construct_es_response_for_prime_awards(self, response) -> dict:
         results = []
@@ -341,18 +362,24 @@ class SpendingByAwardVisualizationViewSet(APIView):
             if row.get("Award Amount"):
                 row["Award Amount"] = float(row["Award Amount"])
             if row.get("Awarding Agency"):
-                code = row.pop("agency_code")
-                row["awarding_agency_id"] = self.get_agency_database_id(code)
+                row["agency_code"] = self.format_toptier_code(row["agency_code"])
             row["generated_internal_id"] = hit["generated_unique_award_id"]
             row["recipient_id"] = hit.get("recipient_unique_id")
             row["parent_recipient_unique_id"] = hit.get("parent_recipient_unique_id")
 
             if "Award ID" in self.fields:
                 row["Award ID"] = hit["display_award_id"]
-            row = self.append_recipient_hash_level(row)
-            row.pop("parent_recipient_unique_id")
             results.append(row)
 
+        # Agency ids and recipient hashes are looked up for the whole page at once rather than once per result
+        agency_ids = self.get_agency_database_ids(row["agency_code"] for row in results if row.get("Awarding Agency"))
+        recipient_hash_levels = self.get_recipient_hash_levels(results)
+        for row in results:
+            if row.get("Awarding Agency"):
+                row["awarding_agency_id"] = agency_ids.get(row.pop("agency_code"))
+            self.append_recipient_hash_level(row, recipient_hash_levels)
+            row.pop("parent_recipient_unique_id")
+
         last_record_unique_id = None
         last_record_sort_value = None
         offset = 1
@@ -385,38 +412,44 @@ class SpendingByAwardVisualizationViewSet(APIView):
             ],
         }
 
-    def append_recipient_hash_level(self, result) -> dict:
+    @staticmethod
+    def _recipient_level(result) -> str:
+        return "C" if result.get("parent_recipient_unique_id") else "R"
+
+    def get_recipient_hash_levels(self, results) -> dict:
+        """Maps (DUNS, recipient level) to recipient hash + level for every recipient on the page in a single query"""
+        if "recipient_id" not in self.fields:
+            return {}
+        duns_levels = {(row["recipient_id"], self._recipient_level(row)) for row in results if row.get("recipient_id")}
+        if not duns_levels:
+            return {}
+
+        sql = SQL(
+            """
+            select
+                rl.duns,
+                rp.recipient_level,
+                rp.recipient_hash || '-' ||  rp.recipient_level as hash
+            from
+                recipient_profile rp
+                inner join recipient_lookup rl on rl.recipient_hash = rp.recipient_hash
+            where
+                (rl.duns, rp.recipient_level) in {duns_levels} and
+                rp.recipient_name not in {special_cases}
+            """
+        ).format(duns_levels=Literal(tuple(duns_levels)), special_cases=Literal(tuple(SPECIAL_CASES)))
+
+        recipient_hash_levels = {}
+        for row in execute_sql_to_ordered_dictionary(sql):
+            recipient_hash_levels.setdefault((row["duns"], row["recipient_level"]), row["hash"])
+        return recipient_hash_levels
+
+    def append_recipient_hash_level(self, result, recipient_hash_levels) -> dict:
         if "recipient_id" not in self.fields:
             result.pop("recipient_id")
             return result
 
         id = result.get("recipient_id")
-        parent_id = result.get("parent_recipient_unique_id")
         if id:
-            sql = """(
-                    select
-                        rp.recipient_hash || '-' ||  rp.recipient_level as hash
-                    from
-                        recipient_profile rp
-                        inner join recipient_lookup rl on rl.recipient_hash = rp.recipient_hash
-                    where
-                        rl.duns = {recipient_id} and
-                        rp.recipient_level = case
-                            when {parent_recipient_unique_id} is null then 'R'
-                            else 'C'
-                        end and
-                    rp.recipient_name not in {special_cases}
-            )"""
-
-            special_cases = ["'" + case + "'" for case in SPECIAL_CASES]
-            SQL = sql.format(
-                recipient_id="'" + id + "'",
-                parent_recipient_unique_id=parent_id if parent_id else "null",
-                special_cases="(" + ", ".join(special_cases) + ")",
-            )
-            row = execute_sql_to_ordered_dictionary(SQL)
-            if len(row) > 0:
-                result["recipient_id"] = row[0].get("hash")
-            else:
-                result["recipient_id"] = None
+            result["recipient_id"] = recipient_hash_levels.get((id, self._recipient_level(result)))
         return result
@@ -1,4 +1,3 @@
-import copy
 import logging
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass
@@ -21,14 +20,27 @@ from usaspending_api.common.helpers.generic_helper import get_simple_pagination_
 from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.common.validator.award_filter import AWARD_FILTER
 from usaspending_api.common.validator.pagination import PAGINATION
-from usaspending_api.common.validator.tinyshield import TinyShield
+from usaspending_api.common.validator.tinyshield import CompiledTinyShield
 from usaspending_api.search.v2.elasticsearch_helper import (
+    add_unique_terms_aggregation,
     get_number_of_unique_terms_for_transactions,
     get_scaled_sum_aggregations,
+    get_unique_terms_from_response,
 )
 
 logger = logging.getLogger(__name__)
 
+# Elasticsearch limits the number of buckets an aggregation may return
+MAX_BUCKETS = 10000
+# Extra buckets considered on each shard for accurate results
+SHARD_SIZE_BUFFER = 100
+
+SPENDING_BY_CATEGORY_VALIDATOR = CompiledTinyShield(
+    [{"name": "subawards", "key": "subawards", "type": "boolean", "default": False, "optional": True}]
+    + AWARD_FILTER
+    + PAGINATION
+)
+
 
 @dataclass
 class Category:
@@ -48,17 +60,15 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
     pagination: Pagination
     subawards: bool
     high_cardinality_categories: List[str] = ["recipient_duns"]
+    # Request the bucket count alongside the aggregations rather than in a query of its own.  The terms aggregation is
+    # then sized to the most buckets allowed and the count is checked once the single response comes back.
+    combine_bucket_count_query: bool = True
+    request_validator: CompiledTinyShield = SPENDING_BY_CATEGORY_VALIDATOR
 
     @cache_response()
     def post(self, request: Request) -> Response:
-        models = [
-            {"name": "subawards", "key": "subawards", "type": "boolean", "default": False, "optional": True},
-        ]
-        models.extend(copy.deepcopy(AWARD_FILTER))
-        models.extend(copy.deepcopy(PAGINATION))
-
         original_filters = request.data.get("filters")
-        validated_payload = TinyShield(models).block(request.data)
+        validated_payload = self.request_validator.block(request.data)
 
         return Response(self.perform_search(validated_payload, original_filters))
 
@@ -135,6 +145,14 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
             shard_size = size
             sum_bucket_sort = sum_aggregations["sum_bucket_truncate"]
             group_by_agg_key_values = {"order": {"sum_field": "desc"}}
+        elif self.combine_bucket_count_query:
+            # The terms aggregation only returns the buckets that exist, so an upper bound on size is safe; the real
+            # count is checked against it in query_elasticsearch_for_prime_awards
+            add_unique_terms_aggregation(search, f"{self.category.agg_key}.hash")
+            size = MAX_BUCKETS - SHARD_SIZE_BUFFER
+            shard_size = MAX_BUCKETS
+            sum_bucket_sort = sum_aggregations["sum_bucket_sort"]
+            group_by_agg_key_values = {}
         else:
             # Get count of unique buckets; terminate early if there are no buckets matching criteria
             bucket_count = get_number_of_unique_terms_for_transactions(filter_query, f"{self.category.agg_key}.hash")
@@ -144,15 +162,12 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
                 # Add 100 to make sure that we consider enough records in each shard for accurate results;
                 # Only needed for non high-cardinality fields since those are being routed
                 size = bucket_count
-                shard_size = bucket_count + 100
+                shard_size = bucket_count + SHARD_SIZE_BUFFER
                 sum_bucket_sort = sum_aggregations["sum_bucket_sort"]
                 group_by_agg_key_values = {}
 
-        if shard_size > 10000:
-            logger.warning(f"Max number of buckets reached for aggregation key: {self.category.agg_key}.")
-            raise ElasticsearchConnectionException(
-                "Current filters return too many unique items. Narrow filters to return results."
-            )
+        if shard_size > MAX_BUCKETS:
+            self._raise_too_many_buckets()
 
         # Define all aggregations needed to build the response
         group_by_agg_key_values.update({"field": self.category.agg_key, "size": size, "shard_size": shard_size})
@@ -170,12 +185,24 @@ class AbstractSpendingByCategoryViewSet(APIView, metaclass=ABCMeta):
 
         return search
 
+    def _raise_too_many_buckets(self):
+        logger.warning(f"Max number of buckets reached for aggregation key: {self.category.agg_key}.")
+        raise ElasticsearchConnectionException(
+            "Current filters return too many unique items. Narrow filters to return results."
+        )
+
     def query_elasticsearch_for_prime_awards(self, filter_query: ES_Q) -> list:
         search = self.build_elasticsearch_search_with_aggregations(filter_query)
         if search is None:
             return []
-        response = search.handle_execute()
-        results = self.build_elasticsearch_result(response.aggs.to_dict())
+        response = search.handle_execute().aggs.to_dict()
+        if self.combine_bucket_count_query and self.category.name not in self.high_cardinality_categories:
+            bucket_count = get_unique_terms_from_response(response)
+            if bucket_count == 0:
+                return []
+            if bucket_count + SHARD_SIZE_BUFFER > MAX_BUCKETS:
+                self._raise_too_many_buckets()
+        results = self.build_elasticsearch_result(response)
         return results
 
     @abstractmethod
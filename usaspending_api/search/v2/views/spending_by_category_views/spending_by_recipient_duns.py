@@ -2,11 +2,9 @@ import json
 from decimal import Decimal
 from typing import List
 
-from django.db.models import QuerySet, F, Case, When, Value, IntegerField
+from django.db.models import QuerySet, F
 
-from usaspending_api.common.recipient_lookups import combine_recipient_hash_and_level
-from usaspending_api.recipient.models import RecipientProfile
-from usaspending_api.recipient.v2.lookups import SPECIAL_CASES
+from usaspending_api.common.recipient_lookups import fetch_recipient_ids
 from usaspending_api.search.v2.views.spending_by_category_views.spending_by_category import (
     Category,
     AbstractSpendingByCategoryViewSet,
@@ -22,44 +20,6 @@ class RecipientDunsViewSet(AbstractSpendingByCategoryViewSet):
 
     category = Category(name="recipient_duns", agg_key="recipient_agg_key")
 
-    @staticmethod
-    def _get_recipient_id(row: list) -> str:
-        """
-        In the recipient_profile table there is a 1 to 1 relationship between hashes and DUNS
-        (recipient_unique_id) and the hashes+duns match exactly between recipient_profile and
-        recipient_lookup where there are matches.  Grab the level from recipient_profile by
-        hash if we have one or by DUNS if we have one of those.
-        """
-        if "recipient_hash" in row:
-            profile_filter = {"recipient_hash": row["recipient_hash"]}
-        elif "recipient_unique_id" in row:
-            profile_filter = {"recipient_unique_id": row["recipient_unique_id"]}
-        else:
-            raise RuntimeError(
-                "Attempted to lookup recipient profile using a queryset that contains neither "
-                "'recipient_hash' nor 'recipient_unique_id'"
-            )
-
-        profile = (
-            RecipientProfile.objects.filter(**profile_filter)
-            .exclude(recipient_name__in=SPECIAL_CASES)
-            .annotate(
-                sort_order=Case(
-                    When(recipient_level="C", then=Value(0)),
-                    When(recipient_level="R", then=Value(1)),
-                    default=Value(2),
-                    output_field=IntegerField(),
-                )
-            )
-            .values("recipient_hash", "recipient_level")
-            .order_by("sort_order")
-            .first()
-        )
-
-        return (
-            combine_recipient_hash_and_level(profile["recipient_hash"], profile["recipient_level"]) if profile else None
-        )
-
     def build_elasticsearch_result(self, response: dict) -> List[dict]:
         results = []
         location_info_buckets = response.get("group_by_agg_key", {}).get("buckets", [])
@@ -86,8 +46,12 @@ class RecipientDunsViewSet(AbstractSpendingByCategoryViewSet):
         upper_limit = self.pagination.upper_limit
         query_results = list(queryset[lower_limit:upper_limit])
 
+        # Resolve the whole page of recipients at once instead of querying recipient_profile for each row
+        recipient_ids = fetch_recipient_ids(
+            "recipient_unique_id", (row["recipient_unique_id"] for row in query_results)
+        )
         for row in query_results:
-            row["recipient_id"] = self._get_recipient_id(row)
+            row["recipient_id"] = recipient_ids.get(row["recipient_unique_id"])
 
             for key in django_values:
                 del row[key]
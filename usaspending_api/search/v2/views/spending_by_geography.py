@@ -1,4 +1,3 @@
-import copy
 import json
 import logging
 
@@ -22,7 +21,7 @@ from usaspending_api.common.elasticsearch.search_wrappers import TransactionSear
 from usaspending_api.common.helpers.generic_helper import get_generic_filters_message
 from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.common.validator.award_filter import AWARD_FILTER
-from usaspending_api.common.validator.tinyshield import TinyShield
+from usaspending_api.common.validator.tinyshield import CompiledTinyShield
 from usaspending_api.references.abbreviations import code_to_state, fips_to_code, pad_codes
 from usaspending_api.references.models import PopCounty, PopCongressionalDistrict
 from usaspending_api.search.models import SubawardView
@@ -35,6 +34,35 @@ logger = logging.getLogger(__name__)
 API_VERSION = settings.API_VERSION
 
 
+SPENDING_BY_GEOGRAPHY_VALIDATOR = CompiledTinyShield(
+    [
+        {"name": "subawards", "key": "subawards", "type": "boolean", "default": False},
+        {
+            "name": "scope",
+            "key": "scope",
+            "type": "enum",
+            "optional": False,
+            "enum_values": ["place_of_performance", "recipient_location"],
+        },
+        {
+            "name": "geo_layer",
+            "key": "geo_layer",
+            "type": "enum",
+            "optional": False,
+            "enum_values": ["state", "county", "district"],
+        },
+        {
+            "name": "geo_layer_filters",
+            "key": "geo_layer_filters",
+            "type": "array",
+            "array_type": "text",
+            "text_type": "search",
+        },
+    ]
+    + AWARD_FILTER
+)
+
+
 class GeoLayer(Enum):
     COUNTY = "county"
     DISTRICT = "district"
@@ -48,6 +76,7 @@ class SpendingByGeographyVisualizationViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/search/spending_by_geography.md"
+    request_validator = SPENDING_BY_GEOGRAPHY_VALIDATOR
 
     agg_key: Optional[str]
     filters: dict
@@ -63,33 +92,8 @@ class SpendingByGeographyVisualizationViewSet(APIView):
 
     @cache_response()
     def post(self, request: Request) -> Response:
-        models = [
-            {"name": "subawards", "key": "subawards", "type": "boolean", "default": False},
-            {
-                "name": "scope",
-                "key": "scope",
-                "type": "enum",
-                "optional": False,
-                "enum_values": ["place_of_performance", "recipient_location"],
-            },
-            {
-                "name": "geo_layer",
-                "key": "geo_layer",
-                "type": "enum",
-                "optional": False,
-                "enum_values": ["state", "county", "district"],
-            },
-            {
-                "name": "geo_layer_filters",
-                "key": "geo_layer_filters",
-                "type": "array",
-                "array_type": "text",
-                "text_type": "search",
-            },
-        ]
-        models.extend(copy.deepcopy(AWARD_FILTER))
         original_filters = request.data.get("filters")
-        json_request = TinyShield(models).block(request.data)
+        json_request = self.request_validator.block(request.data)
 
         agg_key_dict = {
             "county": "county_agg_key",
@@ -1,4 +1,3 @@
-import copy
 import logging
 
 from calendar import monthrange
@@ -32,7 +31,7 @@ from usaspending_api.common.helpers.orm_helpers import FiscalMonth, FiscalQuarte
 from usaspending_api.common.query_with_filters import QueryWithFilters
 from usaspending_api.common.validator.award_filter import AWARD_FILTER
 from usaspending_api.common.validator.pagination import PAGINATION
-from usaspending_api.common.validator.tinyshield import TinyShield
+from usaspending_api.common.validator.tinyshield import CompiledTinyShield
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +45,22 @@ GROUPING_LOOKUP = {
     "m": "month",
 }
 
+SPENDING_OVER_TIME_VALIDATOR = CompiledTinyShield(
+    [
+        {"name": "subawards", "key": "subawards", "type": "boolean", "default": False},
+        {
+            "name": "group",
+            "key": "group",
+            "type": "enum",
+            "enum_values": list(GROUPING_LOOKUP.keys()),
+            "default": "fy",
+            "optional": False,  # allow to be optional in the future
+        },
+    ]
+    + AWARD_FILTER
+    + PAGINATION
+)
+
 
 @api_transformations(api_version=API_VERSION, function_list=API_TRANSFORM_FUNCTIONS)
 class SpendingOverTimeVisualizationViewSet(APIView):
@@ -54,23 +69,11 @@ class SpendingOverTimeVisualizationViewSet(APIView):
     """
 
     endpoint_doc = "usaspending_api/api_contracts/contracts/v2/search/spending_over_time.md"
+    request_validator = SPENDING_OVER_TIME_VALIDATOR
 
     @staticmethod
     def validate_request_data(json_data: dict) -> dict:
-        models = [
-            {"name": "subawards", "key": "subawards", "type": "boolean", "default": False},
-            {
-                "name": "group",
-                "key": "group",
-                "type": "enum",
-                "enum_values": list(GROUPING_LOOKUP.keys()),
-                "default": "fy",
-                "optional": False,  # allow to be optional in the future
-            },
-        ]
-        models.extend(copy.deepcopy(AWARD_FILTER))
-        models.extend(copy.deepcopy(PAGINATION))
-        validated_data = TinyShield(models).block(json_data)
+        validated_data = SPENDING_OVER_TIME_VALIDATOR.block(json_data)
 
         if validated_data.get("filters", None) is None:
             raise InvalidParameterException("Missing request parameters: filters")
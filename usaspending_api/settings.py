@@ -18,9 +18,19 @@ REPO_DIR = APP_DIR.parent
 # Row-limited download limit
 MAX_DOWNLOAD_LIMIT = 500000
 
+# Number of Elasticsearch partitions of matching IDs requested at once when building a keyword download
+DOWNLOAD_ID_PARTITION_WORKERS = int(os.environ.get("DOWNLOAD_ID_PARTITION_WORKERS", 4))
+
 # Timeout limit for streaming downloads
 DOWNLOAD_TIMEOUT_MIN_LIMIT = 10
 
+# Number of download files generated at once by a single bulk download job, and by all jobs on the same host
+DOWNLOAD_SOURCE_CONCURRENCY = int(os.environ.get("DOWNLOAD_SOURCE_CONCURRENCY", 4))
+DOWNLOAD_HOST_SOURCE_CONCURRENCY = int(os.environ.get("DOWNLOAD_HOST_SOURCE_CONCURRENCY", 8))
+
+# Number of S3 deletion files fetched at once when appending deletion records to monthly delta files
+DELTA_DELETION_FILE_WORKERS = int(os.environ.get("DELTA_DELETION_FILE_WORKERS", 8))
+
 # Default timeout for SQL statements in Django
 DEFAULT_DB_TIMEOUT_IN_SECONDS = int(os.environ.get("DEFAULT_DB_TIMEOUT_IN_SECONDS", 0))
 CONNECTION_MAX_SECONDS = 10
@@ -124,6 +134,12 @@ ES_AWARDS_NAME_SUFFIX = "awards"
 ES_AWARDS_QUERY_ALIAS_PREFIX = "award-query"
 ES_AWARDS_WRITE_ALIAS = "award-load-alias"
 ES_TIMEOUT = 90
+# Connections kept open per Elasticsearch node by the client each process shares, and how it discovers nodes
+ES_MAX_CONNECTIONS = int(os.environ.get("ES_MAX_CONNECTIONS", 10))
+ES_KEEP_ALIVE = os.environ.get("ES_KEEP_ALIVE", "").lower() not in ["false", "0", "no"]
+ES_SNIFF_ON_START = os.environ.get("ES_SNIFF_ON_START", "").lower() in ["true", "1", "yes"]
+ES_SNIFF_ON_CONNECTION_FAIL = os.environ.get("ES_SNIFF_ON_CONNECTION_FAIL", "").lower() in ["true", "1", "yes"]
+ES_SNIFFER_TIMEOUT = int(os.environ["ES_SNIFFER_TIMEOUT"]) if os.environ.get("ES_SNIFFER_TIMEOUT") else None
 ES_REPOSITORY = ""
 ES_ROUTING_FIELD = "recipient_agg_key"
 
@@ -194,6 +210,7 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "simple_history.middleware.HistoryRequestMiddleware",
+    "usaspending_api.routers.replicas.ReadReplicaPinningMiddleware",
     "usaspending_api.common.logging.LoggingMiddleware",
 ]
 
@@ -243,7 +260,7 @@ def _configure_database_connection(environment_variable):
 # (which is "DATABASE_URL" by default). Generally speaking, DB_SOURCE is used to support server
 # environments that support the API/website and docker-compose local setup whereas DATABASE_URL
 # is used for development and operational environments (Jenkins primarily). If DB_SOURCE is provided,
-# then DB_R1 (read replica) must also be provided.
+# then DB_R1 (read replica) must also be provided.  Further read replicas can be added as DB_R2, DB_R3, etc.
 if os.environ.get("DB_SOURCE"):
     if not os.environ.get("DB_R1"):
         raise EnvironmentError("DB_SOURCE environment variable defined without DB_R1")
@@ -251,6 +268,10 @@ if os.environ.get("DB_SOURCE"):
         DEFAULT_DB_ALIAS: _configure_database_connection("DB_SOURCE"),
         "db_r1": _configure_database_connection("DB_R1"),
     }
+    replica_number = 2
+    while os.environ.get(f"DB_R{replica_number}"):
+        DATABASES[f"db_r{replica_number}"] = _configure_database_connection(f"DB_R{replica_number}")
+        replica_number += 1
     DATABASE_ROUTERS = ["usaspending_api.routers.replicas.ReadReplicaRouter"]
 elif os.environ.get(dj_database_url.DEFAULT_ENV):
     DATABASES = {DEFAULT_DB_ALIAS: _configure_database_connection(dj_database_url.DEFAULT_ENV)}
@@ -395,6 +416,24 @@ CACHE_ENVIRONMENTS = {
 # Set the usaspending-cache to whatever our environment cache dictates
 CACHES["usaspending-cache"] = CACHE_ENVIRONMENTS[CACHE_ENVIRONMENT]
 
+# In-process tier checked before usaspending-cache by cached API views; set max entries to 0 to turn it off
+LOCAL_RESPONSE_CACHE_MAX_ENTRIES = int(os.environ.get("LOCAL_RESPONSE_CACHE_MAX_ENTRIES", 500))
+LOCAL_RESPONSE_CACHE_MAX_BYTES = int(os.environ.get("LOCAL_RESPONSE_CACHE_MAX_BYTES", 64 * 1024 * 1024))
+LOCAL_RESPONSE_CACHE_TTL = int(os.environ.get("LOCAL_RESPONSE_CACHE_TTL", 300))
+# How often each process logs the local tier's hits, misses and evictions; 0 to never log them
+LOCAL_RESPONSE_CACHE_STATS_LOG_SECONDS = int(os.environ.get("LOCAL_RESPONSE_CACHE_STATS_LOG_SECONDS", 300))
+
+# Process-local caches of data that only changes with a load (see common/data_load_cache.py)
+DATA_LOAD_CACHE_CHECK_SECONDS = int(os.environ.get("DATA_LOAD_CACHE_CHECK_SECONDS", 60))
+DATA_LOAD_CACHE_MAX_AGE_SECONDS = int(os.environ.get("DATA_LOAD_CACHE_MAX_AGE_SECONDS", 3600))
+
+# Read replicas further behind than this are not read from (see routers/replicas.py); set check seconds to 0 to stop
+# sampling replication lag and read from every replica
+DB_REPLICA_MAX_LAG_SECONDS = int(os.environ.get("DB_REPLICA_MAX_LAG_SECONDS", 300))
+DB_REPLICA_LAG_CHECK_SECONDS = int(os.environ.get("DB_REPLICA_LAG_CHECK_SECONDS", 15))
+# How often each process logs how many reads it has routed to each database; 0 to never log them
+DB_REPLICA_STATS_LOG_SECONDS = int(os.environ.get("DB_REPLICA_STATS_LOG_SECONDS", 300))
+
 # DRF extensions
 REST_FRAMEWORK_EXTENSIONS = {
     # Not caching errors, these are logged to exceptions.log